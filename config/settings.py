@@ -5,6 +5,7 @@ load_dotenv()
 
 DATABASE = {
     "driver": "postgresql",
+    "async_driver": os.getenv("DB_ASYNC_DRIVER", "postgresql+asyncpg"),
     "admin_user": os.getenv("ADMIN_USER"),
     "admin_password": os.getenv("ADMIN_PASSWORD"),
     "user": os.getenv("DB_USER"),
@@ -19,5 +20,58 @@ def get_database_url():
     return f"{DATABASE['driver']}://{DATABASE['user']}:{DATABASE['password']}@{DATABASE['host']}:{DATABASE['port']}/{DATABASE['database']}"
 
 
+def get_async_database_url():
+    """Même base que get_database_url, via un pilote asynchrone (asyncpg)."""
+    return f"{DATABASE['async_driver']}://{DATABASE['user']}:{DATABASE['password']}@{DATABASE['host']}:{DATABASE['port']}/{DATABASE['database']}"
+
+
+def get_replica_urls() -> list[str]:
+    """URLs des réplicas en lecture seule (DB_REPLICA_URLS, séparées par des virgules)."""
+    raw = os.getenv("DB_REPLICA_URLS", "")
+    return [url.strip() for url in raw.split(",") if url.strip()]
+
+
 def get_admin_url():
     return f"{DATABASE['driver']}://{DATABASE['admin_user']}:{DATABASE['admin_password']}@{DATABASE['host']}:{DATABASE['port']}/postgres"
+
+
+# Garde-fous : plafond de lignes par requête, taille de page par défaut,
+# nombre de lignes par INSERT/UPDATE groupé
+QUERY_LIMITS = {
+    "max_rows": int(os.getenv("MAX_ROWS_PER_QUERY", "1000")),
+    "page_size": int(os.getenv("DEFAULT_PAGE_SIZE", "50")),
+    "batch_size": int(os.getenv("WRITE_BATCH_SIZE", "1000")),
+}
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+# Pool de connexions du moteur principal (cf. crm/database.py)
+DB_POOL = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    # Recycle les connexions avant les coupures côté serveur / pare-feu (s)
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    # Vérifie la connexion à l'emprunt (connexion morte remplacée sans erreur)
+    "pool_pre_ping": _env_flag("DB_POOL_PRE_PING", "true"),
+}
+
+# Lectures routées vers les réplicas : après une écriture, la session reste
+# sur le primaire le temps que les réplicas rattrapent leur retard (s)
+READ_REPLICAS = {
+    "urls": get_replica_urls(),
+    "sticky_seconds": float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5")),
+}
+
+# Cache processus de User / Role (cf. crm/crud/entity_cache.py) :
+# nombre d'entrées max (LRU) et durée de vie d'une entrée (s, 0 = désactivé)
+ENTITY_CACHE = {
+    "max_entries": int(os.getenv("ENTITY_CACHE_SIZE", "1024")),
+    "ttl_seconds": float(os.getenv("ENTITY_CACHE_TTL", "60")),
+}
+
+# Sérialiseurs : rejoue les validations d'écriture à la lecture (audit)
+SERIALIZER_STRICT = _env_flag("SERIALIZER_STRICT", "false")
@@ -3,7 +3,6 @@ import jwt
 from datetime import datetime, timezone
 from ..models.user import User
 from sqlalchemy.orm import Session
-from argon2 import PasswordHasher
 from jwt import decode, ExpiredSignatureError, InvalidTokenError
 from typing import Optional, Tuple
 from .config import (
@@ -15,30 +14,40 @@ from .config import (
 )
 from uuid import uuid4
 
-from .jti_manager import JTIManager
-
-jti_store = JTIManager()
+from .hasher import PASSWORD_HASHER
+from .jti_manager import get_jti_store
+from .throttle import current_source, get_login_throttle
 
 
 class Authentication:
-    ph = PasswordHasher(
-        time_cost=3,  # nombre d'itérations
-        memory_cost=65536,  # mémoire utilisée en KB (64MB ici)
-        parallelism=4,  # threads
-    )
-
     @staticmethod
     def hasher(password: str) -> str:
-        return Authentication.ph.hash(password)
+        return PASSWORD_HASHER.hash(password)
 
     @staticmethod
-    def authenticate_user(username: str, password: str, db: Session) -> dict[str, str]:
+    def authenticate_user(
+        username: str, password: str, db: Session, source: Optional[str] = None
+    ) -> dict[str, str]:
+        # Trop d'échecs récents : refus avant toute requête ou calcul argon2
+        throttle = get_login_throttle()
+        source = source or current_source()
+        throttle.check(username, source)
+
         user = db.query(User).filter_by(username=username).first()
         if not user:
+            # Même coût qu'un mot de passe faux : le nom inconnu ne se devine pas
+            PASSWORD_HASHER.verify_dummy(password)
+            throttle.record_failure(username, source)
             raise ValueError("Nom d'utilisateur ou mot de passe incorrect")
 
         if not Authentication.verify_password(password, str(user.password_hash)):
+            throttle.record_failure(username, source)
             raise ValueError("Nom d'utilisateur ou mot de passe incorrect")
+        throttle.record_success(username, source)
+
+        # Hachage aux anciens paramètres : remplacé tant que le clair est connu
+        if PASSWORD_HASHER.needs_rehash(str(user.password_hash)):
+            Authentication._rehash(user, password, db)
 
         user_id = user.id
         access_token = Authentication.generate_access_token(user_id)  # type: ignore
@@ -86,7 +95,7 @@ class Authentication:
         # 2) Révoquer l'ancien refresh JTI (anti-réutilisation)
         old_jti = payload.get("jti")
         if old_jti:
-            jti_store.revoke(old_jti)  # utilise le jti_store module-level
+            get_jti_store().revoke(old_jti)
 
         # 3) Générer les nouveaux tokens (rotation du refresh)
         user_id = int(payload["sub"])
@@ -101,10 +110,9 @@ class Authentication:
             new_refresh_token, JWT_SECRET, algorithms=[JWT_ALGORITHM]
         )
 
-        if j := new_access_payload.get("jti"):
-            jti_store.add(j)
-        if j := new_refresh_payload.get("jti"):
-            jti_store.add(j)
+        jti_store = get_jti_store()
+        jti_store.add_payload(new_access_payload)
+        jti_store.add_payload(new_refresh_payload)
 
         # 5) Sauvegarder les deux tokens localement (JSON)
         Authentication.save_tokens(new_access_token, new_refresh_token)
@@ -121,7 +129,7 @@ class Authentication:
         try:
             payload = decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
             jti = payload.get("jti")
-            if not jti or not jti_store.is_valid(jti):
+            if not jti or not get_jti_store().is_valid(jti):
                 raise ValueError("Token has been revoked")
 
             return payload
@@ -151,11 +159,16 @@ class Authentication:
     @staticmethod
     def verify_password(raw_password: str, hashed_password: str) -> bool:
         """Vérifie si le mot de passe brut correspond au mot de passe haché."""
+        return PASSWORD_HASHER.verify(hashed_password, raw_password)
+
+    @staticmethod
+    def _rehash(user: User, raw_password: str, db: Session) -> None:
+        """Met à jour le hachage ; un échec n'empêche pas la connexion."""
         try:
-            hash_value = str(hashed_password) if hashed_password is not None else ""
-            return Authentication.ph.verify(hash_value, raw_password)
+            user.password_hash = PASSWORD_HASHER.hash(raw_password)
+            db.commit()
         except Exception:
-            return False
+            db.rollback()
 
     @staticmethod
     def save_tokens(access_token: str, refresh_token: str) -> None:
@@ -202,17 +215,17 @@ class Authentication:
     def register_tokens_jti(
         access_token: str, refresh_token: Optional[str] = None
     ) -> None:
-        store = JTIManager()
+        jti_store = get_jti_store()
         try:
-            p = Authentication.verify_token_without_jti(access_token)
-            if j := p.get("jti"):
-                store.add(j)
+            jti_store.add_payload(
+                Authentication.verify_token_without_jti(access_token)
+            )
         except Exception:
             pass
         if refresh_token:
             try:
-                p = Authentication.verify_token_without_jti(refresh_token)
-                if j := p.get("jti"):
-                    store.add(j)
+                jti_store.add_payload(
+                    Authentication.verify_token_without_jti(refresh_token)
+                )
             except Exception:
                 pass
@@ -0,0 +1,94 @@
+"""
+ROLE_RULES compilée au chargement en masques de bits.
+
+Un bit par couple (ressource, Crud) ; la ressource "*" (admin) a ses propres
+bits, testés en même temps que ceux de la ressource demandée. Un rôle est un
+entier (OU de ses bits), un utilisateur le OU de ses rôles : une vérification
+de droit devient `capacités & masque_demandé`.
+
+Les capacités d'un utilisateur sont mémorisées avec la génération des rôles,
+incrémentée à chaque écriture de Role / UserRole (cf. crud.entity_cache) :
+renommer un rôle ou réaffecter un lien rend les masques existants périmés.
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Set
+
+from .permission_config import Crud, ROLE_RULES
+
+WILDCARD = "*"
+
+
+class CapabilityRegistry:
+    """Masques figés à la construction (vues en lecture seule)."""
+
+    __slots__ = ("_resources", "_role_masks", "_queries")
+
+    def __init__(self, rules: Mapping[str, Mapping[str, Set[Crud]]]):
+        resources = {
+            resource for by_resource in rules.values() for resource in by_resource
+        }
+        ordered = [WILDCARD] + sorted(resources - {WILDCARD})
+        self._resources = MappingProxyType(
+            {resource: index for index, resource in enumerate(ordered)}
+        )
+
+        masks: Dict[str, int] = {}
+        for role, by_resource in rules.items():
+            mask = 0
+            for resource, ops in by_resource.items():
+                for op in ops:
+                    mask |= self.bit(resource, op)
+            masks[role.lower()] = mask
+        self._role_masks = MappingProxyType(masks)
+
+        # Masque testé par (ressource, op) : bit de la ressource + bit "*"
+        self._queries = MappingProxyType(
+            {
+                (resource, op): self.bit(WILDCARD, op) | self.bit(resource, op)
+                for resource in ordered
+                for op in Crud
+            }
+        )
+
+    def bit(self, resource: str, op: Crud) -> int:
+        index = self._resources.get(resource)
+        if index is None:
+            return 0
+        return 1 << (index * len(Crud) + op.value - 1)
+
+    def query_mask(self, resource: str, op: Crud) -> int:
+        mask = self._queries.get((resource, op))
+        if mask is None:
+            # Ressource absente des règles : seuls les droits "*" s'appliquent
+            return self._queries.get((WILDCARD, op), 0)
+        return mask
+
+    def role_mask(self, role_name: str) -> int:
+        return self._role_masks.get(role_name.lower(), 0)
+
+    def mask_for_roles(self, role_names: Iterable[str]) -> int:
+        mask = 0
+        for name in role_names:
+            mask |= self.role_mask(name)
+        return mask
+
+
+CAPABILITIES = CapabilityRegistry(ROLE_RULES)
+
+
+# ---------- Génération des rôles ----------
+_generation_lock = threading.Lock()
+_role_generation = 0
+
+
+def role_generation() -> int:
+    return _role_generation
+
+
+def bump_role_generation() -> None:
+    """Un Role ou un UserRole a été écrit : les capacités mémorisées expirent."""
+    global _role_generation
+    with _generation_lock:
+        _role_generation += 1
@@ -29,3 +29,37 @@ JWT_REFRESH_TOKEN_EXPIRES = parse_duration(
 )
 
 TOKEN_PATH = Path.home() / ".epicevents_token"
+
+# Fichiers locaux de l'application : jamais dans le répertoire courant
+APP_DATA_DIR = Path(os.getenv("CRM_DATA_DIR", Path.home() / ".epicevents"))
+
+
+def data_path(value: str) -> Path:
+    """Chemin relatif résolu dans APP_DATA_DIR (un chemin absolu est gardé)."""
+    return APP_DATA_DIR / Path(value).expanduser()
+
+
+# Magasin des JTI valides (cf. crm/auth/jti_manager.py)
+JTI_STORE_BACKEND = os.getenv("JTI_STORE_BACKEND", "sqlite")
+JTI_STORE_PATH = data_path(os.getenv("JTI_STORE_PATH", "valid_jtis.db"))
+
+# Hachage argon2 des mots de passe (cf. crm/auth/hasher.py et `calibrate`)
+ARGON2 = {
+    "time_cost": int(os.getenv("ARGON2_TIME_COST", "3")),  # itérations
+    "memory_cost": int(os.getenv("ARGON2_MEMORY_COST", "65536")),  # en KiB
+    "parallelism": int(os.getenv("ARGON2_PARALLELISM", "4")),  # threads
+}
+# Hachages simultanés max : la mémoire est bornée à ce nombre × memory_cost
+ARGON2_MAX_CONCURRENCY = int(os.getenv("ARGON2_MAX_CONCURRENCY", "2"))
+
+# Limitation des échecs de connexion (cf. crm/auth/throttle.py) : fenêtre
+# glissante, échecs tolérés par utilisateur / par poste, puis attente doublée
+# à chaque nouvel échec (de base_delay à max_delay secondes)
+LOGIN_THROTTLE = {
+    "path": data_path(os.getenv("LOGIN_THROTTLE_PATH", "login_attempts.db")),
+    "window_seconds": float(os.getenv("LOGIN_THROTTLE_WINDOW", "900")),
+    "max_per_user": int(os.getenv("LOGIN_THROTTLE_MAX_PER_USER", "5")),
+    "max_per_source": int(os.getenv("LOGIN_THROTTLE_MAX_PER_SOURCE", "20")),
+    "base_delay": float(os.getenv("LOGIN_THROTTLE_BASE_DELAY", "1")),
+    "max_delay": float(os.getenv("LOGIN_THROTTLE_MAX_DELAY", "900")),
+}
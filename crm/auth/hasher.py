@@ -0,0 +1,131 @@
+"""
+Service unique de hachage argon2 des mots de passe.
+
+Paramètres : ARGON2 (crm/auth/config.py), à ajuster à la machine avec la
+commande `calibrate`. Les hachages / vérifications simultanés passent par un
+sémaphore : la mémoire consommée reste bornée à
+ARGON2_MAX_CONCURRENCY × memory_cost, quel que soit le nombre de connexions.
+
+Un hachage produit avec d'anciens paramètres est vérifié normalement ;
+`needs_rehash` permet de le remplacer à la connexion suivante.
+"""
+
+import secrets
+import statistics
+import threading
+import time
+from typing import Dict, Optional
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from .config import ARGON2, ARGON2_MAX_CONCURRENCY
+
+# Plancher mémoire recommandé (OWASP) : 19 MiB
+MIN_MEMORY_COST = 19 * 1024
+
+
+class PasswordHasherService:
+    """PasswordHasher argon2 partagé, à concurrence bornée."""
+
+    def __init__(
+        self,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int,
+        max_concurrency: int = 1,
+    ):
+        self._hasher = PasswordHasher(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._dummy_hash: Optional[str] = None
+
+    @property
+    def parameters(self) -> Dict[str, int]:
+        return {
+            "time_cost": self._hasher.time_cost,
+            "memory_cost": self._hasher.memory_cost,
+            "parallelism": self._hasher.parallelism,
+        }
+
+    def hash(self, password: str) -> str:
+        with self._slots:
+            return self._hasher.hash(password)
+
+    def verify(self, password_hash: Optional[str], password: str) -> bool:
+        """True si le mot de passe correspond ; False pour tout hachage invalide."""
+        with self._slots:
+            try:
+                return self._hasher.verify(str(password_hash or ""), password)
+            except (VerificationError, InvalidHashError):
+                return False
+
+    def verify_dummy(self, password: str) -> bool:
+        """
+        Vérification au même coût qu'une vraie, pour un utilisateur inconnu :
+        la durée de réponse ne révèle pas si le nom existe. Toujours False.
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = self.hash(secrets.token_urlsafe(32))
+        self.verify(self._dummy_hash, password)
+        return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Hachage produit avec d'autres paramètres que les paramètres courants."""
+        try:
+            return self._hasher.check_needs_rehash(password_hash)
+        except InvalidHashError:
+            return True
+
+
+PASSWORD_HASHER = PasswordHasherService(
+    max_concurrency=ARGON2_MAX_CONCURRENCY, **ARGON2
+)
+
+
+# ---------- Calibration ----------
+def measure(
+    time_cost: int, memory_cost: int, parallelism: int, rounds: int = 3
+) -> float:
+    """Durée médiane (ms) d'un hachage avec ces paramètres."""
+    hasher = PasswordHasher(
+        time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+    )
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        hasher.hash("calibration")
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def calibrate(
+    target_ms: float,
+    memory_cost: int = ARGON2["memory_cost"],
+    parallelism: int = ARGON2["parallelism"],
+    max_time_cost: int = 20,
+) -> Dict[str, float]:
+    """
+    Paramètres les plus coûteux dont le hachage tient dans `target_ms` :
+    mémoire réduite (jusqu'au plancher) si une seule itération dépasse déjà
+    la cible, puis itérations augmentées tant que la cible est respectée.
+    """
+    elapsed = measure(1, memory_cost, parallelism)
+    while elapsed > target_ms and memory_cost // 2 >= MIN_MEMORY_COST:
+        memory_cost //= 2
+        elapsed = measure(1, memory_cost, parallelism)
+
+    time_cost = 1
+    while time_cost < max_time_cost:
+        candidate = measure(time_cost + 1, memory_cost, parallelism)
+        if candidate > target_ms:
+            break
+        time_cost, elapsed = time_cost + 1, candidate
+
+    return {
+        "time_cost": time_cost,
+        "memory_cost": memory_cost,
+        "parallelism": parallelism,
+        "elapsed_ms": round(elapsed, 1),
+    }
@@ -1,52 +1,190 @@
-import json
+"""
+Magasin des JWT ID (jti) valides : liste blanche indexée, avec expiration.
+
+Chaque jeton émis est enregistré avec son utilisateur et son `exp` :
+- vérifier un jeton = une lecture par clé primaire, quel que soit l'historique ;
+- révoquer toutes les sessions d'un utilisateur = un DELETE sur l'index user_id ;
+- les JTI expirés sont purgés à chaque enregistrement (index sur expires_at).
+
+Backends : "sqlite" (fichier local, journal WAL : écritures atomiques et
+concurrentes entre processus). Un autre backend (table de la base CRM...)
+se branche en sous-classant JTIStore et en l'ajoutant à BACKENDS.
+"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Set
+from typing import Any, Dict, Hashable, Optional, Type
+
+from .config import JTI_STORE_BACKEND, JTI_STORE_PATH
 
 
-class JTIManager:
-    """
-    Gère les JWT ID (jti) valides pour autoriser ou révoquer des tokens manuellement.
-    """
+class JTIStore(ABC):
+    """Interface commune des magasins de JTI."""
 
-    def __init__(self, storage_path: Optional[Path] = None):
+    @abstractmethod
+    def add(
+        self,
+        jti: str,
+        user_id: Optional[int] = None,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        """Autorise un JTI (sans `expires_at` : jusqu'à révocation)."""
+
+    @abstractmethod
+    def revoke(self, jti: str) -> None:
+        pass
+
+    @abstractmethod
+    def revoke_user(self, user_id: int) -> int:
+        """Révoque toutes les sessions d'un utilisateur ; retourne leur nombre."""
+
+    @abstractmethod
+    def is_valid(self, jti: str) -> bool:
+        pass
+
+    @abstractmethod
+    def prune(self) -> int:
+        """Supprime les JTI expirés ; retourne leur nombre."""
+
+    @abstractmethod
+    def clear_all(self) -> None:
+        pass
+
+    @abstractmethod
+    def generation(self) -> Hashable:
         """
-        Initialise le gestionnaire avec un fichier de stockage JSON.
+        Valeur qui change dès que la liste peut avoir perdu un JTI
+        (révocation ici ou dans un autre processus).
         """
-        self.storage_path = storage_path or Path("valid_jtis.json")
-
-        # Crée le fichier s'il n'existe pas
-        if not self.storage_path.exists():
-            self._save_jtis(set())
-
-    def _load_jtis(self) -> Set[str]:
-        try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                return set(json.load(f))
-        except (json.JSONDecodeError, FileNotFoundError):
-            return set()
-
-    def _save_jtis(self, jtis: Set[str]):
-        with open(self.storage_path, "w", encoding="utf-8") as f:
-            json.dump(list(jtis), f, indent=2)
-
-    def add(self, jti: str):
-        jtis = self._load_jtis()
-        jtis.add(jti)
-        self._save_jtis(jtis)
-
-    def revoke(self, jti: str):
-        jtis = self._load_jtis()
-        jtis.discard(jti)
-        self._save_jtis(jtis)
-
-    def revoke_refresh_jti(self, jti: str):
+
+    def add_payload(self, payload: Dict[str, Any]) -> None:
+        """Autorise le JTI d'un payload décodé, avec son `sub` et son `exp`."""
+        jti = payload.get("jti")
+        if not jti:
+            return
+        sub = payload.get("sub")
+        self.add(
+            jti,
+            user_id=int(sub) if sub is not None else None,
+            expires_at=payload.get("exp"),
+        )
+
+    def revoke_refresh_jti(self, jti: str) -> None:
         """
         Révoque un token de rafraîchissement en supprimant son jti.
         """
         self.revoke(jti)
 
+
+class SQLiteJTIStore(JTIStore):
+    """JTI dans un fichier SQLite : une connexion par magasin, sous verrou."""
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS jti ("
+        " jti TEXT PRIMARY KEY, user_id INTEGER, expires_at REAL"
+        ") WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS ix_jti_user_id ON jti (user_id)",
+        "CREATE INDEX IF NOT EXISTS ix_jti_expires_at ON jti (expires_at)",
+    )
+
+    def __init__(self, storage_path: Optional[Path] = None, clock=time.time):
+        self.storage_path = Path(storage_path or JTI_STORE_PATH)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Révocations faites par ce magasin (invisibles pour data_version)
+        self._revocations = 0
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit : chaque écriture est sa propre transaction atomique
+        self._conn = sqlite3.connect(
+            self.storage_path,
+            timeout=5.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                self._conn.execute(statement)
+
+    def add(
+        self,
+        jti: str,
+        user_id: Optional[int] = None,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM jti WHERE expires_at <= ?", (now,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO jti (jti, user_id, expires_at)"
+                    " VALUES (?, ?, ?)",
+                    (jti, user_id, expires_at),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def revoke(self, jti: str) -> None:
+        self._delete("DELETE FROM jti WHERE jti = ?", (jti,))
+
+    def revoke_user(self, user_id: int) -> int:
+        return self._delete("DELETE FROM jti WHERE user_id = ?", (user_id,))
+
     def is_valid(self, jti: str) -> bool:
-        return jti in self._load_jtis()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM jti WHERE jti = ?"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (jti, self._clock()),
+            ).fetchone()
+        return row is not None
+
+    def prune(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM jti WHERE expires_at <= ?", (self._clock(),)
+            ).rowcount
+
+    def clear_all(self) -> None:
+        self._delete("DELETE FROM jti", ())
+
+    def generation(self) -> Hashable:
+        # data_version change quand une autre connexion a validé une écriture
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return data_version, self._revocations
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, sql: str, params: tuple) -> int:
+        with self._lock:
+            count = self._conn.execute(sql, params).rowcount
+            self._revocations += 1
+        return count
+
+
+BACKENDS: Dict[str, Type[JTIStore]] = {"sqlite": SQLiteJTIStore}
+
+_store: Optional[JTIStore] = None
+_store_lock = threading.Lock()
+
 
-    def clear_all(self):
-        self._save_jtis(set())
+def get_jti_store() -> JTIStore:
+    """Magasin partagé du processus, selon JTI_STORE_BACKEND."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend = BACKENDS.get(JTI_STORE_BACKEND)
+                if backend is None:
+                    raise ValueError(f"Backend de JTI inconnu : {JTI_STORE_BACKEND!r}.")
+                _store = backend()
+    return _store
@@ -1,6 +1,20 @@
 from typing import Optional
 
+from sqlalchemy import event
+
+from .capabilities import CAPABILITIES, role_generation
 from .permission_config import Crud, ROLE_RULES
+from ..models.user import User
+
+# Capacités mémorisées sur l'instance User (hors colonnes mappées), avec la
+# génération des rôles pour laquelle elles ont été calculées
+_CAPABILITIES_KEY = "_capabilities"
+# Opération -> variante restreinte aux lignes dont l'utilisateur est propriétaire
+_OWN_VARIANTS = {
+    Crud.READ: Crud.READ_OWN,
+    Crud.UPDATE: Crud.UPDATE_OWN,
+    Crud.DELETE: Crud.DELETE_OWN,
+}
 
 
 class Permission:
@@ -25,20 +39,31 @@ class Permission:
             role.name.lower() for role in user.roles
         ]  # <-- normalisation en minuscules
 
+    @staticmethod
+    def user_capabilities(user) -> int:
+        """
+        OU des masques des rôles de l'utilisateur, calculé une fois par
+        instance et par génération des rôles (recalculé si sa liste de rôles
+        change, ou après l'écriture d'un Role / UserRole).
+        """
+        mapped = isinstance(user, User)
+        generation = role_generation()
+        if mapped:
+            cached = user.__dict__.get(_CAPABILITIES_KEY)
+            if cached is not None and cached[0] == generation:
+                return cached[1]
+        capabilities = CAPABILITIES.mask_for_roles(Permission.user_roles_list(user))
+        if mapped:
+            user.__dict__[_CAPABILITIES_KEY] = (generation, capabilities)
+        return capabilities
+
     @staticmethod
     def role_allows(user, resource: str, op: Crud) -> bool:
         """Vérifie si le rôle de l'utilisateur permet l'opération sur la ressource."""
-        user_roles_list = Permission.user_roles_list(user)
-        for role in user_roles_list:
-            # Va chercher les règles pour le rôle
-            rules = ROLE_RULES.get(role, {})
-            # Dans le cas d'un "*" (admin par exemple), on autorise directement
-            if op in rules.get("*", set()):
-                return True
-            # Autorise si l'opération est bien dans la liste des règles pour la ressource
-            if op in rules.get(resource, set()):
-                return True
-        return False
+        # Les droits "*" (admin) sont inclus dans le masque demandé
+        return bool(
+            Permission.user_capabilities(user) & CAPABILITIES.query_mask(resource, op)
+        )
 
     @staticmethod
     def is_admin(user) -> bool:
@@ -74,14 +99,10 @@ class Permission:
                 return True
 
         # Vérifie s'il peut en tant qu'owner
-        if owner_id is not None:
-            if user.id == owner_id:
-                if op == Crud.READ:
-                    return Permission.role_allows(user, resource, Crud.READ_OWN)
-                if op == Crud.UPDATE:
-                    return Permission.role_allows(user, resource, Crud.UPDATE_OWN)
-                if op == Crud.DELETE:
-                    return Permission.role_allows(user, resource, Crud.DELETE_OWN)
+        if owner_id is not None and user.id == owner_id:
+            own_op = _OWN_VARIANTS.get(op)
+            if own_op is not None:
+                return Permission.role_allows(user, resource, own_op)
         return False
 
     @staticmethod
@@ -137,6 +158,22 @@ class Permission:
             owner_id=owner_id,
         )
 
+    @staticmethod
+    def owner_scope(user, resource: str, op: Crud = Crud.READ) -> Optional[int]:
+        """
+        Périmètre d'une liste pour l'opération `op`, à appliquer en SQL :
+        None si le rôle couvre toutes les lignes, l'id de l'utilisateur s'il
+        n'a que la variante _OWN, PermissionError sinon.
+        """
+        if Permission.has_permission(user, resource=resource, op=op):
+            return None
+        own_op = _OWN_VARIANTS.get(op)
+        if own_op is not None and Permission.has_permission(
+            user, resource=resource, op=own_op
+        ):
+            return user.id
+        raise PermissionError("Accès refusé.")
+
     @staticmethod
     def update_own_permission(user, resource: str) -> bool:
         return Permission.has_permission(
@@ -152,3 +189,10 @@ class Permission:
             resource=resource,
             op=Crud.DELETE_OWN,
         )
+
+
+@event.listens_for(User.user_roles, "append")
+@event.listens_for(User.user_roles, "remove")
+@event.listens_for(User.user_roles, "bulk_replace")
+def _forget_capabilities(target, *args):
+    target.__dict__.pop(_CAPABILITIES_KEY, None)
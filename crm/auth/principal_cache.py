@@ -0,0 +1,127 @@
+"""
+Principal courant (id de l'utilisateur authentifié) mémorisé pour le processus.
+
+Clé : mtime + empreinte SHA-256 du fichier de tokens, et génération du
+magasin de JTI. Tant que le fichier n'a pas changé (un simple stat), que le
+jeton n'a pas expiré (`exp`) et qu'aucune révocation n'est intervenue, l'id
+est rendu sans relire le fichier, sans décoder le JWT ni relire les JTI.
+L'utilisateur est ensuite résolu par UserCRUD.get_by_id (carte d'identité
+de la session, puis cache d'entités) : pas d'aller-retour SQL non plus.
+
+Invalidation : déconnexion (fichier supprimé), changement de mot de passe
+du principal, révocation d'un JTI (dans ce processus ou un autre).
+"""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import event
+
+from .jti_manager import get_jti_store
+from .config import TOKEN_PATH
+from ..models.user import User
+
+# (mtime du fichier de tokens, génération du magasin de JTI)
+Stamp = Tuple[int, Hashable]
+
+
+@dataclass(frozen=True)
+class _Principal:
+    stamp: Stamp
+    digest: str
+    user_id: int
+    expires_at: float
+
+
+class PrincipalCache:
+    """Une seule entrée : l'utilisateur du fichier de tokens local."""
+
+    def __init__(
+        self,
+        token_path: Path,
+        generation: Callable[[], Hashable],
+        clock: Callable[[], float] = time.time,
+    ):
+        self._token_path = token_path
+        self._generation = generation
+        self._clock = clock
+        self._entry: Optional[_Principal] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def stamp(self) -> Optional[Stamp]:
+        """État courant du fichier de tokens, None s'il n'existe pas."""
+        try:
+            mtime = self._token_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        return mtime, self._generation()
+
+    def lookup(self, stamp: Optional[Stamp]) -> Optional[int]:
+        """Id du principal si l'entrée est encore valable pour `stamp`."""
+        entry = self._entry
+        if stamp is None or entry is None or self._clock() >= entry.expires_at:
+            return self._miss()
+        if entry.stamp != stamp:
+            # Fichier réécrit (ou JTI modifiés) : même contenu, même principal
+            if entry.stamp[1] != stamp[1] or self._digest() != entry.digest:
+                return self._miss()
+            self._entry = replace(entry, stamp=stamp)
+        self.hits += 1
+        return entry.user_id
+
+    def remember(self, stamp: Optional[Stamp], payload: Dict[str, Any]) -> None:
+        """
+        Mémorise le principal d'un jeton vérifié, lu après `stamp`. Ignoré si
+        le fichier a changé entre-temps ou si le jeton n'a pas d'`exp`.
+        """
+        expires_at = payload.get("exp")
+        if stamp is None or not expires_at:
+            return
+        with self._lock:
+            digest = self._digest()
+            if digest is None or self.stamp() != stamp:
+                return
+            self._entry = _Principal(
+                stamp, digest, int(payload["sub"]), float(expires_at)
+            )
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Oublie le principal (seulement s'il s'agit de `user_id`, si fourni)."""
+        with self._lock:
+            entry = self._entry
+            if entry is not None and user_id in (None, entry.user_id):
+                self._entry = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entry = None
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _miss(self) -> None:
+        self.misses += 1
+        return None
+
+    def _digest(self) -> Optional[str]:
+        try:
+            return hashlib.sha256(self._token_path.read_bytes()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+
+# Magasin de JTI ouvert au premier contrôle, pas à l'import
+PRINCIPAL = PrincipalCache(TOKEN_PATH, lambda: get_jti_store().generation())
+
+
+@event.listens_for(User.password_hash, "set")
+def _forget_on_password_change(target, value, oldvalue, initiator):
+    if target.id is not None:
+        PRINCIPAL.invalidate(target.id)
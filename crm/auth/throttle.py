@@ -0,0 +1,148 @@
+"""
+Limitation des échecs de connexion, vérifiée avant tout calcul argon2.
+
+Deux compteurs par tentative : l'utilisateur visé et le poste d'origine,
+chacun sur une fenêtre glissante (fichier SQLite local, partagé par les
+processus). Au-delà du nombre d'échecs toléré, chaque nouvel échec double
+l'attente imposée (plafonnée). Une tentative refusée ne coûte qu'une lecture
+indexée et n'est pas enregistrée : ni hachage, ni croissance de la table,
+purgée des échecs sortis de la fenêtre à chaque écriture.
+"""
+
+import getpass
+import os
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .config import LOGIN_THROTTLE
+from ..errors.exceptions import LoginThrottledError
+
+
+def current_source() -> str:
+    """Poste d'origine : IP du client SSH si présente, sinon compte@machine."""
+    ssh_client = os.getenv("SSH_CLIENT", "").split()
+    if ssh_client:
+        return ssh_client[0]
+    return f"{getpass.getuser()}@{socket.gethostname()}"
+
+
+class LoginThrottle:
+    """Échecs par clé (utilisateur, poste) sur une fenêtre glissante."""
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS login_failures"
+        " (key TEXT NOT NULL, at REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_login_failures_key_at"
+        " ON login_failures (key, at)",
+        "CREATE INDEX IF NOT EXISTS ix_login_failures_at ON login_failures (at)",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        window_seconds: float,
+        max_per_user: int,
+        max_per_source: int,
+        base_delay: float,
+        max_delay: float,
+        clock=time.time,
+    ):
+        self.window_seconds = window_seconds
+        self.max_per_user = max_per_user
+        self.max_per_source = max_per_source
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                self._conn.execute(statement)
+
+    def retry_after(self, username: str, source: str) -> float:
+        """Secondes à attendre avant la prochaine tentative (0 : autorisée)."""
+        now = self._clock()
+        return max(
+            self._wait(_user_key(username), self.max_per_user, now),
+            self._wait(_source_key(source), self.max_per_source, now),
+        )
+
+    def check(self, username: str, source: str) -> None:
+        wait = self.retry_after(username, source)
+        if wait > 0:
+            raise LoginThrottledError(wait)
+
+    def record_failure(self, username: str, source: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM login_failures WHERE at <= ?",
+                    (now - self.window_seconds,),
+                )
+                self._conn.executemany(
+                    "INSERT INTO login_failures (key, at) VALUES (?, ?)",
+                    ((_user_key(username), now), (_source_key(source), now)),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def record_success(self, username: str, source: str) -> None:
+        """Connexion réussie : les échecs de cet utilisateur sont oubliés."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM login_failures WHERE key = ?", (_user_key(username),)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM login_failures")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _wait(self, key: str, limit: int, now: float) -> float:
+        with self._lock:
+            count, last = self._conn.execute(
+                "SELECT COUNT(*), MAX(at) FROM login_failures"
+                " WHERE key = ? AND at > ?",
+                (key, now - self.window_seconds),
+            ).fetchone()
+        if count < limit:
+            return 0.0
+        delay = min(self.base_delay * 2 ** (count - limit), self.max_delay)
+        return max(0.0, last + delay - now)
+
+
+def _user_key(username: str) -> str:
+    return f"user:{username.strip().lower()}"
+
+
+def _source_key(source: str) -> str:
+    return f"source:{source}"
+
+
+_throttle: Optional[LoginThrottle] = None
+_throttle_lock = threading.Lock()
+
+
+def get_login_throttle() -> LoginThrottle:
+    """Limiteur partagé du processus (fichier ouvert à la première connexion)."""
+    global _throttle
+    if _throttle is None:
+        with _throttle_lock:
+            if _throttle is None:
+                _throttle = LoginThrottle(**LOGIN_THROTTLE)
+    return _throttle
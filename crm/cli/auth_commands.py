@@ -1,10 +1,15 @@
+"""
+Commandes d'authentification.
+
+Les dépendances lourdes (modèles, SQLAlchemy, argon2) sont importées dans
+les commandes : `logout` et `--help` démarrent sans toucher à la base.
+"""
+
+import sys
+
 import click
-from ..auth.auth import Authentication
-from ..auth.config import TOKEN_PATH
-from ..database import SessionLocal
-from rich.console import Console
 
-console = Console()
+from ..auth.config import ARGON2_MAX_CONCURRENCY, TOKEN_PATH
 
 
 @click.group(name="auth-cli")
@@ -19,22 +24,24 @@ def login_cmd():
     Demande les identifiants, appelle Authentication.authenticate_user,
     sauvegarde access+refresh en JSON. Les JTI sont enregistrés côté Authentication.
     """
+    from ..auth.auth import Authentication
+    from ..database import unit_of_work
+
     username = click.prompt("Nom d'utilisateur")
     password = click.prompt("Mot de passe", hide_input=True)
 
-    with SessionLocal() as session:
+    with unit_of_work() as session:
         try:
             pair = Authentication.authenticate_user(username, password, session)
         except Exception as e:
-            console.print(f"[red]Échec de connexion : {e}[/red]")
+            click.secho(f"Échec de connexion : {e}", fg="red")
             raise SystemExit(1)
 
     # Sauvegarde locale JSON (access + refresh)
     Authentication.save_tokens(pair["access_token"], pair["refresh_token"])
 
-    console.print(
-        f"[green]Authentifié avec succès.[/green] Bienvenue, [bold]{username}[/bold]!"
-    )
+    click.secho("Authentifié avec succès.", fg="green", nl=False)
+    click.echo(" Bienvenue, " + click.style(username, bold=True) + "!")
 
 
 @click.command(name="logout")
@@ -44,6 +51,41 @@ def logout_cmd():
     """
     if TOKEN_PATH.exists():
         TOKEN_PATH.unlink()
-        console.print("[yellow]Déconnecté (tokens locaux supprimés).[/yellow]")
+        # Un principal n'a pu être mémorisé que si le cache a été chargé
+        principal_cache = sys.modules.get("crm.auth.principal_cache")
+        if principal_cache is not None:
+            principal_cache.PRINCIPAL.invalidate()
+        click.secho("Déconnecté (tokens locaux supprimés).", fg="yellow")
     else:
-        console.print("[dim]Aucun token local à supprimer.[/dim]")
+        click.secho("Aucun token local à supprimer.", dim=True)
+
+
+@click.command(name="calibrate")
+@click.option(
+    "--target-ms",
+    default=250.0,
+    show_default=True,
+    help="Durée visée pour un hachage de mot de passe, en ms.",
+)
+def calibrate_cmd(target_ms: float):
+    """
+    Mesure argon2 sur cette machine et propose les paramètres ARGON2_* dont
+    le hachage tient dans la durée visée (à reporter dans le .env).
+    """
+    from ..auth.hasher import PASSWORD_HASHER, calibrate
+
+    click.secho(f"Paramètres actuels : {PASSWORD_HASHER.parameters}", dim=True)
+    result = calibrate(target_ms)
+    click.secho(
+        f"Hachage en {result['elapsed_ms']} ms (cible {target_ms:g} ms).",
+        fg="green",
+    )
+    click.echo(f"ARGON2_TIME_COST={result['time_cost']}")
+    click.echo(f"ARGON2_MEMORY_COST={result['memory_cost']}")
+    click.echo(f"ARGON2_PARALLELISM={result['parallelism']}")
+    peak_mib = ARGON2_MAX_CONCURRENCY * result["memory_cost"] // 1024
+    click.secho(
+        f"Mémoire max avec ARGON2_MAX_CONCURRENCY={ARGON2_MAX_CONCURRENCY} : "
+        f"{peak_mib} MiB",
+        dim=True,
+    )
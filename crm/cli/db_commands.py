@@ -1,8 +1,10 @@
 import click
+import os
 import sys
+from pathlib import Path
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import inspect
-from crm.database import Base, engine, SessionLocal
+from crm.database import Base, get_engine, unit_of_work
 from ..models.role import Role
 from ..models.user import User
 from ..models.client import Client  # Import nécessaire pour la création des tables
@@ -10,11 +12,20 @@ from ..models.contract import Contract  # Import nécessaire pour la création d
 from ..models.event import Event  # Import nécessaire pour la création des tables
 from sqlalchemy import text
 from ..auth.permission import Permission
+from ..auth.permission_config import Crud
 from ..controllers.user_controller import UserController
 from config.settings import DATABASE
 from config.settings import get_admin_url
 from sqlalchemy import create_engine, text
 from ..utils.validations import Validations
+from ..utils.bulk_import import run_import
+from ..migrations import current_version, migrate, pending_migrations, stamp
+from ..utils.bulk_export import (
+    COMPRESSIONS,
+    EXPORTABLE_ENTITIES,
+    FORMATS,
+    run_export,
+)
 
 
 @click.group(name="db-cli")
@@ -40,7 +51,7 @@ def _bootstrap_database():
 def _database_exists():
     """Vérifie si la base de données existe et contient des tables."""
     try:
-        inspector = inspect(engine)
+        inspector = inspect(get_engine())
         tables = inspector.get_table_names()
         return len(tables) > 0
     except Exception:
@@ -49,7 +60,9 @@ def _database_exists():
 
 def _create_initial_data():
     """Crée les rôles de base et l'utilisateur admin."""
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
+    # Le schéma est à jour : les migrations existantes sont marquées appliquées
+    stamp(get_engine())
     click.echo("Base de données créée.")
 
     # Saisie interactive des informations admin
@@ -65,7 +78,7 @@ def _create_initial_data():
         "Mot de passe admin", hide_input=True, confirmation_prompt=True
     )
 
-    with SessionLocal() as session:
+    with unit_of_work() as session:
         try:
             # Création des rôles de base
             roles = {}
@@ -135,15 +148,15 @@ def init_db(ctx: click.Context):
 )
 @click.pass_context
 def reset_hard(ctx: click.Context):
+    """Détruit puis recrée le schéma et les données initiales (admin uniquement)."""
 
-    ctrl: UserController = ctx.obj.get("user_controller") or UserController(
-        session=SessionLocal()
-    )
+    ctrl: UserController = ctx.obj.get("user_controller") or UserController()
 
     me = ctrl._get_current_user()
     if not Permission.is_admin(me):
         sys.exit("Accès refusé.")
 
+    engine = get_engine()
     engine.dispose()
 
     # Exécute la nuke (BOOM)
@@ -161,7 +174,163 @@ def reset_hard(ctx: click.Context):
         raw.execute(text("SET search_path TO public"))
 
     # Et la DB renait de ses cendres...
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
     _create_initial_data()
 
     click.secho("Reset hard terminé", fg="green")
+
+
+@click.command("import")
+@click.argument("entity", type=click.Choice(["clients", "contracts", "events"]))
+@click.argument(
+    "path", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["csv", "jsonl"]),
+    default=None,
+    help="Format du fichier (déduit de l'extension par défaut).",
+)
+@click.option("--chunk-size", default=5000, show_default=True, help="Lignes par lot.")
+@click.option(
+    "--workers",
+    default=os.cpu_count() or 1,
+    show_default=True,
+    help="Processus de validation (1 = pas de pool).",
+)
+@click.option(
+    "--errors",
+    "errors_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Fichier des lignes rejetées (par défaut : <fichier>.errors.jsonl).",
+)
+@click.pass_context
+def import_data(ctx: click.Context, entity, path, fmt, chunk_size, workers, errors_path):
+    """Importe en masse des clients, contrats ou événements (CSV / JSONL)."""
+
+    ctrl: UserController = (ctx.obj or {}).get("user_controller") or UserController()
+
+    me = ctrl._get_current_user()
+    if not Permission.is_admin(me):
+        sys.exit("Accès refusé.")
+
+    with unit_of_work() as session:
+        report = run_import(
+            session,
+            entity,
+            path,
+            fmt=fmt,
+            chunk_size=chunk_size,
+            workers=workers,
+            errors_path=errors_path,
+        )
+
+    click.secho(
+        f"{report.imported}/{report.total} ligne(s) importée(s).", fg="green"
+    )
+    if report.rejected:
+        click.secho(
+            f"{report.rejected} ligne(s) rejetée(s) -> {report.errors_path}",
+            fg="yellow",
+        )
+
+
+@click.command("export")
+@click.argument("entity", type=click.Choice(list(EXPORTABLE_ENTITIES)))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(FORMATS),
+    default="csv",
+    show_default=True,
+    help="Format de sortie (parquet : paquet 'pyarrow').",
+)
+@click.option(
+    "--output",
+    "path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Fichier de sortie (par défaut : <entité>.<format>).",
+)
+@click.option(
+    "--fields",
+    default=None,
+    help="Champs à exporter, séparés par des virgules (par défaut : tous).",
+)
+@click.option(
+    "--compress",
+    type=click.Choice(COMPRESSIONS),
+    default=None,
+    help="Compression du fichier (zstd : paquet 'zstandard').",
+)
+@click.option(
+    "--batch-size", default=10_000, show_default=True, help="Lignes par lot lu."
+)
+@click.pass_context
+def export_data(ctx: click.Context, entity, fmt, path, fields, compress, batch_size):
+    """
+    Exporte en flux des clients, contrats ou événements (CSV / JSONL / Parquet).
+
+    Dépendances facultatives (cf. requirements.txt) : 'pyarrow' pour
+    --format parquet, 'zstandard' pour --compress zstd.
+    """
+
+    ctrl: UserController = (ctx.obj or {}).get("user_controller") or UserController()
+
+    me = ctrl._get_current_user()
+    # Même périmètre que les listes : tout, ou les seules lignes de l'utilisateur
+    try:
+        owner_id = Permission.owner_scope(me, entity.rstrip("s"), Crud.READ)
+    except PermissionError:
+        sys.exit("Accès refusé.")
+
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    try:
+        with unit_of_work() as session:
+            report = run_export(
+                session,
+                entity,
+                fmt=fmt,
+                path=path,
+                fields=field_list,
+                compress=compress,
+                batch_size=batch_size,
+                owner_id=owner_id,
+            )
+    except ValueError as e:
+        sys.exit(str(e))
+
+    click.secho(f"{report.rows} ligne(s) exportée(s) -> {report.path}", fg="green")
+
+
+@click.command("migrate")
+@click.option(
+    "--status", is_flag=True, help="Affiche la version et les migrations en attente."
+)
+@click.pass_context
+def migrate_db(ctx: click.Context, status: bool):
+    """Applique les migrations de schéma en attente."""
+
+    ctrl: UserController = (ctx.obj or {}).get("user_controller") or UserController()
+
+    me = ctrl._get_current_user()
+    if not Permission.is_admin(me):
+        sys.exit("Accès refusé.")
+
+    engine = get_engine()
+    if status:
+        click.echo(f"Version actuelle : {current_version(engine)}")
+        for migration in pending_migrations(engine):
+            click.echo(
+                f"  en attente : {migration.version:04d} {migration.description}"
+            )
+        return
+
+    applied = migrate(engine)
+    for migration in applied:
+        click.echo(f"Appliquée : {migration.version:04d} {migration.description}")
+    click.secho(
+        f"Schéma à jour (version {current_version(engine)}).", fg="green"
+    )
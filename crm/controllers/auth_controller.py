@@ -4,7 +4,8 @@ from rich.console import Console
 from typing import Dict, Any, Optional
 from .base import AbstractController
 from ..auth.auth import Authentication
-from ..auth.auth import JTIManager
+from ..auth.jti_manager import get_jti_store
+from ..auth.principal_cache import PRINCIPAL
 from ..crud.user_crud import UserCRUD
 from ..serializers.user_serializer import UserSerializer
 
@@ -12,12 +13,12 @@ console = Console()
 
 
 class AuthController(AbstractController):
-    """Contrôleur d'auth minimal basé sur tes classes Authentication et JTIManager."""
+    """Contrôleur d'auth minimal basé sur tes classes Authentication et JTIStore."""
 
     def _setup_services(self) -> None:
         self.users = UserCRUD(self.session)
         self.serializer = UserSerializer()
-        self.jti_store = JTIManager()
+        self.jti_store = get_jti_store()
 
     # --- Flux interactifs ---
     def login_interactive(self) -> bool:
@@ -55,10 +56,8 @@ class AuthController(AbstractController):
         # Enregistrer les JTI AVANT toute vérif stricte
         access_payload = Authentication.verify_token_without_jti(access)
         refresh_payload = Authentication.verify_token_without_jti(refresh)
-        if jti := access_payload.get("jti"):
-            self.jti_store.add(jti)
-        if jti := refresh_payload.get("jti"):
-            self.jti_store.add(jti)
+        self.jti_store.add_payload(access_payload)
+        self.jti_store.add_payload(refresh_payload)
 
         # Sauvegarde de l'access token (via TOKEN_PATH)
         Authentication.save_token(access)
@@ -128,6 +127,7 @@ class AuthController(AbstractController):
                 from ..auth.config import TOKEN_PATH
 
                 TOKEN_PATH.unlink(missing_ok=True)
+                PRINCIPAL.invalidate()
 
         if refresh_token:
             try:
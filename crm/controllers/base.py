@@ -1,25 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from ..database import SessionLocal
+from ..database import get_session
 from datetime import datetime
 from ..auth.auth import Authentication
+from ..auth.principal_cache import PRINCIPAL
+from ..crud.base_crud import Page
 from ..crud.user_crud import UserCRUD
 from ..models.user import User
 from ..auth.permission import Permission
+from ..auth.permission_config import Crud
+from ..utils.app_state import AppState
 from ..utils.validations import Validations
 
 
 class AbstractController(ABC):
     """
     Contrôleur de base très léger :
-    - gère la session (injection, context manager),
+    - gère la session (injectée, sinon la session partagée du thread),
     - point d'extension pour connecter les services/CRUD.
     """
 
     def __init__(self, session: Optional[Session] = None):
-        self.session = session or SessionLocal()
+        self.session = session or get_session()
         self.user_crud = UserCRUD(self.session)
         self.valid = Validations()
         self._owns_session = session is None
@@ -31,11 +36,17 @@ class AbstractController(ABC):
         pass
 
     def _get_current_user(self) -> User:
-        token = Authentication.load_token()
-        if not token:
-            raise PermissionError("Non authentifié.")
-        payload = Authentication.verify_token(token)
-        me = self.user_crud.get_by_id(int(payload["sub"]))
+        # Principal mémorisé tant que le fichier de tokens et les JTI n'ont pas bougé
+        stamp = PRINCIPAL.stamp()
+        user_id = PRINCIPAL.lookup(stamp)
+        if user_id is None:
+            token = Authentication.load_token()
+            if not token:
+                raise PermissionError("Non authentifié.")
+            payload = Authentication.verify_token(token)
+            PRINCIPAL.remember(stamp, payload)
+            user_id = int(payload["sub"])
+        me = self.user_crud.get_by_id(user_id)
         if not me:
             raise PermissionError("Utilisateur courant introuvable.")
         return me
@@ -47,3 +58,82 @@ class AbstractController(ABC):
     def _ensure_owner_or_admin(self, me: User, owner_id: int) -> None:
         if not (Permission.is_admin(me) or me.id == owner_id):
             raise PermissionError("Accès refusé.")
+
+    @staticmethod
+    def _require_scoped(obj, owner_id: Optional[int], missing: str):
+        """
+        Résultat d'une lecture (verrouillée ou non) restreinte au propriétaire :
+        hors périmètre, une ligne absente et celle d'un autre donnent le même
+        refus.
+        """
+        if obj is None:
+            if owner_id is not None:
+                raise PermissionError("Accès refusé.")
+            raise ValueError(missing)
+        return obj
+
+    @contextmanager
+    def _release_on_denied(self) -> Iterator[None]:
+        """
+        Contrôles menés sur une ligne verrouillée : un refus annule tout de
+        suite la transaction (verrou rendu) au lieu d'attendre la fin de
+        l'unité de travail.
+        """
+        try:
+            yield
+        except PermissionError:
+            self.session.rollback()
+            raise
+
+    def _scoped_rows_page(
+        self,
+        crud,
+        resource: str,
+        serializer_cls,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        op: Crud = Crud.READ,
+    ) -> Page:
+        """
+        Page de lignes de `resource` visibles pour `op` : toutes, ou celles de
+        l'utilisateur (filtre en SQL). Lecture directe : dicts de même forme
+        que le sérialiseur (`serializer_cls` si `fields` est fourni), sans ORM.
+        """
+        me = self._get_current_user()
+        owner_id = Permission.owner_scope(me, resource, op)
+
+        ser = self.serializer if fields is None else serializer_cls(fields=fields)
+        return crud.paginate_rows(
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            after=after,
+            fields=ser.fields,
+            owner_id=owner_id,
+        )
+
+    @staticmethod
+    def _page_payload(page: Page) -> Dict[str, Any]:
+        """Liste paginée (keyset) : {"items", "has_more", "next_cursor"}."""
+        return {
+            "items": page.items,
+            "has_more": page.has_more,
+            "next_cursor": page.next_cursor,
+        }
+
+    @staticmethod
+    def _visible_rows(page: Page) -> List[Dict[str, Any]]:
+        """
+        Lignes d'une liste plafonnée (QUERY_LIMITS["max_rows"]) : si le plafond
+        est atteint, la vue signale que la liste est incomplète.
+        """
+        if page.has_more:
+            AppState.set_neutral_message(
+                f"Seules les {len(page.items)} premières lignes sont affichées :"
+                " affinez avec un filtre."
+            )
+        return page.items
@@ -1,6 +1,8 @@
 from typing import Dict, Any, Optional, List
+from config.settings import QUERY_LIMITS
 from .base import AbstractController
 from ..auth.permission import Permission
+from ..auth.permission_config import Crud
 from ..crud.client_crud import ClientCRUD
 from ..crud.user_crud import UserCRUD
 from ..serializers.client_serializer import ClientSerializer
@@ -25,16 +27,43 @@ class ClientController(AbstractController):
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        op: Crud = Crud.READ,
     ) -> List[Dict[str, Any]]:
-
-        me = self._get_current_user()
-        if not Permission.read_permission(me, "client"):
-            raise PermissionError("Accès refusé.")
-
-        rows = self.clients.get_all(filters=filters, order_by=order_by)
-
-        ser = self.serializer if fields is None else ClientSerializer(fields=fields)
-        return ser.serialize_list(rows)
+        page = self._scoped_rows_page(
+            self.clients,
+            "client",
+            ClientSerializer,
+            filters=filters,
+            order_by=order_by,
+            fields=fields,
+            limit=QUERY_LIMITS["max_rows"],
+            op=op,
+        )
+        return self._visible_rows(page)
+
+    def list_page(
+        self,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        op: Crud = Crud.READ,
+    ) -> Dict[str, Any]:
+        """Liste paginée (keyset) : {"items", "has_more", "next_cursor"}."""
+        page = self._scoped_rows_page(
+            self.clients,
+            "client",
+            ClientSerializer,
+            filters=filters,
+            order_by=order_by,
+            fields=fields,
+            limit=limit,
+            after=after,
+            op=op,
+        )
+        return self._page_payload(page)
 
     def list_my_clients(
         self,
@@ -46,8 +75,10 @@ class ClientController(AbstractController):
         if not Permission.read_permission(me, "client"):
             raise PermissionError("Accès refusé.")
 
-        rows = self.clients.get_clients_by_sales_contact(me.id)
         ser = self.serializer if fields is None else ClientSerializer(fields=fields)
+        rows = self.clients.get_clients_by_sales_contact(
+            me.id, load=ser.relationships
+        )
         return ser.serialize_list(rows)
 
     def get_client(
@@ -57,14 +88,13 @@ class ClientController(AbstractController):
         fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         me = self._get_current_user()
-        if not Permission.read_permission(me, "client"):
-            raise PermissionError("Accès refusé.")
+        owner_id = Permission.owner_scope(me, "client", Crud.READ)
 
-        client = self.clients.get_by_id(client_id)
-        if not client:
-            raise ValueError("Client introuvable.")
-        self._ensure_owner_or_admin(me, client.sales_contact_id)
         ser = self.serializer if fields is None else ClientSerializer(fields=fields)
+        client = self.clients.get_by_id(
+            client_id, load=ser.relationships, owner_id=owner_id
+        )
+        client = self._require_scoped(client, owner_id, "Client introuvable.")
         return ser.serialize(client)
 
     def get_owner(self, client_id: int) -> User:
@@ -107,24 +137,24 @@ class ClientController(AbstractController):
         admin ou owner :
           - owner peut modifier ses champs
           - assigner à un autre commercial => admin-only
+        Droit vérifié avant le verrou, puis une seule lecture verrouillée
+        (restreinte aux clients du commercial) et un UPDATE des seuls champs
+        modifiés.
         """
         me = self._get_current_user()
-        client = self.clients.get_by_id(client_id)
-        if not client:
-            raise ValueError("Client introuvable.")
-
-        self._ensure_owner_or_admin(me, client.sales_contact_id)
+        owner_id = Permission.owner_scope(me, "client", Crud.UPDATE)
+        client = self.clients.get_for_update(client_id, owner_id=owner_id)
+        client = self._require_scoped(client, owner_id, "Client introuvable.")
 
         # empêcher un non-admin de transférer le client à quelqu'un d'autre
-        if "sales_contact_id" in data and not Permission.is_admin(me):
-            if data["sales_contact_id"] != me.id:
-                raise PermissionError(
-                    "Seul un administrateur peut réassigner le client."
-                )
-
-        updated = self.clients.update_client(client_id, data)
-        if updated is None:
-            raise ValueError("Mise à jour impossible.")
+        with self._release_on_denied():
+            if "sales_contact_id" in data and not Permission.is_admin(me):
+                if data["sales_contact_id"] != me.id:
+                    raise PermissionError(
+                        "Seul un administrateur peut réassigner le client."
+                    )
+
+        updated = self.clients.save(client, data)
         return self.serializer.serialize(updated)
 
     # ---------- Delete ----------
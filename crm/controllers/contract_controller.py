@@ -1,6 +1,8 @@
 from typing import Dict, Any, Optional, List, Tuple
+from config.settings import QUERY_LIMITS
 from .base import AbstractController
 from ..auth.permission import Permission
+from ..auth.permission_config import Crud
 from ..crud.contract_crud import ContractCRUD
 from ..crud.client_crud import ClientCRUD
 from ..crud.user_crud import UserCRUD
@@ -28,15 +30,43 @@ class ContractController(AbstractController):
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        op: Crud = Crud.READ,
     ) -> List[Dict[str, Any]]:
-        me = self._get_current_user()
-        if not Permission.read_permission(me, "contract"):
-            raise PermissionError("Accès refusé.")
-
-        rows = self.contracts.get_all(filters=filters, order_by=order_by)
+        page = self._scoped_rows_page(
+            self.contracts,
+            "contract",
+            ContractSerializer,
+            filters=filters,
+            order_by=order_by,
+            fields=fields,
+            limit=QUERY_LIMITS["max_rows"],
+            op=op,
+        )
+        return self._visible_rows(page)
 
-        ser = self.serializer if fields is None else ContractSerializer(fields=fields)
-        return ser.serialize_list(rows)
+    def list_page(
+        self,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        op: Crud = Crud.READ,
+    ) -> Dict[str, Any]:
+        """Liste paginée (keyset) : {"items", "has_more", "next_cursor"}."""
+        page = self._scoped_rows_page(
+            self.contracts,
+            "contract",
+            ContractSerializer,
+            filters=filters,
+            order_by=order_by,
+            fields=fields,
+            limit=limit,
+            after=after,
+            op=op,
+        )
+        return self._page_payload(page)
 
     def list_my_contracts(
         self, *, fields: Optional[List[str]] = None
@@ -45,8 +75,9 @@ class ContractController(AbstractController):
         if not Permission.read_permission(me, "contract"):
             raise PermissionError("Accès refusé.")
 
-        rows = self.contracts.get_all(filters={"sales_contact_id": me.id})
         ser = self.serializer if fields is None else ContractSerializer(fields=fields)
+        # Tous les contrats du commercial (lecture complète, sans plafond)
+        rows = self.contracts.get_by_sales_contact(me.id, load=ser.relationships)
         return ser.serialize_list(rows)
 
     def get_contract(
@@ -56,14 +87,14 @@ class ContractController(AbstractController):
         fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         me = self._get_current_user()
-        if not Permission.read_permission(me, "contract"):
-            raise PermissionError("Accès refusé.")
+        # Filtre sur la colonne dénormalisée sales_contact_id : pas de jointure client
+        owner_id = Permission.owner_scope(me, "contract", Crud.READ)
 
-        contract = self.contracts.get_by_id(contract_id)
-        if not contract:
-            raise ValueError("Contrat introuvable.")
-        self._ensure_owner_or_admin(me, contract.client.sales_contact_id)
         ser = self.serializer if fields is None else ContractSerializer(fields=fields)
+        contract = self.contracts.get_by_id(
+            contract_id, load=ser.relationships, owner_id=owner_id
+        )
+        contract = self._require_scoped(contract, owner_id, "Contrat introuvable.")
         return ser.serialize(contract)
 
     def is_contract_signed(self, contract_id: int) -> bool:
@@ -87,21 +118,11 @@ class ContractController(AbstractController):
         if not Permission.read_permission(me, "contract"):
             raise PermissionError("Accès refusé.")
 
-        filters = {}
-        if hasattr(Contract, "is_signed"):
-            filters["is_signed"] = signed
-
-        # Filtre par commercial
-        if sales_contact_id is not None:
-            if hasattr(Contract, "sales_contact_id"):
-                filters["sales_contact_id"] = sales_contact_id
-            else:
-                # Dans ce cas précis via Client, garde la première version Query.
-                pass
-
-        rows = self.contracts.get_all(filters)
+        # Sélection d'un contrat : la liste doit être complète (pas de plafond)
         ser = self.serializer if fields is None else ContractSerializer(fields=fields)
-
+        rows = self.contracts.get_unsigned_contracts(
+            sales_contact_id=sales_contact_id, signed=signed, fields=ser.fields
+        )
         return ser.serialize_list(rows)
 
     def list_signed_contracts(
@@ -143,7 +164,13 @@ class ContractController(AbstractController):
 
         return owner
 
-    def get_contract_amounts(self, contract_id: int) -> Tuple[Decimal, Decimal]:
+    def get_contract_amounts(
+        self, contract_id: int
+    ) -> Tuple[Decimal, Decimal, Optional[int]]:
+        """
+        Montant total, restant dû et version lus ensemble : la version sert au
+        contrôle optimiste de la mise à jour calculée à partir des montants.
+        """
         me = self._get_current_user()
         if not Permission.read_permission(me, "contract"):
             raise PermissionError("Accès refusé.")
@@ -152,7 +179,11 @@ class ContractController(AbstractController):
         if not contract:
             raise ValueError("Contrat introuvable.")
 
-        return Decimal(contract.amount_total), Decimal(contract.amount_due)
+        return (
+            Decimal(contract.amount_total),
+            Decimal(contract.amount_due),
+            contract.version_id,
+        )
 
     # ---------- Create ----------
     def create_contract(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -174,24 +205,26 @@ class ContractController(AbstractController):
 
     # ---------- Update ----------
     def update_contract(self, contract_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        admin ou owner (commercial du contrat) :
+          - changer client_id => admin-only
+        Droit vérifié avant le verrou, puis une seule lecture verrouillée
+        (restreinte aux contrats du commercial) et un UPDATE des seuls champs
+        modifiés.
+        """
         me = self._get_current_user()
-        owner_id = self.get_contract_owner(contract_id).id
-        if not Permission.update_permission(me, "contract", owner_id=owner_id):
-            raise PermissionError("Accès refusé.")
+        owner_id = Permission.owner_scope(me, "contract", Crud.UPDATE)
+        contract = self.contracts.get_for_update(contract_id, owner_id=owner_id)
+        contract = self._require_scoped(contract, owner_id, "Contrat introuvable.")
+        if contract.sales_contact_id is None:
+            raise ValueError("Le contrat n'a pas de commercial assigné.")
 
         # verrou pour champs sensibles si non admin
         if not Permission.is_admin(me):
             forbidden = {"client_id"}
             data = {k: v for k, v in data.items() if k not in forbidden}
 
-        contract = self.contracts.get_by_id(contract_id)
-        if not contract:
-            raise ValueError("Contrat introuvable.")
-
-        updated = self.contracts.update(contract_id, data)
-        if updated is None:
-            raise ValueError("Mise à jour impossible.")
-
+        updated = self.contracts.save(contract, data)
         return self.serializer.serialize(updated)
 
     # ---------- Delete ----------
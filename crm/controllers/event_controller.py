@@ -1,7 +1,9 @@
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from config.settings import QUERY_LIMITS
 from .base import AbstractController
 from ..auth.permission import Permission
+from ..auth.permission_config import Crud
 from ..crud.event_crud import EventCRUD
 from ..crud.contract_crud import ContractCRUD
 from ..crud.user_crud import UserCRUD
@@ -31,15 +33,43 @@ class EventController(AbstractController):
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        op: Crud = Crud.READ,
     ) -> List[Dict[str, Any]]:
-        me = self._get_current_user()
-        if not Permission.read_permission(me, "event"):
-            raise PermissionError("Accès refusé.")
-
-        rows = self.events.get_all(filters=filters, order_by=order_by)
-
-        ser = self.serializer if fields is None else EventSerializer(fields=fields)
-        return ser.serialize_list(rows)
+        page = self._scoped_rows_page(
+            self.events,
+            "event",
+            EventSerializer,
+            filters=filters,
+            order_by=order_by,
+            fields=fields,
+            limit=QUERY_LIMITS["max_rows"],
+            op=op,
+        )
+        return self._visible_rows(page)
+
+    def list_page(
+        self,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        op: Crud = Crud.READ,
+    ) -> Dict[str, Any]:
+        """Liste paginée (keyset) : {"items", "has_more", "next_cursor"}."""
+        page = self._scoped_rows_page(
+            self.events,
+            "event",
+            EventSerializer,
+            filters=filters,
+            order_by=order_by,
+            fields=fields,
+            limit=limit,
+            after=after,
+            op=op,
+        )
+        return self._page_payload(page)
 
     def list_my_events(
         self, *, fields: Optional[List[str]] = None
@@ -48,8 +78,8 @@ class EventController(AbstractController):
         if not Permission.read_permission(me, "event"):
             raise PermissionError("Accès refusé.")
 
-        rows = self.events.get_by_support_contact(me.id)
         ser = self.serializer if fields is None else EventSerializer(fields=fields)
+        rows = self.events.get_by_support_contact(me.id, load=ser.relationships)
         return ser.serialize_list(rows)
 
     def get_event(
@@ -62,11 +92,11 @@ class EventController(AbstractController):
         if not Permission.read_permission(me, "event"):
             raise PermissionError("Accès refusé.")
 
-        ev = self.events.get_by_id(event_id)
+        ser = self.serializer if fields is None else EventSerializer(fields=fields)
+        ev = self.events.get_by_id(event_id, load=ser.relationships)
         if not ev:
             raise ValueError("Evénement introuvable.")
 
-        ser = self.serializer if fields is None else EventSerializer(fields=fields)
         return ser.serialize(ev)
 
     def list_event_notes(self, event_id: int) -> List[Dict[str, Any]]:
@@ -112,14 +142,9 @@ class EventController(AbstractController):
 
     def create_note(self, event_id: int, note: str):
         me = self._get_current_user()
-        if not Permission.update_permission(
-            me, "event", owner_id=self.get_support_contact_id(event_id)
-        ):
-            raise PermissionError("Accès refusé.")
-
-        ev = self.events.get_by_id(event_id)
-        if not ev:
-            raise ValueError("Evénement introuvable.")
+        owner_id = Permission.owner_scope(me, "event", Crud.UPDATE)
+        ev = self.events.get_by_id(event_id, owner_id=owner_id)
+        self._require_scoped(ev, owner_id, "Evénement introuvable.")
 
         note = self.events.create_note({"event_id": event_id, "note": note})
         if not note:
@@ -131,16 +156,14 @@ class EventController(AbstractController):
         admin ou owner :
           - changer contract_id ou support_contact_id => admin-only
           - vérifie la cohérence des dates si fournies
+        Droit vérifié avant le verrou, puis une seule lecture verrouillée
+        (restreinte aux événements du support) et un UPDATE des seuls champs
+        modifiés.
         """
         me = self._get_current_user()
-        ev = self.events.get_by_id(event_id)
-        if not ev:
-            raise ValueError("Evénement introuvable.")
-
-        if not Permission.update_permission(
-            me, "event", owner_id=ev.support_contact_id
-        ):
-            raise PermissionError("Accès refusé.")
+        owner_id = Permission.owner_scope(me, "event", Crud.UPDATE)
+        ev = self.events.get_for_update(event_id, owner_id=owner_id)
+        ev = self._require_scoped(ev, owner_id, "Evénement introuvable.")
 
         # verrou pour champs sensibles si non admin
         if not Permission.is_admin(me):
@@ -158,9 +181,7 @@ class EventController(AbstractController):
             if not self.contracts.get_by_id(cid):
                 raise ValueError("Nouveau contrat introuvable.")
 
-        updated = self.events.update(event_id, data)
-        if updated is None:
-            raise ValueError("Mise à jour impossible.")
+        updated = self.events.save(ev, data)
         return self.serializer.serialize(updated)
 
     # ---------- Delete ----------
@@ -181,10 +202,8 @@ class EventController(AbstractController):
 
     def delete_note(self, event_id: int, note_id: int) -> None:
         me = self._get_current_user()
-        owner_id = self.get_support_contact_id(event_id)
-        if not Permission.update_permission(me, "event", owner_id=owner_id):
-            raise PermissionError("Accès refusé.")
-
-        ok = self.events.delete_note(note_id)
+        owner_id = Permission.owner_scope(me, "event", Crud.UPDATE)
+        # Note de cet événement, et de ses événements pour un support
+        ok = self.events.delete_note(note_id, event_id=event_id, owner_id=owner_id)
         if not ok:
-            raise ValueError("Note introuvable.")
+            self._require_scoped(None, owner_id, "Note introuvable.")
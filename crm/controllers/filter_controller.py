@@ -6,6 +6,7 @@ from ..controllers.client_controller import ClientController
 from ..controllers.contract_controller import ContractController
 from ..controllers.event_controller import EventController
 from ..crud.base_crud import AbstractBaseCRUD
+from ..crud.filters import filter_fields
 from ..controllers.base import AbstractController
 from ..utils.app_state import AppState
 
@@ -35,6 +36,8 @@ AUTHORIZED_FILTERS = {
             "name": "Nom du contact commercial",
             "type": "str",
         },
+        {"field": "amount_total", "name": "Montant total", "type": "amount"},
+        {"field": "amount_due", "name": "Montant restant dû", "type": "amount"},
     ],
     "events": [
         {"field": "is_assigned", "name": "Est assigné", "type": "bool"},
@@ -43,9 +46,19 @@ AUTHORIZED_FILTERS = {
             "name": "Nom du contact support",
             "type": "str",
         },
+        {"field": "client_name", "name": "Nom du client", "type": "str"},
+        {"field": "date_start", "name": "Date de début", "type": "date"},
     ],
 }
 
+# Opérateurs autorisés par type de filtre (cf. crud/filters.py)
+AUTHORIZED_OPERATORS = {
+    "str": {"eq", "in", "prefix", "iprefix", "contains"},
+    "bool": {"eq"},
+    "amount": {"eq", "in", "gt", "gte", "lt", "lte"},
+    "date": {"gt", "gte", "lt", "lte"},
+}
+
 
 class FilterController(AbstractController):
     """Relie la CLI au CRUD et sérialise pour les vues."""
@@ -69,11 +82,17 @@ class FilterController(AbstractController):
         if entity is None or entity not in ENTITY_TO_CONTROLLER:
             raise ValueError("Entité invalide.")
 
-        # Vérifie les champs de filtre autorisés
-        authorized_fields = {f["field"] for f in AUTHORIZED_FILTERS.get(entity, [])}
-        for field in filters.keys():
-            if field not in authorized_fields:
+        # Vérifie les champs (groupes ET/OU compris) et opérateurs autorisés
+        types = {f["field"]: f["type"] for f in AUTHORIZED_FILTERS.get(entity, [])}
+        for field, value in filter_fields(filters):
+            if field not in types:
                 raise ValueError(f"Champ de filtre non autorisé : {field}")
+            if isinstance(value, dict):
+                for op in value:
+                    if op not in AUTHORIZED_OPERATORS[types[field]]:
+                        raise ValueError(
+                            f"Opérateur non autorisé pour {field} : {op}"
+                        )
         try:
             controller = self.controllers[entity]
             return controller.list_all(filters=filters)
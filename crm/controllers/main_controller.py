@@ -12,6 +12,7 @@ from ..views.menu_view import MenuView
 from ..auth.permission_config import Crud
 from ..auth.permission import Permission
 from ..controllers.auth_controller import AuthController
+from ..database import unit_of_work
 
 
 class MainController(AbstractController):
@@ -25,7 +26,6 @@ class MainController(AbstractController):
         self.auth_ctrl = AuthController()
         self.console = Console()
         self.app_state = AppState()
-        self.auth_ctrl = AuthController()
 
     def _filter_items_by_permissions(self, user, raw_items):
         """Filtre les actions autorisées selon les permissions"""
@@ -46,8 +46,12 @@ class MainController(AbstractController):
         """
         # Chaque sous menu est autonome, permet de rester dans la boucle à chaque retour
         while True:
-            user = self.user_menu_ctrl._get_current_user()
-            allowed = self._filter_items_by_permissions(user, raw_items)
+            # Une unité de travail par tour de menu : la session partagée est
+            # fermée (connexion rendue au pool, identity map vidée) avant la saisie
+            # du choix, donc aussi à la fin de l'action précédente
+            with unit_of_work():
+                user = self.user_menu_ctrl._get_current_user()
+                allowed = self._filter_items_by_permissions(user, raw_items)
 
             # Récupération des labels (noms des actions)
             labels = [label for label, _ in allowed]
@@ -65,6 +69,9 @@ class MainController(AbstractController):
             if isinstance(choice, int):
                 idx = int(choice) - 1
                 if 0 <= idx < len(allowed):
+                    # Pas d'unité de travail autour de l'action : elle enchaîne
+                    # saisies et appels aux contrôleurs, et chaque saisie termine
+                    # d'abord la transaction en cours (release_for_input)
                     _, action = allowed[idx]
                     action()
 
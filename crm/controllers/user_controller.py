@@ -7,6 +7,7 @@ from ..crud.role_crud import RoleCRUD
 from ..serializers.user_serializer import UserSerializer
 from ..views.user_view import UserView
 from ..auth.auth import Authentication
+from ..auth.jti_manager import get_jti_store
 from ..controllers.role_controller import RoleController
 from ..utils.validations import Validations
 from ..errors.exceptions import UserCancelledInput
@@ -42,7 +43,7 @@ class UserController(AbstractController):
             else:
                 raise PermissionError("Accès refusé.")
 
-        rows = self.users.get_all(filters=filters, order_by=order_by)
+        rows = self.users.get_all(filters=filters, order_by=order_by, fields=fields)
         ser = (
             self.serializer
             if (fields is None and include_roles)
@@ -188,6 +189,9 @@ class UserController(AbstractController):
         updated = self.users.update_user(user_id, data)
         if updated is None:
             raise ValueError("Mise à jour impossible.")
+        if data.get("password"):
+            # Nouveau mot de passe : toutes les sessions ouvertes sont fermées
+            get_jti_store().revoke_user(user_id)
         return self.serializer.serialize(updated)
 
     def change_password(self, user_id: int, new_password: str) -> None:
@@ -198,6 +202,7 @@ class UserController(AbstractController):
         ok = self.users.update_password(user_id, new_password)
         if not ok:
             raise ValueError("Utilisateur introuvable ou échec de mise à jour.")
+        get_jti_store().revoke_user(user_id)
 
     # ---------- Delete ----------
     def delete_user(self, user_id: int) -> None:
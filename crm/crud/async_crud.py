@@ -0,0 +1,88 @@
+"""
+Jumeaux asynchrones des CRUD, sur AsyncSession (asyncpg en production,
+aiosqlite en test).
+
+Chaque classe expose exactement les méthodes publiques de son CRUD
+synchrone, en coroutines : `await AsyncClientCRUD(session).get_all()`.
+L'appel est exécuté par `AsyncSession.run_sync` : même code de requête,
+mêmes filtres, pagination, verrous et contrôle de version que la version
+synchrone, les E/S passant par le pilote asynchrone.
+
+Lectures concurrentes : une AsyncSession par tâche.
+
+    async with maker() as s1, maker() as s2:
+        clients, events = await asyncio.gather(
+            AsyncClientCRUD(s1).get_all(), AsyncEventCRUD(s2).get_all()
+        )
+
+Les relations non chargées par la requête ne peuvent pas être lues
+paresseusement hors de la session : passer par `fields` / les méthodes
+qui chargent déjà leurs relations (get_all, get_for_update...).
+"""
+
+import functools
+import inspect
+from typing import Any, Callable, Type
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base_crud import AbstractBaseCRUD
+from .client_crud import ClientCRUD
+from .contract_crud import ContractCRUD
+from .event_crud import EventCRUD
+from .role_crud import RoleCRUD
+from .user_crud import UserCRUD
+
+
+def _async_twin(name: str, method: Callable[..., Any]):
+    @functools.wraps(method)
+    async def twin(self, *args, **kwargs):
+        return await self.session.run_sync(
+            lambda sync_session: getattr(self.SYNC_CRUD(sync_session), name)(
+                *args, **kwargs
+            )
+        )
+
+    return twin
+
+
+def _install_twins(cls) -> None:
+    for name, method in inspect.getmembers(cls.SYNC_CRUD, inspect.isfunction):
+        if not name.startswith("_") and name not in cls.__dict__:
+            setattr(cls, name, _async_twin(name, method))
+
+
+class AsyncBaseCRUD:
+    """Base des jumeaux asynchrones : `SYNC_CRUD` fournit les méthodes."""
+
+    SYNC_CRUD: Type[AbstractBaseCRUD] = AbstractBaseCRUD
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _install_twins(cls)
+
+
+_install_twins(AsyncBaseCRUD)
+
+
+class AsyncClientCRUD(AsyncBaseCRUD):
+    SYNC_CRUD = ClientCRUD
+
+
+class AsyncContractCRUD(AsyncBaseCRUD):
+    SYNC_CRUD = ContractCRUD
+
+
+class AsyncEventCRUD(AsyncBaseCRUD):
+    SYNC_CRUD = EventCRUD
+
+
+class AsyncUserCRUD(AsyncBaseCRUD):
+    SYNC_CRUD = UserCRUD
+
+
+class AsyncRoleCRUD(AsyncBaseCRUD):
+    SYNC_CRUD = RoleCRUD
@@ -1,14 +1,262 @@
-from typing import Any, Optional, Dict, List, Sequence
-from sqlalchemy.orm import Session, Query
+import base64
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+)
+from sqlalchemy import and_, asc, desc, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import (
+    MANYTOONE,
+    Session,
+    Query,
+    joinedload,
+    load_only,
+    selectinload,
+)
 from abc import ABC
+from config.settings import QUERY_LIMITS
+from .filters import FilterCompiler, FilterTarget
+from ..errors.exceptions import ConcurrentUpdateError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Page:
+    """Une page de résultats (keyset) : les lignes, un flag 'has_more' et le curseur suivant."""
+
+    items: List = field(default_factory=list)
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """Résultat d'une écriture groupée : index de ligne -> id, et index -> raison du rejet."""
+
+    ids: Dict[int, int] = field(default_factory=dict)
+    errors: Dict[int, str] = field(default_factory=dict)
+    # Chargements sans RETURNING (COPY) : nombre de lignes écrites, `ids` reste vide
+    written: Optional[int] = None
+
+    @property
+    def ok(self) -> int:
+        return len(self.ids) if self.written is None else self.written
+
+
+@dataclass(frozen=True)
+class RowField:
+    """
+    Champ calculé du chemin de lecture directe (cf. select_rows_page) :
+    - `columns` : expressions sélectionnées, sur des tables jointes aliasées
+    - `joins` : (cible, condition) ajoutés en LEFT JOIN, dans l'ordre
+    - `build` : valeur du champ à partir des colonnes (défaut : la première)
+    - `default` : valeur quand le résultat est None, comme les sérialiseurs
+    """
+
+    columns: Tuple[Any, ...]
+    joins: Tuple[Tuple[Any, Any], ...] = ()
+    build: Optional[Callable[..., Any]] = None
+    default: Any = "Aucun"
+
+    def getter(self, start: int) -> Callable[[Sequence], Any]:
+        """Lecture du champ dans une ligne où ses colonnes commencent à `start`."""
+        default, build = self.default, self.build
+        if build is None:
+            get = itemgetter(start)
+
+            def read(row):
+                value = get(row)
+                return default if value is None else value
+
+            return read
+
+        stop = start + len(self.columns)
+
+        def read_built(row):
+            value = build(*row[start:stop])
+            return default if value is None else value
+
+        return read_built
+
+
+def _row_column_getter(index: int, column) -> Callable[[Sequence], Any]:
+    """Lecture d'une colonne ; dates en ISO 8601, comme les sérialiseurs."""
+    get = itemgetter(index)
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return get
+    if not issubclass(python_type, (date, time)):
+        return get
+
+    def read_iso(row):
+        value = get(row)
+        return None if value is None else value.isoformat()
+
+    return read_iso
+
+
+def loader_options(model, paths: Iterable[str]) -> tuple:
+    """
+    Options d'eager-load pour des chemins de relations ("contract.client"),
+    tels que déclarés par les sérialiseurs (cf. BaseSerializer.RELATIONSHIPS) :
+    joinedload pour un many-to-one (même requête), selectinload pour une
+    collection (une requête par relation, quel que soit le nombre de lignes).
+    """
+    return _loader_options(model, frozenset(paths))
+
+
+@lru_cache(maxsize=None)
+def _loader_options(model, paths: FrozenSet[str]) -> tuple:
+    options = []
+    for path in sorted(paths):
+        option, current = None, model
+        for key in path.split("."):
+            attribute = getattr(current, key)
+            prop = attribute.property
+            loader = joinedload if prop.direction is MANYTOONE else selectinload
+            if option is None:
+                option = loader(attribute)
+            else:
+                option = getattr(option, loader.__name__)(attribute)
+            current = prop.mapper.class_
+        options.append(option)
+    return tuple(options)
+
+
+# (classe du CRUD, modèle, champs) -> (colonnes, jointures, lecteurs)
+_ROW_PLANS: Dict[Tuple[type, type, FrozenSet[str]], Tuple[tuple, tuple, tuple]] = {}
 
 
 class AbstractBaseCRUD(ABC):
     """Classe de base pour les opérations CRUD génériques."""
 
+    # Whitelist des clés de tri (surchargée par chaque CRUD)
+    SORTABLE_FIELDS: frozenset = frozenset({"id"})
+
+    # Champ calculé -> colonnes du modèle nécessaires pour le calculer
+    COMPUTED_FIELD_COLUMNS: Dict[str, Tuple[str, ...]] = {}
+    # Champs filtrables hors colonnes simples : colonne cible + jointures
+    FILTER_TARGETS: Dict[str, FilterTarget] = {}
+    # Colonne du propriétaire, filtrée quand un owner_id est imposé (scope)
+    OWNER_FIELD: Optional[str] = None
+    # Champs calculés du chemin de lecture directe (select Core + LEFT JOIN)
+    ROW_FIELDS: Dict[str, RowField] = {}
+    # Modèle des lectures de listes (get_all, paginate, get_rows, paginate_rows)
+    MODEL = None
+
     def __init__(self, session: Session):
         self.session = session
 
+    # ---------- Listes du modèle (MODEL) ----------
+    def _list_eager_options(self) -> tuple:
+        """Relations chargées avec les entités des listes (anti N+1)."""
+        return ()
+
+    def get_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        owner_id: Optional[int] = None,
+    ) -> List:
+        """Entités de MODEL avec filtres/tri optionnels, eager-load anti-N+1."""
+        return self.get_entities(
+            self.MODEL,
+            owner_id=owner_id,
+            filters=filters,
+            order_by=order_by,
+            eager_options=self._list_eager_options(),
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
+
+    def paginate(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        owner_id: Optional[int] = None,
+    ) -> Page:
+        """Page d'entités de MODEL (keyset) : items + has_more + curseur suivant."""
+        return self.get_page(
+            self.MODEL,
+            owner_id=owner_id,
+            filters=filters,
+            order_by=order_by,
+            eager_options=self._list_eager_options(),
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
+
+    def get_rows(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        *,
+        fields: Iterable[str],
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        owner_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Lignes de MODEL déjà sous forme de dicts (lecture directe, sans ORM)."""
+        return self.select_rows(
+            self.MODEL,
+            fields,
+            owner_id=owner_id,
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            after=after,
+        )
+
+    def paginate_rows(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        *,
+        fields: Iterable[str],
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        owner_id: Optional[int] = None,
+    ) -> Page:
+        """Page de lignes de MODEL en dicts (keyset, lecture directe)."""
+        return self.select_rows_page(
+            self.MODEL,
+            fields,
+            owner_id=owner_id,
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            after=after,
+        )
+
     def get_entities(
         self,
         model,
@@ -18,29 +266,675 @@ class AbstractBaseCRUD(ABC):
         order_by: Optional[str] = None,
         *,
         eager_options: Sequence = (),  # ex : (selectinload(Client.sales_contact),)
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> List:
-        """Récupère des entités avec filtres/tri simples + eager-load optionnel."""
+        """
+        Récupère des entités avec filtres/tri simples + eager-load optionnel.
+        Le nombre de lignes est toujours plafonné (QUERY_LIMITS["max_rows"]) ;
+        un résultat tronqué est journalisé. Pour tout lire : iter_entities.
+        Si `fields` est fourni, seules les colonnes/relations utiles sont chargées.
+        """
+        page = self.get_page(
+            model,
+            owner_field=owner_field,
+            owner_id=owner_id,
+            filters=filters,
+            order_by=order_by,
+            eager_options=eager_options,
+            limit=limit or QUERY_LIMITS["max_rows"],
+            after=after,
+            fields=fields,
+        )
+        if limit is None:
+            self._warn_if_truncated(model, page)
+        return page.items
+
+    def iter_entities(
+        self,
+        model,
+        owner_field: Optional[str] = None,
+        owner_id: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        *,
+        eager_options: Sequence = (),
+        fields: Optional[Iterable[str]] = None,
+    ) -> Iterator:
+        """
+        Toutes les entités, sans plafond : pages successives de
+        QUERY_LIMITS["max_rows"] lignes (keyset), pour les appelants qui ont
+        besoin du résultat complet.
+        """
+        after = None
+        while True:
+            page = self.get_page(
+                model,
+                owner_field=owner_field,
+                owner_id=owner_id,
+                filters=filters,
+                order_by=order_by,
+                eager_options=eager_options,
+                limit=QUERY_LIMITS["max_rows"],
+                after=after,
+                fields=fields,
+            )
+            yield from page.items
+            if not page.has_more:
+                return
+            after = page.next_cursor
+
+    def get_page(
+        self,
+        model,
+        owner_field: Optional[str] = None,
+        owner_id: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        *,
+        eager_options: Sequence = (),
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        """
+        Pagination par clé (keyset) :
+        - order_by : clé whitelistée, préfixée de '-' pour un tri décroissant (ex: "-created_at")
+        - after : curseur opaque renvoyé par la page précédente (Page.next_cursor)
+        - limit : taille de page (défaut QUERY_LIMITS["page_size"]), bornée par le plafond global
+        - fields : champs du serializer ; remplace eager_options par une projection
+        L'id sert de départage pour garantir un ordre total et stable.
+        """
+        sort_field, descending = self._parse_order_by(model, order_by)
+
+        if fields is not None:
+            eager_options = self._projection_options(model, fields, sort_field)
+
+        query = self._build_query(model, owner_field, owner_id, filters, eager_options)
+        query = self._keyset_order(query, model, sort_field, descending, after)
+
+        size = self._effective_limit(limit)
+        # Une ligne de plus que demandé : suffit à savoir s'il reste des résultats
+        rows = query.limit(size + 1).all()
+        has_more = len(rows) > size
+        items = rows[:size]
+
+        next_cursor = None
+        if has_more and items:
+            last = items[-1]
+            next_cursor = self._encode_cursor(
+                (getattr(last, sort_field), getattr(last, "id"))
+            )
+
+        return Page(items=items, has_more=has_more, next_cursor=next_cursor)
+
+    # ---------- Lecture directe (sans ORM) ----------
+    def select_rows(
+        self,
+        model,
+        fields: Iterable[str],
+        owner_field: Optional[str] = None,
+        owner_id: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Toutes les lignes (plafonnées) du chemin direct, cf. select_rows_page."""
+        page = self.select_rows_page(
+            model,
+            fields,
+            owner_field=owner_field,
+            owner_id=owner_id,
+            filters=filters,
+            order_by=order_by,
+            limit=limit or QUERY_LIMITS["max_rows"],
+            after=after,
+        )
+        if limit is None:
+            self._warn_if_truncated(model, page)
+        return page.items
+
+    def select_rows_page(
+        self,
+        model,
+        fields: Iterable[str],
+        owner_field: Optional[str] = None,
+        owner_id: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Page:
+        """
+        Lecture seule pour les listes : un seul select() (colonnes demandées +
+        LEFT JOIN des champs calculés, cf. ROW_FIELDS), lignes converties
+        directement en dicts de même forme que les sérialiseurs. Ni instances
+        ORM, ni carte d'identité. Tri, curseurs, scope et filtres : comme get_page.
+        """
+        sort_field, descending = self._parse_order_by(model, order_by)
+        fields = frozenset(fields)
+        columns, joins, readers = self._row_plan(model, fields)
+
+        # id et clé de tri en fin de ligne : curseur et agrégats
+        statement = select(*columns, model.id, getattr(model, sort_field))
+        statement = statement.select_from(model)
+        for target, onclause in joins:
+            statement = statement.outerjoin(target, onclause)
+        statement = self._scope(statement, model, owner_field, owner_id, filters)
+        statement = self._keyset_order(
+            statement, model, sort_field, descending, after
+        )
+
+        size = self._effective_limit(limit)
+        rows = self.session.execute(statement.limit(size + 1)).all()
+        has_more = len(rows) > size
+        rows = rows[:size]
+
+        items = [{name: read(row) for name, read in readers} for row in rows]
+        self._aggregate_rows(fields, items, [row[-2] for row in rows])
+
+        next_cursor = None
+        if has_more and rows:
+            next_cursor = self._encode_cursor((rows[-1][-1], rows[-1][-2]))
+        return Page(items=items, has_more=has_more, next_cursor=next_cursor)
+
+    def _row_plan(self, model, fields: FrozenSet[str]) -> Tuple[tuple, tuple, tuple]:
+        """Colonnes, jointures et lecteurs pour ces champs (calculés une fois)."""
+        key = (type(self), model, fields)
+        plan = _ROW_PLANS.get(key)
+        if plan is not None:
+            return plan
+
+        columns: List[Any] = []
+        joins: List[Tuple[Any, Any]] = []
+        readers: List[Tuple[str, Callable]] = []
+        # Même ordre que les sérialiseurs : colonnes de la table, puis calculés
+        for column in model.__table__.columns:
+            if column.name in fields:
+                readers.append((column.name, _row_column_getter(len(columns), column)))
+                columns.append(getattr(model, column.name))
+        for name, row_field in self.ROW_FIELDS.items():
+            if name not in fields:
+                continue
+            readers.append((name, row_field.getter(len(columns))))
+            columns.extend(row_field.columns)
+            for join in row_field.joins:
+                if not any(join[0] is known[0] for known in joins):
+                    joins.append(join)
+
+        plan = _ROW_PLANS[key] = (tuple(columns), tuple(joins), tuple(readers))
+        return plan
+
+    def _aggregate_rows(
+        self, fields: FrozenSet[str], items: List[Dict[str, Any]], ids: List[int]
+    ) -> None:
+        """Champs listes (ex. notes) ajoutés aux lignes (surchargé par les CRUD)."""
+
+    # ---------- Construction de requête ----------
+    def _build_query(
+        self,
+        model,
+        owner_field: Optional[str],
+        owner_id: Optional[int],
+        filters: Optional[Dict[str, Any]],
+        eager_options: Sequence,
+    ) -> Query:
         query: Query = self.session.query(model)
 
         # Eager load (anti-N+1), si fourni
         if eager_options:
             query = query.options(*eager_options)
 
+        return self._scope(query, model, owner_field, owner_id, filters)
+
+    def _scope(
+        self,
+        query,
+        model,
+        owner_field: Optional[str],
+        owner_id: Optional[int],
+        filters: Optional[Dict[str, Any]],
+    ):
+        """Filtre propriétaire + filtres utilisateur (Query ORM ou select Core)."""
         # Whitelist des colonnes disponibles (noms)
         columns = {c.name for c in model.__table__.columns}
 
-        # Filtre "propriétaire"
-        if owner_field and owner_id is not None and owner_field in columns:
+        # Filtre "propriétaire" : un scope impossible à appliquer est une erreur,
+        # jamais un retour silencieux de toutes les lignes
+        if owner_id is not None:
+            owner_field = owner_field or self.OWNER_FIELD
+            if owner_field not in columns:
+                raise ValueError(f"Aucun champ propriétaire pour {model.__name__}.")
             query = query.filter(getattr(model, owner_field) == owner_id)
 
-        # Autres filtres (égalité simple)
-        if filters:
-            for field, value in filters.items():
-                if hasattr(model, field):
-                    query = query.filter(getattr(model, field) == value)
+        # Autres filtres : JOIN explicites + prédicats (cf. crud/filters.py)
+        return FilterCompiler(model, self.FILTER_TARGETS).apply(query, filters)
+
+    def _projection_options(
+        self, model, fields: Iterable[str], sort_field: str = "id"
+    ) -> tuple:
+        """
+        Traduit les champs demandés en options de chargement :
+        load_only sur les colonnes utiles + eager-load des seules relations nécessaires.
+        """
+        fields = set(fields)
+        columns = {c.name for c in model.__table__.columns}
+
+        wanted = {"id", sort_field} | (fields & columns)
+        for name in fields:
+            wanted.update(self.COMPUTED_FIELD_COLUMNS.get(name, ()))
+
+        options = [load_only(*(getattr(model, c) for c in sorted(wanted)))]
+        options.extend(self._relationship_options(fields))
+        return tuple(options)
+
+    def _relationship_options(self, fields: set) -> tuple:
+        """Options d'eager-load requises par les champs calculés (surchargé par les CRUD)."""
+        return ()
+
+    def _parse_order_by(self, model, order_by: Optional[str]) -> Tuple[str, bool]:
+        """Valide la clé de tri contre la whitelist (protège contre l'injection)."""
+        if not order_by:
+            return "id", False
+
+        descending = order_by.startswith("-")
+        sort_field = order_by.lstrip("-")
+        columns = {c.name for c in model.__table__.columns}
+        if sort_field not in self.SORTABLE_FIELDS or sort_field not in columns:
+            raise ValueError(f"Tri non autorisé : {sort_field}")
+        return sort_field, descending
+
+    def _keyset_order(self, query, model, sort_field, descending, after):
+        """Tri (clé + id en départage) et reprise après le curseur `after`."""
+        sort_col = getattr(model, sort_field)
+        id_col = getattr(model, "id")
+
+        if after:
+            last_value, last_id = self._decode_cursor(after)
+            query = query.filter(
+                self._keyset_condition(
+                    sort_col, id_col, last_value, last_id, sort_field, descending
+                )
+            )
+
+        direction = desc if descending else asc
+        if sort_field == "id":
+            return query.order_by(direction(id_col))
+        return query.order_by(direction(sort_col), direction(id_col))
+
+    @staticmethod
+    def _keyset_condition(sort_col, id_col, last_value, last_id, sort_field, descending):
+        if sort_field == "id":
+            return id_col < last_id if descending else id_col > last_id
+        if descending:
+            return or_(
+                sort_col < last_value, and_(sort_col == last_value, id_col < last_id)
+            )
+        return or_(sort_col > last_value, and_(sort_col == last_value, id_col > last_id))
+
+    @staticmethod
+    def _warn_if_truncated(model, page: Page) -> None:
+        """Plafond atteint : le résultat est incomplet, l'appelant doit paginer."""
+        if page.has_more:
+            logger.warning(
+                "%s : résultat tronqué à %d lignes (QUERY_LIMITS['max_rows']),"
+                " paginer avec paginate / iter_entities.",
+                model.__name__,
+                len(page.items),
+            )
+
+    @staticmethod
+    def _effective_limit(limit: Optional[int]) -> int:
+        if limit is None:
+            limit = QUERY_LIMITS["page_size"]
+        if limit <= 0:
+            raise ValueError("La limite doit être un entier positif.")
+        return min(limit, QUERY_LIMITS["max_rows"])
+
+    # ---------- Curseurs ----------
+    @staticmethod
+    def _encode_cursor(values: Sequence[Any]) -> str:
+        def tag(v: Any) -> Any:
+            if isinstance(v, datetime):
+                return {"dt": v.isoformat()}
+            if isinstance(v, date):
+                return {"d": v.isoformat()}
+            if isinstance(v, Decimal):
+                return {"dec": str(v)}
+            return v
+
+        raw = json.dumps([tag(v) for v in values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> List[Any]:
+        def untag(v: Any) -> Any:
+            if isinstance(v, dict):
+                if "dt" in v:
+                    return datetime.fromisoformat(v["dt"])
+                if "d" in v:
+                    return date.fromisoformat(v["d"])
+                if "dec" in v:
+                    return Decimal(v["dec"])
+            return v
+
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            values = [untag(v) for v in json.loads(raw)]
+        except Exception:
+            raise ValueError("Curseur de pagination invalide.")
+        if len(values) != 2:
+            raise ValueError("Curseur de pagination invalide.")
+        return values
+
+    # ---------- Lecture unitaire ----------
+    def _owned_select(self, model, entity_id: int, owner_id: int, options: Sequence):
+        """SELECT de la ligne `entity_id`, filtre propriétaire dans le WHERE."""
+        stmt = self._scope(
+            select(model).where(model.id == entity_id),
+            model,
+            None,
+            owner_id,
+            None,
+        )
+        return stmt.options(*options)
+
+    def _get_owned(
+        self,
+        model,
+        entity_id: int,
+        options: Sequence = (),
+        owner_id: Optional[int] = None,
+    ):
+        """
+        Lecture de la ligne, restreinte au propriétaire `owner_id` si fourni :
+        la ligne d'un autre n'est pas distinguée d'une ligne absente.
+        """
+        if owner_id is None:
+            if not options:
+                return self.session.get(model, entity_id)
+            return self.session.get(model, entity_id, options=options)
+        stmt = self._owned_select(model, entity_id, owner_id, options)
+        return self.session.scalars(stmt).unique().first()
+
+    # ---------- Ecriture unitaire ----------
+    def _get_for_update(
+        self,
+        model,
+        entity_id: int,
+        options: Sequence = (),
+        owner_id: Optional[int] = None,
+    ):
+        """
+        Lecture verrouillée de la ligne (SELECT ... FOR UPDATE OF <table>,
+        ignoré par SQLite), relations utiles chargées dans la même requête.
+        Avec `owner_id`, le filtre propriétaire fait partie du WHERE : la ligne
+        d'un autre n'est ni verrouillée ni distinguée d'une ligne absente.
+        """
+        if owner_id is None:
+            return self.session.get(
+                model, entity_id, options=options, with_for_update={"of": model}
+            )
+        stmt = (
+            self._owned_select(model, entity_id, owner_id, options)
+            .with_for_update(of=model)
+            .execution_options(populate_existing=True)
+        )
+        return self.session.scalars(stmt).unique().first()
+
+    def _save_changes(self, obj, changes: Dict[str, Any]):
+        """
+        Applique `changes` à un objet déjà chargé, en un seul aller-retour :
+        - seuls les attributs dont la valeur change sont affectés (validateurs inclus),
+          aucun UPDATE n'est émis si rien ne change ;
+        - le commit n'expire pas l'objet : pas de refresh (les valeurs générées
+          côté serveur reviennent par RETURNING, cf. eager_defaults) ;
+        - les relations dont la clé étrangère a changé sont expirées ;
+        - objet versionné : `version_id` dans `changes` est la version lue avant
+          édition, ConcurrentUpdateError si l'enregistrement a changé depuis.
+        """
+        mapper = sa_inspect(type(obj), raiseerr=False)
+        columns = set(mapper.column_attrs.keys()) if mapper else set()
+
+        # Relation many-to-one -> attributs de sa clé étrangère
+        many_to_one: Dict[str, List[str]] = {}
+        for rel in mapper.relationships if mapper else ():
+            if rel.direction is MANYTOONE:
+                many_to_one[rel.key] = [
+                    mapper.get_property_by_column(c).key for c in rel.local_columns
+                ]
+        foreign_keys = {
+            rel: [getattr(obj, key) for key in keys] for rel, keys in many_to_one.items()
+        }
+
+        changes = dict(changes)
+        try:
+            self._expected_version(obj, changes)
+            for key, value in changes.items():
+                if not hasattr(obj, key):  # Sécurité basique
+                    continue
+                if key in columns and getattr(obj, key) == value:
+                    continue
+                setattr(obj, key, value)
+
+            self.session.flush()
+            stale = [
+                rel
+                for rel, keys in many_to_one.items()
+                if [getattr(obj, key) for key in keys] != foreign_keys[rel]
+            ]
+
+            expire_on_commit = self.session.expire_on_commit
+            self.session.expire_on_commit = False
+            try:
+                self.session.commit()
+            finally:
+                self.session.expire_on_commit = expire_on_commit
+        except StaleDataError as e:
+            # UPDATE ... WHERE version_id = ... n'a touché aucune ligne
+            self.session.rollback()
+            raise ConcurrentUpdateError() from e
+        except Exception:
+            self.session.rollback()
+            raise
+
+        if stale:
+            self.session.expire(obj, stale)
+        return obj
+
+    @staticmethod
+    def _expected_version(obj, changes: Dict[str, Any]) -> Optional[int]:
+        """
+        Retire `version_id` de `changes` et le compare à la version de l'objet
+        (modèles Versioned uniquement). Renvoie la version courante.
+        """
+        if not getattr(obj, "__versioned__", False):
+            return None
+        expected = changes.pop("version_id", None)
+        if expected is not None and int(expected) != obj.version_id:
+            raise ConcurrentUpdateError()
+        return obj.version_id
+
+    # ---------- Ecritures groupées ----------
+    def _create_many(
+        self,
+        model,
+        payloads: Sequence[Dict[str, Any]],
+        *,
+        prepare: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> BatchResult:
+        """
+        Insère une liste de payloads en une seule transaction :
+        - validation par ligne (validateurs du modèle), les rejets sont reportés dans `errors`
+        - INSERT multi-lignes par lots avec RETURNING id
+        - si un lot viole une contrainte, il est rejoué ligne à ligne (SAVEPOINT)
+          pour isoler les fautives sans abandonner le reste.
+        """
+        result = BatchResult()
+        valid: List[Tuple[int, Dict[str, Any]]] = []
+        for index, data in enumerate(payloads):
+            try:
+                row = prepare(data) if prepare else dict(data)
+                valid.append((index, self._validated_row(model, row)))
+            except Exception as e:
+                result.errors[index] = str(e)
+
+        try:
+            for chunk in self._chunks(valid):
+                self._insert_chunk(model, chunk, result)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return result
+
+    def _update_many(
+        self,
+        model,
+        payloads: Sequence[Dict[str, Any]],
+        *,
+        prepare: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        before_commit: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ) -> BatchResult:
+        """
+        Met à jour une liste de payloads {"id": ..., champ: valeur} en une transaction :
+        un seul SELECT pour les lignes ciblées, validation par ligne,
+        puis UPDATE groupés (executemany) par lots.
+        `before_commit` reçoit les lignes appliquées (effets de bord dans la même
+        transaction : les UPDATE groupés ne déclenchent pas les événements de session).
+        """
+        result = BatchResult()
+        ids = [data.get("id") for data in payloads if data.get("id") is not None]
+        current = {
+            obj.id: obj
+            for obj in self.session.scalars(select(model).where(model.id.in_(ids)))
+        }
+
+        valid: List[Tuple[int, Dict[str, Any]]] = []
+        for index, data in enumerate(payloads):
+            try:
+                changes = prepare(data) if prepare else dict(data)
+                row_id = changes.pop("id", data.get("id"))
+                obj = current.get(row_id)
+                if obj is None:
+                    raise ValueError(f"Ligne introuvable (id={row_id}).")
+                version = self._expected_version(obj, changes)
+                merged = {
+                    c.name: getattr(obj, c.name)
+                    for c in model.__table__.columns
+                    if c.name != "id"
+                }
+                merged.update(changes)
+                checked = self._validated_row(model, merged)
+                row = {k: checked[k] for k in changes}
+                row["id"] = row_id
+                if version is not None:
+                    # Critère du WHERE des UPDATE groupés versionnés
+                    row["version_id"] = version
+                valid.append((index, row))
+            except Exception as e:
+                result.errors[index] = str(e)
+
+        try:
+            for chunk in self._chunks(valid):
+                self._update_chunk(model, chunk, result)
+            if before_commit:
+                before_commit([row for index, row in valid if index in result.ids])
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        # Les objets déjà chargés ne reflètent pas l'UPDATE groupé
+        for row_id in result.ids.values():
+            if row_id in current:
+                self.session.expire(current[row_id])
+        return result
+
+    @staticmethod
+    def _validated_row(model, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Valide une ligne via les validateurs du modèle et renvoie les valeurs normalisées."""
+        table = model.__table__
+        unknown = [k for k in row if k not in table.columns]
+        if unknown:
+            raise ValueError(f"Champ(s) inconnu(s) : {', '.join(unknown)}")
+
+        missing = [
+            c.name
+            for c in table.columns
+            if not c.nullable
+            and not c.primary_key
+            and c.default is None
+            and c.server_default is None
+            and row.get(c.name) is None
+        ]
+        if missing:
+            raise ValueError(f"Champ(s) requis manquant(s) : {', '.join(missing)}")
+
+        # Instance transitoire : déclenche les @validates sans toucher la session
+        probe = model(**row)
+        return {k: getattr(probe, k) for k in row}
+
+    def _insert_chunk(self, model, chunk, result: BatchResult) -> None:
+        rows = [row for _, row in chunk]
+        sqlite = self.session.get_bind().dialect.name == "sqlite"
+        try:
+            with self.session.begin_nested():
+                if sqlite:
+                    # Un seul écrivain SQLite : les rowids sont attribués dans l'ordre
+                    # des VALUES, trier suffit (sort_by_parameter_order y repasse
+                    # en ligne à ligne)
+                    stmt = insert(model).returning(model.id)
+                    new_ids = sorted(self.session.scalars(stmt, rows).all())
+                else:
+                    stmt = insert(model).returning(
+                        model.id, sort_by_parameter_order=True
+                    )
+                    new_ids = self.session.scalars(stmt, rows).all()
+            for (index, _), new_id in zip(chunk, new_ids):
+                result.ids[index] = new_id
+            return
+        except IntegrityError:
+            pass
+
+        # Rejeu ligne à ligne pour isoler les violations de contraintes
+        for index, row in chunk:
+            try:
+                with self.session.begin_nested():
+                    new_id = self.session.scalar(
+                        insert(model).values(**row).returning(model.id)
+                    )
+                result.ids[index] = new_id
+            except IntegrityError as e:
+                result.errors[index] = str(e.orig)
+
+    def _update_chunk(self, model, chunk, result: BatchResult) -> None:
+        rows = [row for _, row in chunk]
+        try:
+            with self.session.begin_nested():
+                self.session.execute(update(model), rows)
+            for index, row in chunk:
+                result.ids[index] = row["id"]
+            return
+        except (IntegrityError, StaleDataError):
+            pass
 
-        # Pas implémenté car non demandé, peut soulever un pb de sécurité si mal géré
-        if order_by:
-            raise ValueError("Le tri n'est pas encore implémenté.")
+        for index, row in chunk:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(update(model), [row])
+                result.ids[index] = row["id"]
+            except IntegrityError as e:
+                result.errors[index] = str(e.orig)
+            except StaleDataError:
+                result.errors[index] = str(ConcurrentUpdateError())
 
-        return query.all()
+    @staticmethod
+    def _chunks(rows: List[Tuple[int, Dict[str, Any]]]):
+        size = QUERY_LIMITS["batch_size"]
+        for start in range(0, len(rows), size):
+            yield rows[start : start + size]
@@ -1,14 +1,45 @@
-from .base_crud import AbstractBaseCRUD
-from typing import Optional, List, Dict, Any
+from .base_crud import AbstractBaseCRUD, BatchResult, RowField, loader_options
+from .filters import FilterTarget
+from .statement_cache import STATEMENTS
+from typing import Optional, List, Dict, Iterable
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from ..models.client import Client
-from sqlalchemy.orm import selectinload
+from ..models.contract import sync_sales_contact
+from ..models.user import User
+from sqlalchemy.orm import joinedload, selectinload
+
+# Commercial joint par le chemin de lecture directe
+SalesContact = User.__table__.alias("sales_contact")
 
 
 class ClientCRUD(AbstractBaseCRUD):
     """CRUD operations pour la gestion des clients."""
 
+    SORTABLE_FIELDS = frozenset(
+        {"id", "full_name", "email", "company_name", "created_at", "updated_at"}
+    )
+    COMPUTED_FIELD_COLUMNS = {"sales_contact_name": ("sales_contact_id",)}
+    MODEL = Client
+    OWNER_FIELD = "sales_contact_id"
+    FILTER_TARGETS = {
+        "sales_contact_name": FilterTarget(
+            column=User.username, joins=(Client.sales_contact,)
+        ),
+        "is_assigned": FilterTarget(
+            when_true=Client.sales_contact_id.isnot(None),
+            when_false=Client.sales_contact_id.is_(None),
+        ),
+    }
+    ROW_FIELDS = {
+        "sales_contact_name": RowField(
+            columns=(SalesContact.c.username,),
+            joins=((SalesContact, SalesContact.c.id == Client.sales_contact_id),),
+            default="Aucun contact",
+        ),
+    }
+
     def __init__(self, session: Session):
         super().__init__(session)
 
@@ -32,30 +63,62 @@ class ClientCRUD(AbstractBaseCRUD):
             self.session.rollback()
             raise
 
+    def create_many(self, payloads: List[Dict]) -> BatchResult:
+        """Crée plusieurs clients en une transaction (rejets reportés par ligne)."""
+        return self._create_many(Client, payloads)
+
     # ---------- READ ----------
-    def get_all(
+    def _list_eager_options(self) -> tuple:
+        return (selectinload(Client.sales_contact),)  # clé anti N+1
+
+    def _relationship_options(self, fields: set) -> tuple:
+        if "sales_contact_name" in fields:
+            return (selectinload(Client.sales_contact).load_only(User.username),)
+        return ()
+
+    def get_by_id(
         self,
-        filters: Optional[Dict[str, Any]] = None,
-        order_by: Optional[str] = None,
-    ) -> List[Client]:
-        """Récupère tous les clients avec filtres et tri optionnels, anti-N+1 activé."""
-        return self.get_entities(
+        client_id: int,
+        load: Iterable[str] = (),
+        owner_id: Optional[int] = None,
+    ) -> Optional[Client]:
+        """
+        Récupère un client par son ID (relations `load` chargées avec lui),
+        restreint au propriétaire `owner_id` si fourni.
+        """
+        options = loader_options(Client, load) if load else ()
+        return self._get_owned(Client, client_id, options=options, owner_id=owner_id)
+
+    def get_for_update(
+        self, client_id: int, owner_id: Optional[int] = None
+    ) -> Optional[Client]:
+        """
+        Client verrouillé (restreint au commercial `owner_id` si fourni),
+        commercial chargé dans la même requête.
+        """
+        return self._get_for_update(
             Client,
-            filters=filters,
-            order_by=order_by,
-            eager_options=(selectinload(Client.sales_contact),),  # clé anti N+1
+            client_id,
+            options=(joinedload(Client.sales_contact),),
+            owner_id=owner_id,
         )
 
-    def get_by_id(self, client_id: int) -> Optional[Client]:
-        """Récupère un client par son ID."""
-        return self.session.get(Client, client_id)
-
-    def get_clients_by_sales_contact(self, sales_contact_id: int) -> List[Client]:
-        """Récupère tous les clients assignés à un commercial."""
-        return (
-            self.session.query(Client)
-            .filter_by(sales_contact_id=sales_contact_id)
-            .all()
+    def get_clients_by_sales_contact(
+        self, sales_contact_id: int, load: Iterable[str] = ()
+    ) -> List[Client]:
+        """
+        Récupère tous les clients assignés à un commercial, avec les relations
+        `load` : nombre de requêtes constant, quel que soit le nombre de clients.
+        """
+        load = frozenset(load)
+        statement = STATEMENTS.get(
+            ("client.by_sales_contact", load),
+            lambda: select(Client)
+            .where(Client.sales_contact_id == bindparam("sales_contact_id"))
+            .options(*loader_options(Client, load)),
+        )
+        return list(
+            self.session.scalars(statement, {"sales_contact_id": sales_contact_id})
         )
 
     # ---------- UPDATE ----------
@@ -64,24 +127,14 @@ class ClientCRUD(AbstractBaseCRUD):
         Met à jour un client existant.
         Note: La validation des données est faite par le controller.
         """
-        client = self.session.get(Client, client_id)
+        client = self.get_for_update(client_id)
         if not client:
             return None
+        return self.save(client, client_data)
 
-        try:
-            for key, value in client_data.items():
-                if hasattr(client, key):  # Sécurité basique
-                    setattr(client, key, value)
-
-            self.session.commit()
-            self.session.refresh(client)
-            return client
-        except IntegrityError as e:
-            self.session.rollback()
-            raise
-        except Exception as e:
-            self.session.rollback()
-            raise
+    def save(self, client: Client, client_data: Dict) -> Client:
+        """Enregistre les champs modifiés d'un client déjà chargé (cf. get_for_update)."""
+        return self._save_changes(client, client_data)
 
     def assign_sales_contact(self, client_id: int, sales_contact_id: int) -> bool:
         """Assigne un commercial à un client."""
@@ -97,6 +150,21 @@ class ClientCRUD(AbstractBaseCRUD):
             self.session.rollback()
             raise
 
+    def update_many(self, payloads: List[Dict]) -> BatchResult:
+        """Met à jour plusieurs clients ({"id": ..., champ: valeur}) en une transaction."""
+        return self._update_many(Client, payloads, before_commit=self._sync_contracts)
+
+    def _sync_contracts(self, rows: List[Dict]) -> None:
+        """Réaffectations groupées : reporte le commercial sur les contrats."""
+        sync_sales_contact(
+            self.session,
+            {
+                row["id"]: row["sales_contact_id"]
+                for row in rows
+                if "sales_contact_id" in row
+            },
+        )
+
     # ---------- DELETE ----------
     def delete_client(self, client_id: int) -> bool:
         """
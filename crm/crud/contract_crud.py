@@ -1,14 +1,53 @@
-from .base_crud import AbstractBaseCRUD
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session, selectinload
+from .base_crud import AbstractBaseCRUD, BatchResult, RowField, loader_options
+from .filters import FilterTarget
+from typing import Optional, List, Dict, Any, Iterable
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
 from sqlalchemy.exc import IntegrityError
 from ..models.contract import Contract
 from ..models.client import Client
+from ..models.user import User
+
+# Tables jointes par le chemin de lecture directe
+ContractClient = Client.__table__.alias("contract_client")
+SalesContact = User.__table__.alias("sales_contact")
 
 
 class ContractCRUD(AbstractBaseCRUD):
     """CRUD operations basiques pour les contrats."""
 
+    SORTABLE_FIELDS = frozenset(
+        {"id", "client_id", "amount_total", "amount_due", "created_at", "updated_at"}
+    )
+    COMPUTED_FIELD_COLUMNS = {
+        "client_name": ("client_id",),
+        "sales_contact_name": ("sales_contact_id",),
+    }
+    MODEL = Contract
+    OWNER_FIELD = "sales_contact_id"
+    FILTER_TARGETS = {
+        "client_name": FilterTarget(column=Client.full_name, joins=(Contract.client,)),
+        "sales_contact_name": FilterTarget(
+            column=User.username, joins=(Contract.sales_contact,)
+        ),
+        # Forme "amount_due > 0" : correspond à l'index partiel ix_contracts_unpaid
+        "is_payed": FilterTarget(
+            when_true=Contract.amount_due == 0, when_false=Contract.amount_due > 0
+        ),
+    }
+    ROW_FIELDS = {
+        # Copie dénormalisée du commercial du client (cf. models/contract.py)
+        "sales_contact_name": RowField(
+            columns=(SalesContact.c.username,),
+            joins=((SalesContact, SalesContact.c.id == Contract.sales_contact_id),),
+            default="Aucun contact",
+        ),
+        "client_name": RowField(
+            columns=(ContractClient.c.full_name,),
+            joins=((ContractClient, ContractClient.c.id == Contract.client_id),),
+        ),
+    }
+
     def __init__(self, session: Session):
         super().__init__(session)
 
@@ -28,81 +67,150 @@ class ContractCRUD(AbstractBaseCRUD):
             self.session.rollback()
             raise
 
+    def create_many(self, payloads: List[Dict]) -> BatchResult:
+        """Crée plusieurs contrats en une transaction (rejets reportés par ligne)."""
+        return self._create_many(
+            Contract, payloads, prepare=self._with_sales_contact(payloads)
+        )
+
     # ---------- READ ----------
-    def get_all(
+    def _list_eager_options(self) -> tuple:
+        # N+1 (client) et N+2 (commercial du client)
+        return (selectinload(Contract.client).selectinload(Client.sales_contact),)
+
+    def _relationship_options(self, fields: set) -> tuple:
+        options = []
+        if "client_name" in fields:
+            options.append(selectinload(Contract.client).load_only(Client.full_name))
+        if "sales_contact_name" in fields:
+            options.append(
+                selectinload(Contract.sales_contact).load_only(User.username)
+            )
+        return tuple(options)
+
+    def get_by_id(
         self,
-        filters: Optional[Dict[str, Any]] = None,
-        order_by: Optional[str] = None,
-    ) -> List[Contract]:
-        """Récupère tous les contrats avec filtres/tri et eager-load anti-N+1."""
-        return self.get_entities(
-            Contract,
-            filters=filters,
-            order_by=order_by,
-            eager_options=(
-                # N+1
-                selectinload(Contract.client),
-                # N+2
-                selectinload(Contract.client).selectinload(Client.sales_contact),
-            ),
+        contract_id: int,
+        load: Iterable[str] = (),
+        owner_id: Optional[int] = None,
+    ) -> Optional[Contract]:
+        """
+        Récupère un contrat par son ID (relations `load` chargées avec lui),
+        restreint au propriétaire `owner_id` si fourni.
+        """
+        options = loader_options(Contract, load) if load else ()
+        return self._get_owned(
+            Contract, contract_id, options=options, owner_id=owner_id
         )
 
-    def get_by_id(self, contract_id: int) -> Optional[Contract]:
-        """Récupère un contrat par son ID."""
-        return self.session.get(Contract, contract_id)
-
-    def get_by_client(self, client_id: int) -> List[Contract]:
-        """Récupère les contrats d'un client."""
-        return self.session.query(Contract).filter_by(client_id=client_id).all()
+    def get_for_update(
+        self, contract_id: int, owner_id: Optional[int] = None
+    ) -> Optional[Contract]:
+        """
+        Contrat verrouillé (restreint au commercial `owner_id` si fourni),
+        client et commercial chargés dans la même requête.
+        """
+        return self._get_for_update(
+            Contract,
+            contract_id,
+            options=(joinedload(Contract.client), joinedload(Contract.sales_contact)),
+            owner_id=owner_id,
+        )
 
-    def get_by_sales_contact(self, sales_contact_id: int) -> List[Contract]:
+    def get_by_client(
+        self, client_id: int, load: Iterable[str] = ()
+    ) -> List[Contract]:
+        """Récupère les contrats d'un client (relations `load` eager-loadées)."""
+        query = self.session.query(Contract).filter_by(client_id=client_id)
+        if load:
+            query = query.options(*loader_options(Contract, load))
+        return query.all()
+
+    def get_by_sales_contact(
+        self, sales_contact_id: int, load: Iterable[str] = ()
+    ) -> List[Contract]:
         """Récupère tous les contrats liés à un commercial donné."""
+        options = (
+            loader_options(Contract, load)
+            if load
+            else (selectinload(Contract.client).selectinload(Client.sales_contact),)
+        )
         return (
             self.session.query(Contract)
-            .options(selectinload(Contract.client).selectinload(Client.sales_contact))
-            .filter(Contract.client.sales_contact_id == sales_contact_id)
+            .options(*options)
+            .filter(Contract.sales_contact_id == sales_contact_id)
             .all()
         )
 
     def get_unsigned_contracts(
-        self, *, sales_contact_id: Optional[int] = None, **kw
+        self,
+        *,
+        sales_contact_id: Optional[int] = None,
+        signed: bool = False,
+        fields: Optional[Iterable[str]] = None,
     ) -> List[Contract]:
-        filters = {}
-        if hasattr(Contract, "is_signed"):
-            filters["is_signed"] = False
-
-        eager = (selectinload(Contract.client).selectinload(Client.sales_contact),)
-
-        # Filtre par commercial
+        """
+        Contrats non signés (ou signés avec `signed=True`), d'un commercial si
+        précisé. Résultat complet : lu page par page, sans plafond.
+        """
+        filters: Dict[str, Any] = {"is_signed": signed}
         if sales_contact_id is not None:
-            if hasattr(Contract, "sales_contact_id"):
-                filters["sales_contact_id"] = sales_contact_id
-            else:
-                # Dans ce cas précis (via Client), garde la première version Query.
-                pass
-
-        return self.get_all(filters=filters, **kw)
+            filters["sales_contact_id"] = sales_contact_id
+
+        return list(
+            self.iter_entities(
+                Contract,
+                filters=filters,
+                eager_options=(
+                    selectinload(Contract.client).selectinload(Client.sales_contact),
+                ),
+                fields=fields,
+            )
+        )
 
     # ---------- UPDATE ----------
     def update(self, contract_id: int, contract_data: Dict) -> Optional[Contract]:
         """Met à jour un contrat."""
-        contract = self.session.get(Contract, contract_id)
+        contract = self.get_for_update(contract_id)
         if not contract:
             return None
+        return self.save(contract, contract_data)
 
-        try:
-            for key, value in contract_data.items():
-                if hasattr(contract, key):
-                    setattr(contract, key, value)
-            self.session.commit()
-            self.session.refresh(contract)
-            return contract
-        except IntegrityError:
-            self.session.rollback()
-            raise
-        except Exception:
-            self.session.rollback()
-            raise
+    def save(self, contract: Contract, contract_data: Dict) -> Contract:
+        """Enregistre les champs modifiés d'un contrat déjà chargé (cf. get_for_update)."""
+        return self._save_changes(contract, contract_data)
+
+    def update_many(self, payloads: List[Dict]) -> BatchResult:
+        """Met à jour plusieurs contrats ({"id": ..., champ: valeur}) en une transaction."""
+        return self._update_many(
+            Contract, payloads, prepare=self._with_sales_contact(payloads)
+        )
+
+    # -- Dénormalisation --
+    def _with_sales_contact(self, payloads: List[Dict]):
+        """
+        Prépare les lignes groupées (qui contournent les événements de session) :
+        sales_contact_id est recopié du client, en un SELECT par lot de clients.
+        """
+        client_ids = list({p["client_id"] for p in payloads if p.get("client_id")})
+        owners: Dict[int, Optional[int]] = {}
+        for start in range(0, len(client_ids), 1000):
+            owners.update(
+                self.session.execute(
+                    select(Client.id, Client.sales_contact_id).where(
+                        Client.id.in_(client_ids[start : start + 1000])
+                    )
+                ).all()
+            )
+
+        def prepare(data: Dict) -> Dict:
+            row = dict(data)
+            row.pop("sales_contact_id", None)
+            if "client_id" in row:
+                row["sales_contact_id"] = owners.get(row["client_id"])
+            return row
+
+        return prepare
 
     # ---------- DELETE ----------
     def delete(self, contract_id: int) -> bool:
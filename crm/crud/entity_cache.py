@@ -0,0 +1,274 @@
+"""
+Cache de second niveau (processus) pour User, Role et les rôles d'un utilisateur.
+
+Entrées : instantanés immuables (valeurs de colonnes), jamais d'objets liés à
+une session. Une lecture en cache reconstruit l'objet et l'attache à la
+session appelante par `merge(load=False)` : aucun SQL, objet persistant
+normal (relations paresseuses, modifications, commit).
+
+Invalidation : les User / Role / UserRole écrits pendant un flush sont notés
+sur la session et retirés du cache à son `after_commit` (ignorés si la
+transaction est annulée). Les écritures groupées (update_many) le signalent
+via `invalidate_on_commit`. Le TTL borne l'écart avec les autres processus.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from config.settings import ENTITY_CACHE
+from ..auth.capabilities import bump_role_generation
+from ..models.role import Role
+from ..models.user import User
+from ..models.user_role import UserRole
+
+_MISSING = object()
+# Clé spéciale : vide tout le cache au commit (rôle modifié, écriture groupée)
+ALL = "*"
+_PENDING_KEY = "entity_cache_pending"
+
+
+class TTLCache:
+    """Dictionnaire borné : éviction LRU au-delà de `max_entries`, expiration TTL."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        with self._lock:
+            for key in keys:
+                if key == ALL:
+                    self._entries.clear()
+                    return
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+
+ENTITY_CACHE_STORE = TTLCache(
+    ENTITY_CACHE["max_entries"], ENTITY_CACHE["ttl_seconds"]
+)
+
+
+# ---------- Instantanés ----------
+def _columns(obj, exclude: FrozenSet[str] = frozenset()) -> Tuple[Tuple[str, Any], ...]:
+    mapper = sa_inspect(type(obj))
+    return tuple(
+        (attr.key, getattr(obj, attr.key))
+        for attr in mapper.column_attrs
+        if attr.key not in exclude
+    )
+
+
+def _snapshot_role(role: Role) -> tuple:
+    return _columns(role)
+
+
+# Jamais en mémoire partagée : rechargé à la demande (vérification du mot de passe)
+_USER_UNCACHED = frozenset({"password_hash"})
+
+
+def _snapshot_user(user: User) -> tuple:
+    links = tuple(
+        (_columns(link), _snapshot_role(link.role)) for link in user.user_roles
+    )
+    return _columns(user, exclude=_USER_UNCACHED), links
+
+
+def _detached(model, columns: tuple, **relations):
+    """Instance détachée « comme chargée » : valeurs engagées, sans historique."""
+    obj = sa_inspect(model).class_manager.new_instance()
+    for key, value in chain(columns, relations.items()):
+        set_committed_value(obj, key, value)
+    make_transient_to_detached(obj)
+    return obj
+
+
+def _restore_role(session: Session, snapshot: tuple) -> Role:
+    return session.merge(_detached(Role, snapshot), load=False)
+
+
+def _restore_user(session: Session, snapshot: tuple) -> User:
+    """
+    Utilisateur rattaché à la session ; les colonnes absentes de l'instantané
+    (password_hash) restent non chargées et sont lues en base au premier accès.
+    """
+    columns, links = snapshot
+    user_roles = [
+        _detached(UserRole, link, role=_detached(Role, role)) for link, role in links
+    ]
+    return session.merge(_detached(User, columns, user_roles=user_roles), load=False)
+
+
+# ---------- Lecture ----------
+def _in_session(session: Session, model, entity_id: int):
+    key = sa_inspect(model).identity_key_from_primary_key([entity_id])
+    return session.identity_map.get(key)
+
+
+def get_user(
+    session: Session, user_id: int, load: Callable[[], Optional[User]]
+) -> Optional[User]:
+    """User par id : session, puis cache, puis `load()` (rôles chargés)."""
+    current = _in_session(session, User, user_id)
+    if current is not None:
+        return current
+    snapshot = ENTITY_CACHE_STORE.get(("user", user_id))
+    if snapshot is not _MISSING:
+        return _restore_user(session, snapshot)
+    user = load()
+    if user is not None:
+        ENTITY_CACHE_STORE.put(("user", user_id), _snapshot_user(user))
+    return user
+
+
+def get_role(
+    session: Session, role_id: int, load: Callable[[], Optional[Role]]
+) -> Optional[Role]:
+    current = _in_session(session, Role, role_id)
+    if current is not None:
+        return current
+    snapshot = ENTITY_CACHE_STORE.get(("role", role_id))
+    if snapshot is not _MISSING:
+        return _restore_role(session, snapshot)
+    role = load()
+    if role is not None:
+        ENTITY_CACHE_STORE.put(("role", role_id), _snapshot_role(role))
+    return role
+
+
+def get_user_roles(
+    session: Session, user_id: int, load: Callable[[], List[Role]]
+) -> List[Role]:
+    snapshot = ENTITY_CACHE_STORE.get(("user_roles", user_id))
+    if snapshot is not _MISSING:
+        return [_restore_role(session, role) for role in snapshot]
+    roles = load()
+    ENTITY_CACHE_STORE.put(
+        ("user_roles", user_id), tuple(_snapshot_role(role) for role in roles)
+    )
+    return roles
+
+
+def get_role_registry(
+    session: Session, load: Callable[[], Iterable[Tuple[str, int]]]
+) -> Mapping[str, int]:
+    """Registre immuable nom -> id de tous les rôles, chargé une seule fois."""
+    registry = ENTITY_CACHE_STORE.get(("role_registry",))
+    if registry is _MISSING:
+        registry = MappingProxyType(dict(load()))
+        ENTITY_CACHE_STORE.put(("role_registry",), registry)
+    return registry
+
+
+# ---------- Invalidation ----------
+def user_keys(user_id: int) -> Tuple[Hashable, ...]:
+    return ("user", user_id), ("user_roles", user_id)
+
+
+def invalidate_on_commit(session: Session, keys: Iterable[Hashable]) -> None:
+    """Clés à retirer du cache quand la transaction en cours sera validée."""
+    session.info.setdefault(_PENDING_KEY, set()).update(keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written_entities(session, flush_context):
+    keys = set()
+    roles_written = False
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, User):
+            keys.update(user_keys(obj.id))
+        elif isinstance(obj, UserRole):
+            keys.update(user_keys(obj.user_id))
+            roles_written = True
+        elif isinstance(obj, Role):
+            # Nom de rôle recopié dans les instantanés des utilisateurs
+            keys.add(ALL)
+            roles_written = True
+    if keys:
+        invalidate_on_commit(session, keys)
+    if roles_written:
+        # Capacités mémorisées sur les User chargés (cf. auth.capabilities)
+        bump_role_generation()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    keys = session.info.pop(_PENDING_KEY, None)
+    if keys:
+        ENTITY_CACHE_STORE.invalidate(keys)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session, previous_transaction):
+    # Un SAVEPOINT annulé laisse la transaction englobante (et ses écritures)
+    if not session.in_transaction():
+        session.info.pop(_PENDING_KEY, None)
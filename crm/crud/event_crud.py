@@ -1,16 +1,67 @@
-from .base_crud import AbstractBaseCRUD
-from typing import Optional, List, Dict, Any
+from .base_crud import AbstractBaseCRUD, BatchResult, RowField, loader_options
+from .filters import FilterTarget
+from .statement_cache import STATEMENTS
+from typing import Optional, List, Dict, Any, FrozenSet, Iterable
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from ..models.event import Event
 from ..models.event import EventNote
 from ..models.contract import Contract
-from sqlalchemy.orm import Session, selectinload
+from ..models.client import Client
+from ..models.user import User
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
+
+# Tables jointes par le chemin de lecture directe
+EventContract = Contract.__table__.alias("event_contract")
+EventClient = Client.__table__.alias("event_client")
+SupportContact = User.__table__.alias("support_contact")
+_CLIENT_JOINS = (
+    (EventContract, EventContract.c.id == Event.contract_id),
+    (EventClient, EventClient.c.id == EventContract.c.client_id),
+)
 
 
 class EventCRUD(AbstractBaseCRUD):
     """CRUD operations basiques pour les événements."""
 
+    SORTABLE_FIELDS = frozenset(
+        {"id", "date_start", "date_end", "attendees", "created_at", "updated_at"}
+    )
+    COMPUTED_FIELD_COLUMNS = {
+        "client_name": ("contract_id",),
+        "client_contact": ("contract_id",),
+        "support_contact_name": ("support_contact_id",),
+    }
+    MODEL = Event
+    OWNER_FIELD = "support_contact_id"
+    FILTER_TARGETS = {
+        "client_name": FilterTarget(
+            column=Client.full_name, joins=(Event.contract, Contract.client)
+        ),
+        "support_contact_name": FilterTarget(
+            column=User.username, joins=(Event.support_contact,)
+        ),
+        "is_assigned": FilterTarget(
+            when_true=Event.support_contact_id.isnot(None),
+            when_false=Event.support_contact_id.is_(None),
+        ),
+    }
+    ROW_FIELDS = {
+        "client_name": RowField(
+            columns=(EventClient.c.full_name,), joins=_CLIENT_JOINS
+        ),
+        "client_contact": RowField(
+            columns=(EventClient.c.email, EventClient.c.phone),
+            joins=_CLIENT_JOINS,
+            build=lambda email, phone: [email, phone],
+        ),
+        "support_contact_name": RowField(
+            columns=(SupportContact.c.username,),
+            joins=((SupportContact, SupportContact.c.id == Event.support_contact_id),),
+        ),
+    }
+
     def __init__(self, session: Session):
         super().__init__(session)
 
@@ -45,67 +96,144 @@ class EventCRUD(AbstractBaseCRUD):
             self.session.rollback()
             raise
 
+    def create_many(self, payloads: List[Dict]) -> BatchResult:
+        """Crée plusieurs événements en une transaction (rejets reportés par ligne)."""
+        return self._create_many(Event, payloads)
+
+    def create_notes_many(self, payloads: List[Dict]) -> BatchResult:
+        """Crée plusieurs notes d'événements en une transaction."""
+        return self._create_many(EventNote, payloads)
+
     # ---------- READ ----------
-    def get_all(
+    def _aggregate_rows(
+        self, fields: FrozenSet[str], items: List[Dict[str, Any]], ids: List[int]
+    ) -> None:
+        """Notes des événements de la page : une requête pour toute la page."""
+        if "notes" not in fields or not ids:
+            return
+        notes: Dict[int, List[str]] = {event_id: [] for event_id in ids}
+        statement = (
+            select(EventNote.event_id, EventNote.note)
+            .where(EventNote.event_id.in_(ids))
+            .order_by(EventNote.id)
+        )
+        for event_id, note in self.session.execute(statement):
+            notes[event_id].append(note)
+        for item, event_id in zip(items, ids):
+            item["notes"] = notes[event_id]
+
+    def _list_eager_options(self) -> tuple:
+        return (
+            # N+1
+            selectinload(Event.contract),
+            selectinload(Event.notes),
+            selectinload(Event.support_contact),
+            # N+2
+            selectinload(Event.contract).selectinload(Contract.client),
+        )
+
+    def _relationship_options(self, fields: set) -> tuple:
+        options = []
+
+        client_cols = []
+        if "client_name" in fields:
+            client_cols.append(Client.full_name)
+        if "client_contact" in fields:
+            client_cols.extend((Client.email, Client.phone))
+        if client_cols:
+            options.append(
+                selectinload(Event.contract).options(
+                    load_only(Contract.client_id),
+                    selectinload(Contract.client).load_only(*client_cols),
+                )
+            )
+
+        if "support_contact_name" in fields:
+            options.append(selectinload(Event.support_contact).load_only(User.username))
+        if "notes" in fields:
+            options.append(selectinload(Event.notes).load_only(EventNote.note))
+        return tuple(options)
+
+    def get_by_id(
         self,
-        filters: Optional[Dict[str, Any]] = None,
-        order_by: Optional[str] = None,
-    ) -> List[Event]:
-        """Récupère tous les contrats avec filtres/tri et eager-load anti-N+1."""
-        return self.get_entities(
+        event_id: int,
+        load: Iterable[str] = (),
+        owner_id: Optional[int] = None,
+    ) -> Optional[Event]:
+        """
+        Récupère un événement par son ID (relations `load` chargées avec lui),
+        restreint au propriétaire `owner_id` si fourni.
+        """
+        options = loader_options(Event, load) if load else ()
+        return self._get_owned(Event, event_id, options=options, owner_id=owner_id)
+
+    def get_for_update(
+        self, event_id: int, owner_id: Optional[int] = None
+    ) -> Optional[Event]:
+        """
+        Evénement verrouillé (restreint au support `owner_id` si fourni), avec
+        contrat, client, support et notes chargés dans la même requête (tout ce
+        que le sérialiseur lit).
+        """
+        return self._get_for_update(
             Event,
-            filters=filters,
-            order_by=order_by,
-            eager_options=(
-                # N+1
-                selectinload(Event.contract),
-                selectinload(Event.notes),
-                selectinload(Event.support_contact),
-                # N+2
-                selectinload(Event.contract).selectinload(Contract.client),
+            event_id,
+            options=(
+                joinedload(Event.contract).joinedload(Contract.client),
+                joinedload(Event.support_contact),
+                joinedload(Event.notes),
             ),
+            owner_id=owner_id,
         )
 
-    def get_by_id(self, event_id: int) -> Optional[Event]:
-        """Récupère un événement par son ID."""
-        return self.session.get(Event, event_id)
-
-    def get_by_contract(self, contract_id: int) -> List[Event]:
-        """Récupère les événements d'un contrat."""
-        return self.session.query(Event).filter_by(contract_id=contract_id).all()
+    def get_by_contract(
+        self, contract_id: int, load: Iterable[str] = ()
+    ) -> List[Event]:
+        """Récupère les événements d'un contrat (avec les relations `load`)."""
+        query = self.session.query(Event).filter_by(contract_id=contract_id)
+        if load:
+            query = query.options(*loader_options(Event, load))
+        return query.all()
 
-    def get_by_support_contact(self, support_contact_id: int) -> List[Event]:
-        """Récupère les événements d'un support."""
-        return (
-            self.session.query(Event)
-            .filter_by(support_contact_id=support_contact_id)
-            .all()
+    def get_by_support_contact(
+        self, support_contact_id: int, load: Iterable[str] = ()
+    ) -> List[Event]:
+        """
+        Récupère les événements d'un support, avec les relations `load` :
+        nombre de requêtes constant, quel que soit le nombre d'événements.
+        """
+        query = self.session.query(Event).filter_by(
+            support_contact_id=support_contact_id
         )
+        if load:
+            query = query.options(*loader_options(Event, load))
+        return query.all()
 
     def get_notes(self, event_id: int) -> List[EventNote]:
         """Récupère les notes d'un événement."""
-        return self.session.query(EventNote).filter_by(event_id=event_id).all()
+        statement = STATEMENTS.get(
+            "event.notes",
+            lambda: select(EventNote).where(
+                EventNote.event_id == bindparam("event_id")
+            ),
+        )
+        return list(self.session.scalars(statement, {"event_id": event_id}))
 
     # ---------- UPDATE ----------
     def update(self, event_id: int, event_data: Dict) -> Optional[Event]:
         """Met à jour un événement."""
-        event = self.session.get(Event, event_id)
+        event = self.get_for_update(event_id)
         if not event:
             return None
+        return self.save(event, event_data)
 
-        try:
-            for key, value in event_data.items():
-                if hasattr(event, key):
-                    setattr(event, key, value)
-            self.session.commit()
-            self.session.refresh(event)
-            return event
-        except IntegrityError:
-            self.session.rollback()
-            raise
-        except Exception:
-            self.session.rollback()
-            raise
+    def save(self, event: Event, event_data: Dict) -> Event:
+        """Enregistre les champs modifiés d'un événement déjà chargé (cf. get_for_update)."""
+        return self._save_changes(event, event_data)
+
+    def update_many(self, payloads: List[Dict]) -> BatchResult:
+        """Met à jour plusieurs événements ({"id": ..., champ: valeur}) en une transaction."""
+        return self._update_many(Event, payloads)
 
     # ---------- DELETE ----------
     def delete(self, event_id: int) -> bool:
@@ -122,9 +250,28 @@ class EventCRUD(AbstractBaseCRUD):
             self.session.rollback()
             raise
 
-    def delete_note(self, note_id: int) -> bool:
-        """Supprime une note d'événement."""
-        note = self.session.get(EventNote, note_id)
+    def delete_note(
+        self,
+        note_id: int,
+        event_id: Optional[int] = None,
+        owner_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Supprime une note d'événement ; avec `event_id` / `owner_id`, seulement
+        si elle appartient à cet événement / à un événement de ce support
+        (filtres dans la même requête).
+        """
+        if event_id is None and owner_id is None:
+            note = self.session.get(EventNote, note_id)
+        else:
+            statement = select(EventNote).where(EventNote.id == note_id)
+            if event_id is not None:
+                statement = statement.where(EventNote.event_id == event_id)
+            if owner_id is not None:
+                statement = statement.join(EventNote.event).where(
+                    Event.support_contact_id == owner_id
+                )
+            note = self.session.scalars(statement).first()
         if not note:
             return False
 
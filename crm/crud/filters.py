@@ -0,0 +1,162 @@
+"""
+Compilation des filtres de listing en JOIN explicites + prédicats SQL.
+
+Grammaire (dict, sérialisable) :
+    {"champ": valeur}                      égalité (liste / tuple -> IN)
+    {"champ": {"prefix": "Dup"}}           LIKE 'Dup%' (exploite l'index)
+    {"champ": {"iprefix": "dup"}}          ILIKE 'dup%'
+    {"champ": {"contains": "pon"}}         ILIKE '%pon%'
+    {"champ": {"in": [...]}}               IN
+    {"champ": {"gte": a, "lt": b}}         plages (dates, montants)
+    {"$or": [{...}, {...}]}                groupes OU / ET (imbriquables)
+Les clés de premier niveau sont combinées en ET.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, not_, or_
+
+GROUP_OPERATORS = {"$and": and_, "$or": or_}
+COMPARISON_OPERATORS = frozenset(
+    {"eq", "ne", "in", "prefix", "iprefix", "contains", "gt", "gte", "lt", "lte"}
+)
+
+
+@dataclass(frozen=True)
+class FilterTarget:
+    """
+    Cible SQL d'un champ filtrable :
+    - `column` : colonne comparée (éventuellement sur une table jointe)
+    - `joins` : relations à joindre, dans l'ordre, pour atteindre la colonne
+    - `when_true` / `when_false` : prédicats des booléens dérivés (ex. is_payed)
+    """
+
+    column: Any = None
+    joins: Tuple[Any, ...] = ()
+    when_true: Any = None
+    when_false: Any = None
+
+
+def _escape_like(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class FilterCompiler:
+    """Traduit un dict de filtres en (jointures, clause WHERE) pour un modèle."""
+
+    def __init__(self, model, targets: Optional[Dict[str, FilterTarget]] = None):
+        self.model = model
+        self.targets = targets or {}
+
+    def compile(self, filters: Dict[str, Any]) -> Tuple[List[Any], Any]:
+        joins: List[Any] = []
+        return joins, self._group(filters, and_, joins)
+
+    def apply(self, query, filters: Optional[Dict[str, Any]]):
+        """Ajoute jointures et prédicats à une Query."""
+        if not filters:
+            return query
+        joins, clause = self.compile(filters)
+        # LEFT JOIN : relations many-to-one (pas de doublons) et FK nullables
+        # qui ne doivent pas exclure de lignes dans un groupe OU
+        for relationship in joins:
+            query = query.outerjoin(relationship)
+        if clause is not None:
+            query = query.filter(clause)
+        return query
+
+    # ---------- Compilation ----------
+    def _target(self, field: str) -> Optional[FilterTarget]:
+        if field in self.targets:
+            return self.targets[field]
+        if hasattr(self.model, field):
+            # Colonne (ou hybride sans cible déclarée) : comparaison directe
+            return FilterTarget(column=getattr(self.model, field))
+        return None
+
+    def _group(self, filters: Dict[str, Any], combine, joins: List[Any]):
+        if not isinstance(filters, dict):
+            raise ValueError("Filtre invalide : un dictionnaire est attendu.")
+
+        clauses = []
+        for key, value in filters.items():
+            if key in GROUP_OPERATORS:
+                if not isinstance(value, (list, tuple)):
+                    raise ValueError(f"Groupe de filtres invalide : {key}")
+                members = [self._group(item, and_, joins) for item in value]
+                members = [m for m in members if m is not None]
+                if members:
+                    clauses.append(GROUP_OPERATORS[key](*members))
+                continue
+
+            target = self._target(key)
+            if target is None:
+                continue
+            for relationship in target.joins:
+                # `in` comparerait les attributs en SQL : test d'identité
+                if not any(known is relationship for known in joins):
+                    joins.append(relationship)
+            clauses.append(self._predicate(target, value))
+
+        if not clauses:
+            return None
+        return clauses[0] if len(clauses) == 1 else combine(*clauses)
+
+    def _predicate(self, target: FilterTarget, value: Any):
+        if target.when_true is not None:
+            flag = value.get("eq") if isinstance(value, dict) else value
+            if flag:
+                return target.when_true
+            if target.when_false is not None:
+                return target.when_false
+            return not_(target.when_true)
+
+        column = target.column
+        if isinstance(value, dict):
+            return and_(
+                *(self._compare(column, op, operand) for op, operand in value.items())
+            )
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return column.in_(list(value))
+        return column == value
+
+    @staticmethod
+    def _compare(column, op: str, operand: Any):
+        if op not in COMPARISON_OPERATORS:
+            raise ValueError(f"Opérateur de filtre non autorisé : {op}")
+        if op == "eq":
+            return column == operand
+        if op == "ne":
+            return column != operand
+        if op == "in":
+            return column.in_(list(operand))
+        if op == "prefix":
+            return column.like(f"{_escape_like(operand)}%", escape="\\")
+        if op == "iprefix":
+            return column.ilike(f"{_escape_like(operand)}%", escape="\\")
+        if op == "contains":
+            return column.ilike(f"%{_escape_like(operand)}%", escape="\\")
+        if op == "gt":
+            return column > operand
+        if op == "gte":
+            return column >= operand
+        if op == "lt":
+            return column < operand
+        return column <= operand
+
+
+def filter_fields(filters: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """Liste à plat des (champ, valeur) d'un dict de filtres, groupes compris."""
+    found: List[Tuple[str, Any]] = []
+    for key, value in (filters or {}).items():
+        if key in GROUP_OPERATORS:
+            if not isinstance(value, (list, tuple)):
+                raise ValueError(f"Groupe de filtres invalide : {key}")
+            for item in value:
+                if not isinstance(item, dict):
+                    raise ValueError("Filtre invalide : un dictionnaire est attendu.")
+                found.extend(filter_fields(item))
+        else:
+            found.append((key, value))
+    return found
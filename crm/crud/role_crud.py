@@ -1,5 +1,8 @@
-from .base_crud import AbstractBaseCRUD
+from . import entity_cache
+from ..auth.capabilities import bump_role_generation
+from .base_crud import AbstractBaseCRUD, BatchResult
 from typing import Optional, List, Dict, Any
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from ..models.role import Role
@@ -8,6 +11,8 @@ from ..models.role import Role
 class RoleCRUD(AbstractBaseCRUD):
     """CRUD operations pour la gestion des rôles."""
 
+    SORTABLE_FIELDS = frozenset({"id", "name"})
+
     def __init__(self, session: Session):
         super().__init__(session)
 
@@ -31,6 +36,10 @@ class RoleCRUD(AbstractBaseCRUD):
             self.session.rollback()
             raise
 
+    def create_many(self, payloads: List[Dict]) -> BatchResult:
+        """Crée plusieurs rôles en une transaction (rejets reportés par ligne)."""
+        return self._create_many(Role, payloads)
+
     # ---------- READ ----------
     def get_all(
         self, filters: Optional[Dict[str, Any]] = None, order_by: Optional[str] = None
@@ -39,12 +48,19 @@ class RoleCRUD(AbstractBaseCRUD):
         return self.get_entities(Role, filters=filters, order_by=order_by)
 
     def get_by_id(self, role_id: int) -> Optional[Role]:
-        """Récupère un rôle par son ID."""
-        return self.session.get(Role, role_id)
+        """Récupère un rôle par son ID (cache processus)."""
+        return entity_cache.get_role(
+            self.session, role_id, lambda: self.session.get(Role, role_id)
+        )
 
     def find_by_name(self, name: str) -> Optional[Role]:
-        """Trouve un rôle par son nom."""
-        return self.session.query(Role).filter_by(name=name).first()
+        """Trouve un rôle par son nom (registre des rôles, sans requête)."""
+        registry = entity_cache.get_role_registry(
+            self.session,
+            lambda: self.session.execute(select(Role.name, Role.id)).all(),
+        )
+        role_id = registry.get(name)
+        return None if role_id is None else self.get_by_id(role_id)
 
     # ---------- UPDATE ----------
     def update_role(self, role_id: int, role_data: Dict) -> Optional[Role]:
@@ -71,6 +87,18 @@ class RoleCRUD(AbstractBaseCRUD):
             self.session.rollback()
             raise
 
+    def update_many(self, payloads: List[Dict]) -> BatchResult:
+        """Met à jour plusieurs rôles ({"id": ..., champ: valeur}) en une transaction."""
+        return self._update_many(
+            Role, payloads, before_commit=self._invalidate_written
+        )
+
+    def _invalidate_written(self, rows: List[Dict]) -> None:
+        # UPDATE groupé sans flush : noms de rôles recopiés dans les instantanés
+        if rows:
+            entity_cache.invalidate_on_commit(self.session, [entity_cache.ALL])
+            bump_role_generation()
+
     # ---------- DELETE ----------
     def delete_role(self, role_id: int) -> bool:
         """
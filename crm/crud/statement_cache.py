@@ -0,0 +1,52 @@
+"""
+Statements des requêtes fréquentes, construits une seule fois par forme.
+
+Les valeurs passent par des bindparam au moment de l'exécution : le même
+objet Select est réutilisé d'un appel à l'autre, sans reconstruction
+Python, et SQLAlchemy retrouve sa forme compilée dans son propre cache.
+"""
+
+from threading import Lock
+from typing import Callable, Dict, Hashable
+
+from sqlalchemy.sql import Executable
+
+
+class StatementCache:
+    """Statements indexés par forme de requête, avec compteurs hit/miss."""
+
+    def __init__(self):
+        self._statements: Dict[Hashable, Executable] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Executable]) -> Executable:
+        # Lecture et compteurs sous le même verrou : pas d'incrément perdu entre
+        # threads (le coût du verrou est négligeable devant la requête exécutée)
+        with self._lock:
+            statement = self._statements.get(key)
+            if statement is None:
+                self.misses += 1
+                statement = self._statements[key] = build()
+            else:
+                self.hits += 1
+        return statement
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._statements),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Cache partagé par tous les CRUD du processus
+STATEMENTS = StatementCache()
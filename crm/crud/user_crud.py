@@ -1,5 +1,8 @@
-from .base_crud import AbstractBaseCRUD
-from typing import Optional, List, Dict, Any
+from .base_crud import AbstractBaseCRUD, BatchResult
+from . import entity_cache
+from .statement_cache import STATEMENTS
+from typing import Optional, List, Dict, Any, Iterable
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from ..models.user import User
@@ -14,6 +17,10 @@ ALLOWED_UPDATE_FIELDS = {"username", "email", "employee_number"}
 class UserCRUD(AbstractBaseCRUD):
     """CRUD operations pour la gestion des utilisateurs."""
 
+    SORTABLE_FIELDS = frozenset(
+        {"id", "username", "email", "employee_number", "created_at", "updated_at"}
+    )
+
     def __init__(self, session: Session):
         super().__init__(session)
 
@@ -46,11 +53,36 @@ class UserCRUD(AbstractBaseCRUD):
             self.session.rollback()
             raise ValueError(f"Erreur lors de la création de l'utilisateur: {e}") from e
 
+    def create_many(self, payloads: List[Dict[str, Any]]) -> BatchResult:
+        """
+        Crée plusieurs utilisateurs en une transaction.
+        Mêmes règles que create_user : champs whitelistés, 'password' haché.
+        """
+        return self._create_many(
+            User,
+            payloads,
+            prepare=lambda data: self._prepare_user_row(data, ALLOWED_CREATE_FIELDS),
+        )
+
+    @staticmethod
+    def _prepare_user_row(data: Dict[str, Any], allowed: set) -> Dict[str, Any]:
+        payload = {k: v for k, v in data.items() if k in allowed}
+        if "id" in data:
+            payload["id"] = data["id"]
+        pwd = data.get("password")
+        if pwd:
+            probe = User()
+            probe.set_password(pwd)
+            payload["password_hash"] = probe.password_hash
+        return payload
+
     # ---------- READ ----------
     def get_all(
         self,
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
+        *,
+        fields: Optional[Iterable[str]] = None,
     ) -> List[User]:
         """Récupère tous les utilisateurs avec filtres et tri optionnels."""
         return self.get_entities(
@@ -61,11 +93,32 @@ class UserCRUD(AbstractBaseCRUD):
                 # anti N+2
                 selectinload(User.user_roles).selectinload(UserRole.role),
             ),
+            fields=fields,
         )
 
+    def _relationship_options(self, fields: set) -> tuple:
+        if "roles" in fields:
+            return (selectinload(User.user_roles).selectinload(UserRole.role),)
+        return ()
+
     def get_by_id(self, user_id: int) -> Optional[User]:
-        """Récupère un utilisateur par son ID."""
-        return self.session.get(User, user_id)
+        """
+        Récupère un utilisateur par son ID (appelé à chaque action), rôles
+        compris. Servi par le cache processus tant qu'il n'est pas modifié.
+        """
+        statement = STATEMENTS.get(
+            "user.by_id",
+            lambda: select(User)
+            .options(selectinload(User.user_roles).selectinload(UserRole.role))
+            .where(User.id == bindparam("user_id")),
+        )
+        return entity_cache.get_user(
+            self.session,
+            user_id,
+            lambda: self.session.execute(
+                statement, {"user_id": user_id}
+            ).scalar_one_or_none(),
+        )
 
     # ---------- UPDATE ----------
     def update_user(self, user_id: int, user_data: Dict[str, Any]) -> Optional[User]:
@@ -112,6 +165,22 @@ class UserCRUD(AbstractBaseCRUD):
                 f"Erreur lors de la mise à jour du mot de passe: {e}"
             ) from e
 
+    def update_many(self, payloads: List[Dict[str, Any]]) -> BatchResult:
+        """Met à jour plusieurs utilisateurs ({"id": ..., champ: valeur}) en une transaction."""
+        return self._update_many(
+            User,
+            payloads,
+            prepare=lambda data: self._prepare_user_row(data, ALLOWED_UPDATE_FIELDS),
+            before_commit=self._invalidate_written,
+        )
+
+    def _invalidate_written(self, rows: List[Dict[str, Any]]) -> None:
+        # UPDATE groupé sans flush : invalidation des seules lignes écrites
+        entity_cache.invalidate_on_commit(
+            self.session,
+            [key for row in rows for key in entity_cache.user_keys(row["id"])],
+        )
+
     # ---------- DELETE ----------
     def delete_user(self, user_id: int) -> bool:
         """
@@ -174,21 +243,30 @@ class UserCRUD(AbstractBaseCRUD):
 
     def get_user_roles(self, user_id: int) -> List[Role]:
         """Récupère tous les rôles d'un utilisateur."""
-        return (
-            self.session.query(Role)
+        return entity_cache.get_user_roles(
+            self.session,
+            user_id,
+            lambda: self.session.query(Role)
             .join(UserRole, Role.id == UserRole.role_id)
             .filter(UserRole.user_id == user_id)
-            .all()
+            .all(),
         )
 
     def user_has_role_by_id(self, user_id: int, role_id: int) -> bool:
         """Vérifie si un utilisateur a un rôle spécifique (par ID)."""
-        return (
-            self.session.query(UserRole)
-            .filter_by(user_id=user_id, role_id=role_id)
-            .first()
-            is not None
+        statement = STATEMENTS.get(
+            "user.has_role_id",
+            lambda: select(UserRole.user_id)
+            .where(
+                UserRole.user_id == bindparam("user_id"),
+                UserRole.role_id == bindparam("role_id"),
+            )
+            .limit(1),
         )
+        found = self.session.execute(
+            statement, {"user_id": user_id, "role_id": role_id}
+        ).first()
+        return found is not None
 
     def user_has_role_by_name(self, user_id: int, role_name: str) -> bool:
         """Vérifie si un utilisateur a un rôle spécifique (par nom)."""
@@ -1,7 +1,205 @@
+import random
+import time
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, List, Sequence
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from config.settings import get_database_url
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+
+from config.settings import (
+    DB_POOL,
+    READ_REPLICAS,
+    get_async_database_url,
+    get_database_url,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 Base = declarative_base()
-engine = create_engine(get_database_url())
-SessionLocal = sessionmaker(bind=engine)
+
+
+# ---------- Moteurs ----------
+# Créés au premier accès à la base : une commande qui n'en a pas besoin
+# (--help, logout, calibrate) ne charge ni le pilote ni le pool
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """Moteur du primaire, partagé par le processus."""
+    return create_engine(get_database_url(), **DB_POOL)
+
+
+@lru_cache(maxsize=None)
+def get_replica_engines() -> List[Engine]:
+    """Moteurs des réplicas en lecture (liste vide sans DB_REPLICA_URLS)."""
+    return [create_engine(url, **DB_POOL) for url in READ_REPLICAS["urls"]]
+
+
+def __getattr__(name: str) -> Any:
+    # Compatibilité : `from crm.database import engine` crée le moteur à la demande
+    if name == "engine":
+        return get_engine()
+    if name == "replica_engines":
+        return get_replica_engines()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class RoutingSession(Session):
+    """
+    Session qui envoie les SELECT (get_*, listes, filtres, chargements paresseux
+    des sérialiseurs) vers un réplica et tout le reste vers le primaire.
+    Reste sur le primaire :
+    - les écritures (flush, INSERT/UPDATE/DELETE) et les SELECT ... FOR UPDATE ;
+    - toute lecture après une écriture, jusqu'à la fermeture de la session
+      puis pendant `sticky_seconds` (retard de réplication) ;
+    - les lectures faites dans `use_primary()`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        replicas: Sequence[Engine] = (),
+        sticky_seconds: float = 0.0,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+        self.sticky_seconds = sticky_seconds
+        self._wrote = False
+        self._primary_until = 0.0
+        self._force_primary = 0
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, **kw):
+        if bind is None and self.replicas:
+            if self._is_write(clause):
+                self._mark_write()
+            elif isinstance(clause, Select) and not self._pinned():
+                return random.choice(self.replicas)
+        return super().get_bind(mapper, clause=clause, bind=bind, **kw)
+
+    def _is_write(self, clause) -> bool:
+        # SELECT ... FOR UPDATE : intention d'écrire, la suite reste sur le primaire
+        return (
+            self._flushing
+            or isinstance(clause, UpdateBase)
+            or (isinstance(clause, Select) and clause._for_update_arg is not None)
+        )
+
+    def _pinned(self) -> bool:
+        return bool(
+            self._wrote
+            or self._force_primary
+            or time.monotonic() < self._primary_until
+        )
+
+    def _mark_write(self) -> None:
+        self._wrote = True
+        self._primary_until = time.monotonic() + self.sticky_seconds
+
+    @contextmanager
+    def use_primary(self) -> Iterator["RoutingSession"]:
+        """Lectures forcées sur le primaire (données fraîches exigées)."""
+        self._force_primary += 1
+        try:
+            yield self
+        finally:
+            self._force_primary -= 1
+
+    def close(self) -> None:
+        if self._wrote:
+            # Le délai de réplication court à partir de la fin de l'unité de travail
+            self._primary_until = time.monotonic() + self.sticky_seconds
+        self._wrote = False
+        super().close()
+
+
+# Pas d'expiration au commit : une action lit ce qu'elle vient d'écrire sans
+# refresh, et la session est vidée à la fin de chaque action (unit_of_work)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    expire_on_commit=False,
+    sticky_seconds=READ_REPLICAS["sticky_seconds"],
+)
+
+
+def _new_session() -> Session:
+    """Session liée aux moteurs, créés à la première session du processus."""
+    return SessionLocal(bind=get_engine(), replicas=get_replica_engines())
+
+
+# Session unique par thread, partagée par contrôleurs, vues et CRUD
+ScopedSession = scoped_session(_new_session)
+
+
+def get_session() -> Session:
+    """Session partagée du thread courant."""
+    return ScopedSession()
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Session]:
+    """
+    Une action utilisateur. En sortie, la session partagée est fermée :
+    transaction en cours annulée, connexion rendue au pool, identity map vidé.
+    La session reste utilisable par les contrôleurs qui la référencent.
+    """
+    session = get_session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def release_for_input() -> None:
+    """
+    Avant d'attendre une saisie : la transaction de lecture en cours est
+    validée et sa connexion rendue au pool, pour qu'aucune connexion ne reste
+    « idle in transaction » (verrous compris) pendant que l'utilisateur tape.
+    Les objets chargés restent attachés et à jour (pas d'expiration au commit) ;
+    une écriture en attente n'est jamais validée ici.
+    """
+    if not ScopedSession.registry.has():
+        return
+    session = ScopedSession()
+    if not session.in_transaction():
+        return
+    if session.new or session.dirty or session.deleted:
+        return
+    session.commit()
+
+
+def close_session() -> None:
+    """Fin de processus : ferme la session du thread courant et l'oublie."""
+    ScopedSession.remove()
+
+
+# ---------- Accès asynchrone ----------
+# Créé à la première utilisation : le pilote (asyncpg, aiosqlite) est facultatif
+_async_sessionmaker = None
+
+
+def get_async_sessionmaker() -> "async_sessionmaker[AsyncSession]":
+    """
+    Fabrique d'AsyncSession (sans expiration au commit, comme SessionLocal).
+    Une AsyncSession ne supporte pas deux requêtes simultanées : pour des
+    lectures concurrentes (asyncio.gather), une session par tâche.
+    """
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_sessionmaker = async_sessionmaker(
+            create_async_engine(get_async_database_url(), **DB_POOL),
+            expire_on_commit=False,
+        )
+    return _async_sessionmaker
+
+
+@asynccontextmanager
+async def async_unit_of_work() -> AsyncIterator["AsyncSession"]:
+    """Équivalent asynchrone d'unit_of_work : une session, fermée en sortie."""
+    async with get_async_sessionmaker()() as session:
+        yield session
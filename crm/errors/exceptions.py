@@ -8,3 +8,32 @@ class UserCancelledInput(Exception):
         super().__init__(message)
         self.message = message
         AppState.set_neutral_message(self.message)
+
+
+class ConcurrentUpdateError(Exception):
+    """
+    Exception levée lorsqu'un enregistrement a été modifié par un autre utilisateur
+    depuis sa lecture (verrouillage optimiste) : la vue propose de recharger.
+    """
+
+    def __init__(
+        self,
+        message="L'enregistrement a été modifié par un autre utilisateur entre-temps.",
+    ):
+        super().__init__(message)
+        self.message = message
+
+
+class LoginThrottledError(Exception):
+    """
+    Exception levée lorsqu'une connexion est refusée sans vérification du mot
+    de passe : trop d'échecs récents pour cet utilisateur ou ce poste.
+    """
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        self.message = (
+            "Trop de tentatives de connexion. "
+            f"Réessayez dans {max(1, round(retry_after))} s."
+        )
+        super().__init__(self.message)
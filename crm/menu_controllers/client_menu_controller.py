@@ -4,9 +4,10 @@ from ..views.client_view import ClientView
 from ..views.user_view import UserView
 from ..controllers.client_controller import ClientController
 from ..controllers.user_controller import UserController
-from ..auth.permission_config import ROLE_ADMIN, ROLE_SALES
+from ..auth.permission_config import Crud, ROLE_ADMIN, ROLE_SALES
 from ..controllers.filter_controller import FilterController
 from ..utils.validations import Validations
+from ..errors.exceptions import ConcurrentUpdateError
 
 
 class ClientMenuController(AbstractController):
@@ -54,14 +55,8 @@ class ClientMenuController(AbstractController):
         me = self._get_current_user()
         # Vérification des permissions afin de lister les clients qui peuvent être modifiés
         if not client_id:
-            # Peut il tout update ? On liste tous les clients
-            if Permission.update_permission(me, "client"):
-                rows = self.client_ctrl.list_all()
-            # Peut il seulement update ses propres clients ? On liste ses propres clients
-            elif Permission.update_own_permission(me, "client"):
-                rows = self.client_ctrl.list_my_clients()
-            else:
-                raise PermissionError("Accès refusé.")
+            # Clients modifiables : tous, ou seulement les siens (filtré en SQL)
+            rows = self.client_ctrl.list_all(op=Crud.UPDATE)
 
             # Liste pour selectionner le client à modifier
             selected_id = self.view.list_all(rows, selector=True)
@@ -81,12 +76,18 @@ class ClientMenuController(AbstractController):
             return
 
         client_id, payload = result
+        # Version lue avant la saisie : refus si quelqu'un a modifié le client depuis
+        payload["version_id"] = client_dict.get("version_id")
 
         try:
             self.client_ctrl.update_client(client_id, payload)
             self.view.app_state.set_success_message(
                 "Le client a été mis à jour avec succès."
             )
+        except ConcurrentUpdateError as e:
+            if self.view.reload_and_retry(e):
+                return self.show_update_client(client_id)
+            self.view.app_state.set_neutral_message("Modification abandonnée.")
         except Exception as e:
             self.view.app_state.set_error_message(str(e))
 
@@ -7,7 +7,8 @@ from ..controllers.user_controller import UserController
 from ..controllers.client_controller import ClientController
 from ..views.client_view import ClientView
 from ..auth.permission import Permission
-from ..errors.exceptions import UserCancelledInput
+from ..auth.permission_config import Crud
+from ..errors.exceptions import ConcurrentUpdateError, UserCancelledInput
 from decimal import Decimal
 from ..utils.validations import Validations
 
@@ -115,39 +116,43 @@ class ContractMenuController(AbstractController):
         me = self._get_current_user()
 
         if not contract_id:
-            if Permission.update_permission(me, "contract"):
-                rows = self.contract_ctrl.list_all()
-            elif Permission.update_own_permission(me, "contract"):
-                rows = self.contract_ctrl.list_my_contracts()
-            else:
-                raise PermissionError("Accès refusé.")
+            # Périmètre filtré en SQL : tout, ou seulement ses propres lignes
+            rows = self.contract_ctrl.list_all(op=Crud.UPDATE)
 
             selected_id = self.view.list_all(rows, selector=True)
             if selected_id is None:
                 return
             contract_id = selected_id
 
-        owner_id = self.contract_ctrl.get_contract_owner(contract_id).id
-        if not Permission.update_permission(me, "contract", owner_id=owner_id):
-            raise PermissionError("Accès refusé.")
+        try:
+            owner_id = self.contract_ctrl.get_contract_owner(contract_id).id
+            if not Permission.update_permission(me, "contract", owner_id=owner_id):
+                raise PermissionError("Accès refusé.")
 
-        amount_total, amount_due = self.contract_ctrl.get_contract_amounts(contract_id)
+            # Montants et version lus ensemble : le nouveau "restant dû" en dépend
+            amount_total, amount_due, version_id = (
+                self.contract_ctrl.get_contract_amounts(contract_id)
+            )
 
-        if not payment_amount:
-            payment_amount = self.view.add_payment_flow(amount_total, amount_due)
+            if not payment_amount:
+                payment_amount = self.view.add_payment_flow(amount_total, amount_due)
 
-        new_amount_due = amount_due - payment_amount
+            new_amount_due = amount_due - payment_amount
 
-        if new_amount_due < 0:
-            raise ValueError("Le montant total ne peut pas être dépassé.")
+            if new_amount_due < 0:
+                raise ValueError("Le montant total ne peut pas être dépassé.")
 
-        payload = {"amount_due": new_amount_due}
+            payload = {"amount_due": new_amount_due, "version_id": version_id}
 
-        try:
             self.contract_ctrl.update_contract(contract_id, payload)
             self.view.app_state.set_success_message(
                 "Le montant du contrat a été mis à jour avec succès."
             )
+        except ConcurrentUpdateError as e:
+            # Le paiement est réappliqué sur les montants rechargés
+            if self.view.reload_and_retry(e):
+                return self.show_update_contract_amount(contract_id, payment_amount)
+            self.view.app_state.set_neutral_message("Modification abandonnée.")
         except Exception as e:
             self.view.app_state.set_error_message(str(e))
 
@@ -157,12 +162,8 @@ class ContractMenuController(AbstractController):
             raise PermissionError("Accès refusé.")
 
         if not contract_id:
-            if Permission.delete_permission(me, "contract"):
-                rows = self.contract_ctrl.list_all()
-            elif Permission.delete_own_permission(me, "contract"):
-                rows = self.contract_ctrl.list_my_contracts()
-            else:
-                raise PermissionError("Accès refusé.")
+            # Périmètre filtré en SQL : tout, ou seulement ses propres lignes
+            rows = self.contract_ctrl.list_all(op=Crud.DELETE)
 
             selected_id = self.view.list_all(rows, selector=True)
             if selected_id is None:
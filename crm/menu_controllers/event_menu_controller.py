@@ -7,7 +7,9 @@ from ..controllers.contract_controller import ContractController
 from ..views.contract_view import ContractView
 from ..views.user_view import UserView
 from ..auth.permission import Permission
+from ..auth.permission_config import Crud
 from ..utils.validations import Validations
+from ..errors.exceptions import ConcurrentUpdateError
 
 
 class EventMenuController(AbstractController):
@@ -83,12 +85,8 @@ class EventMenuController(AbstractController):
                 raise PermissionError("Accès refusé.")
 
         if not event_id:
-            if Permission.update_permission(me, "event"):
-                rows = self.event_ctrl.list_all()
-            elif Permission.update_own_permission(me, "event"):
-                rows = self.event_ctrl.list_my_events()
-            else:
-                raise PermissionError("Accès refusé.")
+            # Périmètre filtré en SQL : tout, ou seulement ses propres lignes
+            rows = self.event_ctrl.list_all(op=Crud.UPDATE)
 
             selected_id = self.view.list_all(rows, selector=True)
             if selected_id is None:
@@ -100,12 +98,18 @@ class EventMenuController(AbstractController):
 
         if not new_data:
             return
+        # Version lue avant la saisie : refus si quelqu'un a modifié l'événement depuis
+        new_data["version_id"] = event.get("version_id")
 
         try:
             self.event_ctrl.update_event(event_id, new_data)
             self.view.app_state.set_success_message(
                 "L'événement a été mis à jour avec succès."
             )
+        except ConcurrentUpdateError as e:
+            if self.view.reload_and_retry(e):
+                return self.show_update_event(event_id)
+            self.view.app_state.set_neutral_message("Modification abandonnée.")
         except Exception as e:
             self.view.app_state.set_error_message(str(e))
 
@@ -113,23 +117,14 @@ class EventMenuController(AbstractController):
         me = self.event_ctrl._get_current_user()
 
         if not event_id:
-            if Permission.update_permission(me, "event"):
-                rows = self.event_ctrl.list_all()
-            elif Permission.update_own_permission(me, "event"):
-                rows = self.event_ctrl.list_my_events()
-            else:
-                raise PermissionError("Accès refusé.")
+            # Périmètre filtré en SQL : tout, ou seulement ses propres lignes
+            rows = self.event_ctrl.list_all(op=Crud.UPDATE)
 
             selected_id = self.view.list_all(rows, selector=True)
             if selected_id is None:
                 return
             event_id = selected_id
 
-            if not Permission.update_permission(
-                me, "event", owner_id=self.event_ctrl.get_support_contact_id(event_id)
-            ):
-                raise PermissionError("Accès refusé.")
-
         note = self.view.add_event_note_flow()
 
         try:
@@ -144,23 +139,14 @@ class EventMenuController(AbstractController):
         me = self._get_current_user()
 
         if not event_id:
-            if Permission.update_permission(me, "event"):
-                rows = self.event_ctrl.list_all()
-            elif Permission.update_own_permission(me, "event"):
-                rows = self.event_ctrl.list_my_events()
-            else:
-                raise PermissionError("Accès refusé.")
+            # Périmètre filtré en SQL : tout, ou seulement ses propres lignes
+            rows = self.event_ctrl.list_all(op=Crud.UPDATE)
 
             selected_id = self.view.list_all(rows, selector=True)
             if selected_id is None:
                 return
             event_id = selected_id
 
-            if not Permission.update_permission(
-                me, "event", owner_id=self.event_ctrl.get_support_contact_id(event_id)
-            ):
-                raise PermissionError("Accès refusé.")
-
         notes_list = self.event_ctrl.list_event_notes(event_id)
         selected_note_id = self.view.list_notes(notes_list, selector=True)
         if selected_note_id is None:
@@ -182,12 +168,8 @@ class EventMenuController(AbstractController):
             raise PermissionError("Accès refusé.")
 
         if not event_id:
-            if Permission.update_permission(me, "event"):
-                rows = self.event_ctrl.list_all()
-            elif Permission.update_own_permission(me, "event"):
-                rows = self.event_ctrl.list_my_events()
-            else:
-                raise PermissionError("Accès refusé.")
+            # Périmètre filtré en SQL : tout, ou seulement ses propres lignes
+            rows = self.event_ctrl.list_all(op=Crud.UPDATE)
 
             selected_id = self.view.list_all(rows, selector=True)
             if selected_id is None:
@@ -223,12 +205,8 @@ class EventMenuController(AbstractController):
             raise PermissionError("Accès refusé.")
 
         if not event_id:
-            if Permission.delete_permission(me, "event"):
-                rows = self.event_ctrl.list_all()
-            elif Permission.delete_own_permission(me, "event"):
-                rows = self.event_ctrl.list_my_events()
-            else:
-                raise PermissionError("Accès refusé.")
+            # Périmètre filtré en SQL : tout, ou seulement ses propres lignes
+            rows = self.event_ctrl.list_all(op=Crud.DELETE)
 
             selected_id = self.view.list_all(rows, selector=True)
             if selected_id is None:
@@ -1,6 +1,7 @@
 import click
 
 from ..controllers.base import AbstractController
+from ..database import release_for_input
 from ..views.user_view import UserView
 from ..auth.permission import Permission
 from ..auth.auth import Authentication
@@ -59,6 +60,7 @@ class UserMenuController(AbstractController):
         if me.id == int(user_id):
             self.view._clear_screen()
             self.view._print_back_choice()
+            release_for_input()
             password = click.prompt("Ancien mot de passe", hide_input=True)
             try:
                 if not Authentication.verify_password(password, me.password_hash):
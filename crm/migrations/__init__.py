@@ -0,0 +1,17 @@
+from .runner import (
+    Migration,
+    current_version,
+    load_migrations,
+    migrate,
+    pending_migrations,
+    stamp,
+)
+
+__all__ = [
+    "Migration",
+    "current_version",
+    "load_migrations",
+    "migrate",
+    "pending_migrations",
+    "stamp",
+]
@@ -0,0 +1,151 @@
+"""Migrations de schéma versionnées (sans dépendance externe)."""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import ModuleType
+from typing import Callable, List, Optional
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+
+_MODULE_PATTERN = re.compile(r"^v(\d{4})_\w+$")
+
+# Table de suivi, volontairement hors des métadonnées des modèles
+_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+    # False : exécutée hors transaction (ex. CREATE INDEX CONCURRENTLY)
+    transactional: bool = True
+
+
+def _from_module(module: ModuleType, version: int) -> Migration:
+    return Migration(
+        version=version,
+        description=getattr(module, "DESCRIPTION", module.__name__),
+        upgrade=module.upgrade,
+        transactional=getattr(module, "TRANSACTIONAL", True),
+    )
+
+
+def load_migrations() -> List[Migration]:
+    """Découvre les modules `vNNNN_*.py` du package, triés par version."""
+    from . import __path__ as package_path, __name__ as package_name
+
+    migrations = []
+    for info in pkgutil.iter_modules(package_path):
+        match = _MODULE_PATTERN.match(info.name)
+        if match:
+            module = importlib.import_module(f"{package_name}.{info.name}")
+            migrations.append(_from_module(module, int(match.group(1))))
+    return sorted(migrations, key=lambda m: m.version)
+
+
+def applied_versions(engine: Engine) -> set[int]:
+    _metadata.create_all(engine)
+    with engine.connect() as conn:
+        return set(conn.scalars(select(schema_version.c.version)))
+
+
+def current_version(engine: Engine) -> int:
+    return max(applied_versions(engine), default=0)
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    done = applied_versions(engine)
+    return [m for m in load_migrations() if m.version not in done]
+
+
+def _record(conn: Connection, migration: Migration) -> None:
+    conn.execute(
+        insert(schema_version).values(
+            version=migration.version,
+            description=migration.description,
+            applied_at=datetime.now(timezone.utc),
+        )
+    )
+
+
+def migrate(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """Applique les migrations en attente (jusqu'à `target` inclus)."""
+    applied = []
+    for migration in pending_migrations(engine):
+        if target is not None and migration.version > target:
+            break
+
+        if migration.transactional:
+            with engine.begin() as conn:
+                migration.upgrade(conn)
+                _record(conn, migration)
+        else:
+            # Les migrations non transactionnelles doivent être idempotentes :
+            # en cas d'échec, elles sont simplement rejouées.
+            with engine.connect() as conn:
+                conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+                migration.upgrade(conn)
+            with engine.begin() as conn:
+                _record(conn, migration)
+        applied.append(migration)
+    return applied
+
+
+# ---------- Helpers pour les migrations ----------
+def create_index(
+    conn: Connection, name: str, table: str, columns: str, where: Optional[str] = None
+) -> None:
+    """
+    CREATE INDEX idempotent ; sur PostgreSQL, construit CONCURRENTLY
+    (connexion en AUTOCOMMIT requise, cf. TRANSACTIONAL = False).
+    """
+    postgres = conn.dialect.name == "postgresql"
+    if postgres:
+        # Un CONCURRENTLY interrompu laisse un index INVALID : on le reconstruit
+        invalid = conn.execute(
+            text(
+                "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ),
+            {"name": name},
+        ).first()
+        if invalid:
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+    concurrently = "CONCURRENTLY " if postgres else ""
+    sql = f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {table} ({columns})"
+    if where:
+        sql += f" WHERE {where}"
+    conn.execute(text(sql))
+
+
+def stamp(engine: Engine) -> None:
+    """Marque toutes les migrations comme appliquées (base créée par create_all)."""
+    pending = pending_migrations(engine)
+    with engine.begin() as conn:
+        for migration in pending:
+            _record(conn, migration)
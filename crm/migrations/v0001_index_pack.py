@@ -0,0 +1,29 @@
+"""Index des clés étrangères et des colonnes filtrées."""
+
+from sqlalchemy.engine import Connection
+
+from .runner import create_index
+
+DESCRIPTION = "Index des clés étrangères, filtres et index partiels"
+
+# CREATE INDEX CONCURRENTLY est interdit dans une transaction
+TRANSACTIONAL = False
+
+# (nom, table, colonnes, prédicat d'index partiel)
+INDEXES = [
+    ("ix_clients_sales_contact_id", "clients", "sales_contact_id", None),
+    ("ix_contracts_client_id", "contracts", "client_id", None),
+    ("ix_contracts_is_signed", "contracts", "is_signed", None),
+    ("ix_contracts_unsigned", "contracts", "client_id", "is_signed = false"),
+    ("ix_contracts_unpaid", "contracts", "client_id", "amount_due > 0"),
+    ("ix_events_contract_id", "events", "contract_id", None),
+    ("ix_events_support_contact_id", "events", "support_contact_id", None),
+    ("ix_events_date_start", "events", "date_start", None),
+    ("ix_event_notes_event_id", "event_notes", "event_id", None),
+    ("ix_user_roles_role_id", "user_roles", "role_id", None),
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for name, table, columns, where in INDEXES:
+        create_index(conn, name, table, columns, where)
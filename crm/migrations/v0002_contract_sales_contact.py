@@ -0,0 +1,41 @@
+"""Colonne dénormalisée contracts.sales_contact_id."""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+from .runner import create_index
+
+DESCRIPTION = "contracts.sales_contact_id dénormalisé (backfill + index)"
+
+TRANSACTIONAL = False
+
+# Backfill par fenêtres d'id : pas de verrou long sur une grosse table
+BACKFILL_WINDOW = 10_000
+
+
+def upgrade(conn: Connection) -> None:
+    columns = {c["name"] for c in inspect(conn).get_columns("contracts")}
+    if "sales_contact_id" not in columns:
+        conn.execute(
+            text(
+                "ALTER TABLE contracts ADD COLUMN sales_contact_id INTEGER "
+                "REFERENCES users(id) ON DELETE SET NULL"
+            )
+        )
+
+    low, high = conn.execute(text("SELECT MIN(id), MAX(id) FROM contracts")).one()
+    if low is not None:
+        for start in range(low, high + 1, BACKFILL_WINDOW):
+            conn.execute(
+                text(
+                    "UPDATE contracts SET sales_contact_id = ("
+                    " SELECT clients.sales_contact_id FROM clients"
+                    " WHERE clients.id = contracts.client_id"
+                    ") WHERE id >= :start AND id < :stop"
+                ),
+                {"start": start, "stop": start + BACKFILL_WINDOW},
+            )
+
+    create_index(
+        conn, "ix_contracts_sales_contact_id", "contracts", "sales_contact_id"
+    )
@@ -0,0 +1,22 @@
+"""Colonnes version_id du verrouillage optimiste (clients, contrats, événements)."""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+DESCRIPTION = "version_id sur clients, contracts et events (verrouillage optimiste)"
+
+VERSIONED_TABLES = ("clients", "contracts", "events")
+
+
+def upgrade(conn: Connection) -> None:
+    inspector = inspect(conn)
+    for table in VERSIONED_TABLES:
+        columns = {c["name"] for c in inspector.get_columns(table)}
+        if "version_id" in columns:
+            continue
+        # Défaut constant : pas de réécriture de la table sur PostgreSQL >= 11
+        conn.execute(
+            text(
+                f"ALTER TABLE {table} ADD COLUMN version_id INTEGER NOT NULL DEFAULT 1"
+            )
+        )
@@ -1,9 +1,10 @@
 import datetime
 
 from ..database import Base
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 from sqlalchemy import (
     DateTime,
+    Integer,
 )
 from functools import partial
 
@@ -12,6 +13,17 @@ utcnow = partial(datetime.datetime.now, datetime.timezone.utc)
 
 class AbstractBase(Base):
     __abstract__ = True
+    # Verrouillage optimiste, activé par le mixin Versioned
+    __versioned__ = False
+
+    @declared_attr.directive
+    def __mapper_args__(cls):
+        # Valeurs générées côté serveur relues par RETURNING (pas de refresh)
+        args = {"eager_defaults": True}
+        if cls.__versioned__:
+            # UPDATE ... WHERE version_id = <version lue> : 0 ligne => conflit
+            args["version_id_col"] = cls.__table__.c.version_id
+        return args
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
@@ -25,3 +37,16 @@ class AbstractBase(Base):
         onupdate=utcnow,
         nullable=False,
     )
+
+
+class Versioned:
+    """
+    Mixin de verrouillage optimiste : `version_id` est incrémenté à chaque UPDATE
+    et vérifié dans sa clause WHERE. À placer avant AbstractBase dans les bases.
+    """
+
+    __versioned__ = True
+
+    version_id: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
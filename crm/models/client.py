@@ -13,10 +13,10 @@ from sqlalchemy.sql import select
 from ..models.user import User
 from ..utils.validations import Validations
 
-from .base import AbstractBase
+from .base import AbstractBase, Versioned
 
 
-class Client(AbstractBase):
+class Client(Versioned, AbstractBase):
     __tablename__ = "clients"
     __table_args__ = (CheckConstraint("email != ''", name="check_client_email"),)
 
@@ -27,7 +27,7 @@ class Client(AbstractBase):
 
     # Many Client to One User
     sales_contact_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
     )
 
     sales_contact = relationship("User", back_populates="clients")
@@ -76,8 +76,3 @@ class Client(AbstractBase):
         Validations.validate_phone(value)
 
         return value
-
-    try:
-        from ..tests.conftest import TestingBase as BaseForTests
-    except ImportError:
-        from .base import AbstractBase as BaseForTests
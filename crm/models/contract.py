@@ -5,33 +5,67 @@ from sqlalchemy import (
     Boolean,
     Integer,
 )
-from sqlalchemy.orm import relationship, validates, Mapped, mapped_column, aliased
-from sqlalchemy import CheckConstraint, case
+from typing import Dict, Optional
+
+from sqlalchemy.orm import (
+    relationship,
+    validates,
+    Mapped,
+    mapped_column,
+    Session,
+    attributes,
+)
+from sqlalchemy import CheckConstraint, Index, case, event, text, update
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import select
 
 
-from .base import AbstractBase
+from .base import AbstractBase, Versioned, utcnow
 from decimal import Decimal
 from ..models.client import Client
 from ..models.user import User
 
 
-class Contract(AbstractBase):
+class Contract(Versioned, AbstractBase):
     __tablename__ = "contracts"
     __table_args__ = (
         CheckConstraint("amount_due <= amount_total", name="check_amount_due"),
+        # Index partiels : contrats non signés / non soldés (cf. migration 0001)
+        Index(
+            "ix_contracts_unsigned",
+            "client_id",
+            postgresql_where=text("is_signed = false"),
+            sqlite_where=text("is_signed = false"),
+        ),
+        Index(
+            "ix_contracts_unpaid",
+            "client_id",
+            postgresql_where=text("amount_due > 0"),
+            sqlite_where=text("amount_due > 0"),
+        ),
     )
 
     client_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
     amount_total: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     amount_due: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
-    is_signed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    is_signed: Mapped[bool] = mapped_column(
+        Boolean, default=False, nullable=False, index=True
+    )
+
+    # Copie dénormalisée de clients.sales_contact_id, maintenue par les
+    # événements de session ci-dessous (et par les CRUD pour les écritures groupées)
+    sales_contact_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
+    )
 
     client = relationship("Client", back_populates="contracts")
+    sales_contact = relationship("User", viewonly=True)
     event = relationship("Event", back_populates="contract", uselist=False)
 
     # Type ignore car l'IDE ne comprend pas qu'ils doivent avoir le même nom
@@ -50,33 +84,18 @@ class Contract(AbstractBase):
 
     @hybrid_property
     def sales_contact_name(self):  # type: ignore
-        return (
-            self.client.sales_contact.username
-            if self.client.sales_contact
-            else "Aucun contact"
-        )
+        # Relation déjà chargée en priorité : pas de lazy load supplémentaire
+        if "sales_contact" in self.__dict__ or "client" not in self.__dict__:
+            user = self.sales_contact
+        else:
+            user = self.client.sales_contact
+        return user.username if user else "Aucun contact"
 
     @sales_contact_name.expression
     def sales_contact_name(cls):
-        ClientAlias = aliased(Client)
         return (
             select(User.username)
-            .join(ClientAlias, ClientAlias.sales_contact_id == User.id)
-            .where(ClientAlias.id == cls.client_id)
-            .correlate(cls)
-            .scalar_subquery()
-        )
-
-    @hybrid_property
-    def sales_contact_id(self):  # type: ignore
-        return self.client.sales_contact_id if self.client else None
-
-    @sales_contact_id.expression
-    def sales_contact_id(cls):
-        ClientAlias = aliased(Client)
-        return (
-            select(ClientAlias.sales_contact_id)
-            .where(ClientAlias.id == cls.client_id)
+            .where(User.id == cls.sales_contact_id)
             .correlate(cls)
             .scalar_subquery()
         )
@@ -132,7 +151,80 @@ class Contract(AbstractBase):
 
         return value
 
-    try:
-        from ..tests.conftest import TestingBase as BaseForTests
-    except ImportError:
-        from .base import AbstractBase as BaseForTests
+
+# ---------- Dénormalisation de sales_contact_id ----------
+def _client_owner(session: Session, contract: Contract) -> Optional[int]:
+    """Commercial du client du contrat (client affecté ou client_id)."""
+    client = None
+    if contract.client_id is not None and (
+        contract.client is None
+        or attributes.get_history(contract, "client_id").has_changes()
+    ):
+        with session.no_autoflush:
+            client = session.get(Client, contract.client_id)
+    if client is None:
+        client = contract.client
+    if client is None:
+        return None
+    if client.sales_contact_id is None and client.sales_contact is not None:
+        return client.sales_contact.id
+    return client.sales_contact_id
+
+
+def sync_sales_contact(session: Session, owners: Dict[int, Optional[int]]) -> None:
+    """
+    Reporte {client_id: sales_contact_id} sur contracts.sales_contact_id :
+    un UPDATE par commercial, qui incrémente aussi version_id et updated_at
+    (le verrou optimiste voit le changement), puis expiration des contrats
+    déjà chargés (relus à leur prochain accès).
+    """
+    if not owners:
+        return
+
+    by_owner: Dict[Optional[int], list] = {}
+    for client_id, owner_id in owners.items():
+        by_owner.setdefault(owner_id, []).append(client_id)
+
+    table = Contract.__table__
+    connection = session.connection()
+    now = utcnow()
+    for owner_id, client_ids in by_owner.items():
+        connection.execute(
+            update(table)
+            .where(table.c.client_id.in_(client_ids))
+            .values(
+                sales_contact_id=owner_id,
+                version_id=table.c.version_id + 1,
+                updated_at=now,
+            )
+        )
+
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, Contract) and obj.client_id in owners:
+            session.expire(obj)
+
+
+@event.listens_for(Session, "before_flush")
+def _derive_contract_sales_contact(session, flush_context, instances):
+    """Nouveau contrat ou changement de client : recopie le commercial du client."""
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, Contract):
+            continue
+        if (
+            obj in session.new
+            or attributes.get_history(obj, "client_id").has_changes()
+            or attributes.get_history(obj, "client").has_changes()
+        ):
+            obj.sales_contact_id = _client_owner(session, obj)
+
+
+@event.listens_for(Session, "after_flush")
+def _propagate_client_reassignment(session, flush_context):
+    """Client réaffecté : reporte le nouveau commercial sur ses contrats."""
+    owners = {
+        obj.id: obj.sales_contact_id
+        for obj in session.dirty
+        if isinstance(obj, Client)
+        and attributes.get_history(obj, "sales_contact_id").has_changes()
+    }
+    sync_sales_contact(session, owners)
@@ -22,23 +22,28 @@ from sqlalchemy import CheckConstraint, case
 from ..models.user import User
 from ..utils.validations import Validations
 
-from .base import AbstractBase
+from .base import AbstractBase, Versioned
 
 
-class Event(AbstractBase):
+class Event(Versioned, AbstractBase):
     __tablename__ = "events"
     __table_args__ = (
         CheckConstraint("date_end > date_start", name="check_event_dates"),
     )
 
     contract_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("contracts.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("contracts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     support_contact_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
     )
 
-    date_start: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+    date_start: Mapped[datetime.datetime] = mapped_column(
+        DateTime, nullable=False, index=True
+    )
     date_end: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
     location: Mapped[str] = mapped_column(String(300))
     attendees: Mapped[int] = mapped_column(Integer)
@@ -109,17 +114,12 @@ class Event(AbstractBase):
 
         return value
 
-    try:
-        from ..tests.conftest import TestingBase as BaseForTests
-    except ImportError:
-        from .base import AbstractBase as BaseForTests
-
 
 class EventNote(AbstractBase):
     __tablename__ = "event_notes"
 
     event_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True
     )
     note: Mapped[str] = mapped_column(String(2048), nullable=False)
 
@@ -127,8 +127,3 @@ class EventNote(AbstractBase):
 
     def __repr__(self) -> str:
         return f"<EventNote(id={self.id}, event_id={self.event_id})>"
-
-    try:
-        from ..tests.conftest import TestingBase as BaseForTests
-    except ImportError:
-        from .base import AbstractBase as BaseForTests
@@ -21,8 +21,3 @@ class Role(Base):
 
     def __repr__(self) -> str:
         return f"<Role(id={self.id}, name='{self.name}')>"
-
-    try:
-        from ..tests.conftest import TestingBase as BaseForTests
-    except ImportError:
-        from .base import AbstractBase as BaseForTests
@@ -1,6 +1,3 @@
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
-
 from sqlalchemy import (
     Integer,
     String,
@@ -8,15 +5,10 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import relationship, Session, Mapped, mapped_column, validates
 from .base import AbstractBase
+from ..auth.hasher import PASSWORD_HASHER
 from .role import Role
 from .user_role import UserRole
 
-ph = PasswordHasher(
-    time_cost=3,  # nombre d'itérations
-    memory_cost=65536,  # mémoire utilisée en KB (64MB ici)
-    parallelism=4,  # threads
-)
-
 
 class User(AbstractBase):
     __tablename__ = "users"
@@ -47,17 +39,10 @@ class User(AbstractBase):
     def set_password(self, raw_password: str) -> None:
         if not isinstance(raw_password, str) or not raw_password:
             raise ValueError("Le mot de passe ne peut pas être vide.")
-        self.password_hash = ph.hash(raw_password)
+        self.password_hash = PASSWORD_HASHER.hash(raw_password)
 
     def verify_password(self, raw_password: str) -> bool:
-        try:
-            # Comme password_hash est typé comme String, on s'assure qu'il est traité comme tel
-            hash_value = (
-                str(self.password_hash) if self.password_hash is not None else ""
-            )
-            return ph.verify(hash_value, raw_password)
-        except VerifyMismatchError:
-            return False
+        return PASSWORD_HASHER.verify(self.password_hash, raw_password)
 
     def has_role(self, role: "Role") -> bool:
         return any(user_role.role_id == role.id for user_role in self.user_roles)
@@ -107,8 +92,3 @@ class User(AbstractBase):
             f"<User(id={self.id}, username='{self.username}', "
             f"employee_number={self.employee_number}, roles=[{role_names}])>"
         )
-
-    try:
-        from ..tests.conftest import TestingBase as BaseForTests
-    except ImportError:
-        from .base import AbstractBase as BaseForTests
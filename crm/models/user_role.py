@@ -23,6 +23,7 @@ class UserRole(Base):
         ForeignKey("roles.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
+        index=True,  # la PK (user_id, role_id) ne sert pas les recherches par rôle
     )
 
     user = relationship("User", back_populates="user_roles")
@@ -30,8 +31,3 @@ class UserRole(Base):
 
     def __repr__(self) -> str:
         return f"<UserRole(user_id={self.user_id}, role_id={self.role_id})>"
-
-    try:
-        from ..tests.conftest import TestingBase as BaseForTests
-    except ImportError:
-        from .base import AbstractBase as BaseForTests
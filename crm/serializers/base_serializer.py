@@ -0,0 +1,163 @@
+"""
+Sérialiseurs compilés : le plan d'un (modèle, ensemble de champs) est calculé
+une seule fois, puis réutilisé pour chaque ligne.
+
+Un plan est un tuple plat (nom, getter) : attrgetter pour une colonne,
+composé avec la conversion ISO 8601 seulement si le type de la colonne est une
+date ; getter protégé (valeur par défaut) pour un champ calculé. Sérialiser
+une ligne revient à une compréhension de dict sur ce tuple.
+
+Les données lues en base ont déjà été validées à l'écriture : les validations
+(email, téléphone, montants...) ne sont rejouées qu'en mode strict
+(`strict=True`, ou SERIALIZER_STRICT=1 pour tout le processus), utile pour
+auditer une base alimentée par d'autres moyens que le CRM. Les listes des
+contrôleurs (list_all / list_page) ne passent pas par ici : elles sont lues
+directement en dicts de même forme (AbstractBaseCRUD.select_rows).
+"""
+
+import threading
+from datetime import date, time
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from config.settings import SERIALIZER_STRICT
+from ..utils.validations import Validations
+
+Getter = Callable[[Any], Any]
+Plan = Tuple[Tuple[str, Getter], ...]
+
+# (classe du sérialiseur, classe du modèle, champs) -> plan
+_PLANS: Dict[Tuple[type, type, FrozenSet[str]], Plan] = {}
+_PLANS_LOCK = threading.Lock()
+
+
+def to_iso(value: Any) -> Any:
+    """Convertit datetime/date en ISO 8601 si applicable."""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def to_iso_deep(value: Any) -> Any:
+    """to_iso, appliqué aussi aux éléments des listes et dictionnaires."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [to_iso_deep(x) for x in value]
+    if isinstance(value, dict):
+        return {k: to_iso_deep(x) for k, x in value.items()}
+    return value
+
+
+def _column_converter(column: Any) -> Optional[Callable[[Any], Any]]:
+    """Conversion d'une colonne : aucune si son type Python n'est pas une date."""
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        # Type inconnu : conversion décidée valeur par valeur
+        return to_iso
+    return to_iso if issubclass(python_type, (date, time)) else None
+
+
+def _column_getter(name: str, convert: Optional[Callable[[Any], Any]]) -> Getter:
+    get = attrgetter(name)
+    if convert is None:
+        return get
+    return lambda obj: convert(get(obj))
+
+
+def _computed_getter(
+    getter: Getter, default: Any, convert: Callable[[Any], Any]
+) -> Getter:
+    if default is None:
+        return lambda obj: convert(getter(obj))
+
+    def get(obj: Any) -> Any:
+        try:
+            value = getter(obj)
+        except Exception:
+            value = None
+        return convert(default if value is None else value)
+
+    return get
+
+
+class BaseSerializer:
+    """Base des sérialiseurs : colonnes whitelistées + champs calculés."""
+
+    PUBLIC_FIELDS: FrozenSet[str] = frozenset()
+    COMPUTED_FIELDS: Dict[str, Getter] = {}
+    # Colonnes jamais exposées, même demandées explicitement
+    EXCLUDED_FIELDS: FrozenSet[str] = frozenset()
+    # Mode strict : champ -> (méthode de Validations, arguments nommés)
+    VALIDATORS: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    # Relations lues par les champs calculés ("relation.sous_relation") : les
+    # CRUD en déduisent les eager-loads (cf. crud.base_crud.loader_options)
+    RELATIONSHIPS: Dict[str, Tuple[str, ...]] = {}
+    # Valeur d'un champ calculé vide ou en erreur (None : erreur propagée)
+    COMPUTED_DEFAULT: Optional[str] = "Aucun"
+    CONVERT: Callable[[Any], Any] = staticmethod(to_iso)
+
+    def __init__(self, fields: Iterable[str], strict: Optional[bool] = None):
+        self.fields = set(fields)
+        self.strict = SERIALIZER_STRICT if strict is None else strict
+        self.valid = Validations()
+        self._key = frozenset(self.fields - self.EXCLUDED_FIELDS)
+        self._plans: Dict[type, Plan] = {}
+        # Relations nécessaires à ce jeu de champs, à passer aux lectures CRUD
+        self.relationships = frozenset(
+            path
+            for name, paths in self.RELATIONSHIPS.items()
+            if name in self._key
+            for path in paths
+        )
+        self._checks = tuple(
+            (name, method, kwargs)
+            for name, (method, kwargs) in self.VALIDATORS.items()
+            if name in self._key
+        )
+
+    def serialize(self, obj: Any, extra: Optional[Dict[str, Any]] = None) -> Dict:
+        if obj is None:
+            return {}
+        if self.strict:
+            self._validate(obj)
+        plan = self._plans.get(type(obj)) or self._plan(obj)
+        data = {name: get(obj) for name, get in plan}
+        if extra:
+            data.update(extra)
+        return data
+
+    def serialize_list(self, objs: Iterable[Any]) -> List[Dict[str, Any]]:
+        serialize = self.serialize
+        return [serialize(obj) for obj in objs]
+
+    def _validate(self, obj: Any) -> None:
+        for name, method, kwargs in self._checks:
+            getattr(self.valid, method)(getattr(obj, name), **kwargs)
+
+    def _plan(self, obj: Any) -> Plan:
+        model = type(obj)
+        key = (type(self), model, self._key)
+        plan = _PLANS.get(key)
+        if plan is None:
+            with _PLANS_LOCK:
+                plan = _PLANS.get(key)
+                if plan is None:
+                    plan = _PLANS[key] = self._compile(obj.__table__.columns)
+        self._plans[model] = plan
+        return plan
+
+    def _compile(self, columns: Iterable[Any]) -> Plan:
+        """Colonnes dans l'ordre de la table, puis champs calculés."""
+        fields = self._key
+        plan = [
+            (col.name, _column_getter(col.name, _column_converter(col)))
+            for col in columns
+            if col.name in fields
+        ]
+        plan.extend(
+            (name, _computed_getter(getter, self.COMPUTED_DEFAULT, self.CONVERT))
+            for name, getter in self.COMPUTED_FIELDS.items()
+            if name in fields
+        )
+        return tuple(plan)
+
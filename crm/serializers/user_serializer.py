@@ -1,10 +1,10 @@
 # crm/serializers/user_serializer.py
-from typing import Any, Dict, List, Iterable, Optional
+from typing import Any, Iterable, List, Dict, Optional
 from crm.models.user import User
-from ..utils.validations import Validations
+from .base_serializer import BaseSerializer
 
 
-class UserSerializer:
+class UserSerializer(BaseSerializer):
     """Sérialise les objets User sans exposer le mot de passe."""
 
     PUBLIC_USER_FIELDS = {
@@ -16,23 +16,38 @@ class UserSerializer:
         "updated_at",
         "roles",
     }
+    PUBLIC_FIELDS = PUBLIC_USER_FIELDS
+
+    EXCLUDED_FIELDS = frozenset({"password", "password_hash"})
+
+    # Validations rejouées en mode strict uniquement
+    VALIDATORS = {
+        "email": ("validate_email", {}),
+        "employee_number": ("validate_int_max_length", {}),
+        "username": ("validate_str_max_length", {}),
+    }
+
+    # Une erreur de chargement des rôles n'est pas masquée
+    COMPUTED_DEFAULT = None
 
     def __init__(
-        self, *, fields: Optional[Iterable[str]] = None, include_roles: bool = True
+        self,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        include_roles: bool = True,
+        strict: Optional[bool] = None,
     ):
         """
         Args:
             fields: Liste des champs à exposer (défaut: PUBLIC_USER_FIELDS)
             include_roles: Inclure la clé 'roles' (liste de noms) si True
+            strict: Rejouer les validations à la lecture (défaut: SERIALIZER_STRICT)
         """
-        self.fields = set(fields) if fields else set(self.PUBLIC_USER_FIELDS)
+        fields = set(fields) if fields else set(self.PUBLIC_USER_FIELDS)
+        if not include_roles:
+            fields.discard("roles")
         self.include_roles = include_roles
-        self.valid = Validations()
-
-    @staticmethod
-    def _to_iso(value: Any) -> Any:
-        """Convertit datetime/date en ISO 8601 si applicable."""
-        return value.isoformat() if hasattr(value, "isoformat") else value
+        super().__init__(fields, strict)
 
     @staticmethod
     def _extract_roles_from_user_roles(user: "User") -> List[str]:
@@ -46,37 +61,10 @@ class UserSerializer:
                     names.append(getattr(role, "name", str(role)))
         return names
 
-    def serialize(
-        self, user: User, extra: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        if user is None:
-            return {}
-
-        data: Dict[str, Any] = {}
-
-        # Colonnes SQL whitelistees
-        for col in user.__table__.columns:
-            name = col.name
-            if name in {"password", "password_hash"}:
-                continue
-            if name in self.fields:
-                # Validations
-                if name == "email":
-                    self.valid.validate_email(getattr(user, name))
-                if name == "employee_number":
-                    self.valid.validate_int_max_length(getattr(user, name))
-                if name == "username":
-                    self.valid.validate_str_max_length(getattr(user, name))
-                data[name] = self._to_iso(getattr(user, name))
-
-        # Champ calculé roles (via user_roles/role)
-        if self.include_roles and "roles" in self.fields:
-            data["roles"] = self._extract_roles_from_user_roles(user)
-
-        if extra:
-            data.update(extra)
-
-        return data
+    # Champ calculé roles (via user_roles/role)
+    COMPUTED_FIELDS = {"roles": _extract_roles_from_user_roles.__func__}
+    RELATIONSHIPS = {"roles": ("user_roles.role",)}
 
-    def serialize_list(self, users: List["User"]) -> List[Dict[str, Any]]:
-        return [self.serialize(u) for u in users if u is not None]
+    def serialize_list(self, users: Iterable["User"]) -> List[Dict[str, Any]]:
+        serialize = self.serialize
+        return [serialize(u) for u in users if u is not None]
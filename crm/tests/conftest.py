@@ -188,6 +188,55 @@ def db_session(engine):
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def empty_entity_cache():
+    """Cache processus User/Role vidé : chaque test a sa propre base."""
+    from crm.crud.entity_cache import ENTITY_CACHE_STORE
+
+    ENTITY_CACHE_STORE.clear()
+    yield
+    ENTITY_CACHE_STORE.clear()
+
+
+@pytest.fixture(autouse=True)
+def empty_principal_cache():
+    """Principal mémorisé oublié : aucun test n'hérite de l'authentification d'un autre."""
+    from crm.auth.principal_cache import PRINCIPAL
+
+    PRINCIPAL.clear()
+    yield
+    PRINCIPAL.clear()
+
+
+@pytest.fixture(autouse=True)
+def jti_store(tmp_path, monkeypatch):
+    """Magasin de JTI propre au test (tmp_path) à la place du magasin partagé."""
+    from crm.auth import jti_manager
+
+    store = jti_manager.SQLiteJTIStore(tmp_path / "valid_jtis.db")
+    monkeypatch.setattr(jti_manager, "_store", store)
+    yield store
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def empty_login_throttle(tmp_path, monkeypatch):
+    """
+    Limiteur propre au test (tmp_path) à la place du limiteur partagé : aucun
+    test n'est bloqué par un autre ni n'efface les échecs réels.
+    """
+    from crm.auth import throttle
+    from crm.auth.config import LOGIN_THROTTLE
+
+    limiter = throttle.LoginThrottle(
+        **{**LOGIN_THROTTLE, "path": tmp_path / "login_attempts.db"}
+    )
+    monkeypatch.setattr(throttle, "_throttle", limiter)
+    yield limiter
+    limiter.close()
+
+
+
 @pytest.fixture(autouse=True)
 def bypass_auth(monkeypatch, db_session, request):
     """
@@ -0,0 +1,129 @@
+import asyncio
+import inspect
+
+import pytest
+from sqlalchemy import create_engine
+
+from crm.crud.async_crud import (
+    AsyncClientCRUD,
+    AsyncEventCRUD,
+    AsyncUserCRUD,
+)
+from crm.crud.client_crud import ClientCRUD
+from crm.crud.event_crud import EventCRUD
+from crm.crud.user_crud import UserCRUD
+from crm.errors.exceptions import ConcurrentUpdateError
+from crm.models.base import AbstractBase
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+
+@pytest.fixture
+def maker(tmp_path):
+    # Fichier partagé : chaque connexion aiosqlite voit les mêmes données
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    AbstractBase.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    yield async_sessionmaker(async_engine, expire_on_commit=False)
+    asyncio.run(async_engine.dispose())
+
+
+def _client_data(email, **extra):
+    return {
+        "full_name": "Client Async",
+        "email": email,
+        "phone": "0102030405",
+        "company_name": "AsyncCorp",
+        **extra,
+    }
+
+
+@pytest.mark.parametrize(
+    "async_cls, sync_cls",
+    [
+        (AsyncClientCRUD, ClientCRUD),
+        (AsyncEventCRUD, EventCRUD),
+        (AsyncUserCRUD, UserCRUD),
+    ],
+)
+def test_same_public_surface(async_cls, sync_cls):
+    public = {
+        name
+        for name, _ in inspect.getmembers(sync_cls, inspect.isfunction)
+        if not name.startswith("_")
+    }
+    for name in public:
+        assert inspect.iscoroutinefunction(getattr(async_cls, name)), name
+
+
+def test_create_then_read(maker):
+    async def scenario():
+        async with maker() as session:
+            crud = AsyncClientCRUD(session)
+            created = await crud.create_client(_client_data("a@example.com"))
+            fetched = await crud.get_by_id(created.id)
+            page = await crud.paginate(limit=10)
+            return created, fetched, page
+
+    created, fetched, page = asyncio.run(scenario())
+
+    assert fetched.email == "a@example.com"
+    assert [c.id for c in page.items] == [created.id]
+
+
+def test_independent_reads_under_gather(maker):
+    async def scenario():
+        async with maker() as session:
+            user = await AsyncUserCRUD(session).create_user(
+                {
+                    "employee_number": 1,
+                    "username": "sales",
+                    "email": "sales@test.com",
+                    "password": "Password123!",
+                }
+            )
+            await AsyncClientCRUD(session).create_many(
+                [
+                    _client_data(f"c{i}@example.com", sales_contact_id=user.id)
+                    for i in range(3)
+                ]
+            )
+
+        # Une session par tâche : les lectures s'exécutent en parallèle
+        async with maker() as s1, maker() as s2, maker() as s3:
+            return await asyncio.gather(
+                AsyncClientCRUD(s1).get_all(),
+                AsyncClientCRUD(s2).get_clients_by_sales_contact(user.id),
+                AsyncUserCRUD(s3).get_by_id(user.id),
+            )
+
+    clients, owned, user = asyncio.run(scenario())
+
+    assert len(clients) == 3
+    assert {c.id for c in owned} == {c.id for c in clients}
+    assert user.username == "sales"
+
+
+def test_stale_save_rejected(maker):
+    async def scenario():
+        async with maker() as session:
+            created = await AsyncClientCRUD(session).create_client(
+                _client_data("v@example.com")
+            )
+        async with maker() as first, maker() as second:
+            mine = await AsyncClientCRUD(first).get_for_update(created.id)
+            version = mine.version_id
+            await AsyncClientCRUD(first).save(mine, {"company_name": "Nouvelle"})
+
+            theirs = await AsyncClientCRUD(second).get_for_update(created.id)
+            with pytest.raises(ConcurrentUpdateError):
+                await AsyncClientCRUD(second).save(
+                    theirs, {"company_name": "Autre", "version_id": version}
+                )
+
+    asyncio.run(scenario())
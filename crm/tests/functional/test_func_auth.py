@@ -0,0 +1,73 @@
+import pytest
+from argon2 import PasswordHasher
+
+from crm.auth.auth import Authentication
+from crm.auth.hasher import PASSWORD_HASHER
+from crm.errors.exceptions import LoginThrottledError
+from crm.models.user import User
+
+
+@pytest.fixture
+def legacy_user(db_session):
+    # Hachage produit avec des paramètres différents des paramètres courants
+    legacy = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+    user = User(
+        employee_number=40,
+        username="ancien",
+        email="ancien@test.com",
+        password_hash=legacy.hash("Password123!"),
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_login_rehashes_outdated_hash(db_session, legacy_user):
+    old_hash = legacy_user.password_hash
+
+    tokens = Authentication.authenticate_user("ancien", "Password123!", db_session)
+
+    assert tokens["access_token"]
+    db_session.refresh(legacy_user)
+    assert legacy_user.password_hash != old_hash
+    assert not PASSWORD_HASHER.needs_rehash(legacy_user.password_hash)
+    assert legacy_user.verify_password("Password123!")
+
+
+def test_failed_login_keeps_hash(db_session, legacy_user):
+    old_hash = legacy_user.password_hash
+
+    with pytest.raises(ValueError):
+        Authentication.authenticate_user("ancien", "mauvais", db_session)
+
+    db_session.refresh(legacy_user)
+    assert legacy_user.password_hash == old_hash
+
+
+def test_throttled_login_skips_hashing(db_session, legacy_user, monkeypatch):
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            Authentication.authenticate_user(
+                "ancien", "mauvais", db_session, source="poste-test"
+            )
+
+    def no_hashing(*args):
+        raise AssertionError("argon2 ne doit pas être appelé")
+
+    monkeypatch.setattr(PASSWORD_HASHER, "verify", no_hashing)
+    with pytest.raises(LoginThrottledError):
+        Authentication.authenticate_user(
+            "ancien", "Password123!", db_session, source="poste-test"
+        )
+
+
+def test_unknown_user_pays_dummy_verification(db_session, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        PASSWORD_HASHER, "verify_dummy", lambda password: calls.append(password)
+    )
+
+    with pytest.raises(ValueError):
+        Authentication.authenticate_user("fantome", "pw", db_session)
+
+    assert calls == ["pw"]
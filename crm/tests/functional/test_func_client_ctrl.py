@@ -1,5 +1,7 @@
 import pytest
+from sqlalchemy import event, update
 from crm.controllers.client_controller import ClientController
+from crm.errors.exceptions import ConcurrentUpdateError
 from crm.models.user import User
 from crm.models.role import Role
 from crm.models.client import Client
@@ -126,6 +128,60 @@ def test_update_client_not_found(client_ctrl):
         ctrl.update_client(9999, {"company_name": "Test"})
 
 
+def test_update_client_bumps_version(client_ctrl, sample_client):
+    ctrl, _ = client_ctrl
+    before = ctrl.get_client(sample_client.id)["version_id"]
+
+    result = ctrl.update_client(
+        sample_client.id, {"company_name": "V2", "version_id": before}
+    )
+
+    assert result["version_id"] == before + 1
+
+
+def test_update_client_stale_version_conflict(client_ctrl, sample_client):
+    ctrl, _ = client_ctrl
+    # Deux éditeurs lisent la même version, le premier enregistre
+    read_by_first = ctrl.get_client(sample_client.id)
+    read_by_second = ctrl.get_client(sample_client.id)
+    ctrl.update_client(
+        sample_client.id,
+        {"company_name": "Premier", "version_id": read_by_first["version_id"]},
+    )
+
+    with pytest.raises(ConcurrentUpdateError):
+        ctrl.update_client(
+            sample_client.id,
+            {"company_name": "Second", "version_id": read_by_second["version_id"]},
+        )
+
+
+def test_update_client_concurrent_write_detected_at_flush(
+    client_ctrl, sample_client, db_session
+):
+    ctrl, _ = client_ctrl
+    client = ctrl.clients.get_for_update(sample_client.id)
+    # Écriture concurrente entre la lecture et l'UPDATE (hors ORM)
+    db_session.execute(
+        update(Client)
+        .where(Client.id == sample_client.id)
+        .values(version_id=Client.version_id + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+    with pytest.raises(ConcurrentUpdateError):
+        ctrl.clients.save(client, {"company_name": "Perdu"})
+
+
+def test_get_for_update_scoped_to_owner(client_ctrl, sample_client, sales_user):
+    ctrl, admin = client_ctrl
+    # Le filtre propriétaire fait partie du SELECT ... FOR UPDATE
+    assert ctrl.clients.get_for_update(sample_client.id, owner_id=admin.id) is None
+    locked = ctrl.clients.get_for_update(sample_client.id, owner_id=sales_user.id)
+    assert locked is sample_client
+    assert locked.sales_contact is sales_user
+
+
 # --- DELETE ---
 def test_delete_client_success(client_ctrl, sample_client):
     ctrl, _ = client_ctrl
@@ -138,3 +194,162 @@ def test_delete_client_not_found(client_ctrl):
     ctrl, _ = client_ctrl
     with pytest.raises(ValueError):
         ctrl.delete_client(9999)
+
+
+# --- PAGINATION ---
+def test_list_page_keyset(client_ctrl, db_session, sales_user):
+    ctrl, admin = client_ctrl
+    for i in range(5):
+        db_session.add(
+            Client(
+                full_name=f"Client {i}",
+                email=f"client{i}@example.com",
+                phone="0102030405",
+                company_name=f"Corp {i}",
+                sales_contact_id=sales_user.id,
+            )
+        )
+    db_session.commit()
+
+    first = ctrl.list_page(order_by="-full_name", limit=2)
+    assert [c["full_name"] for c in first["items"]] == ["Client 4", "Client 3"]
+    assert first["has_more"] is True
+
+    second = ctrl.list_page(order_by="-full_name", limit=2, after=first["next_cursor"])
+    assert [c["full_name"] for c in second["items"]] == ["Client 2", "Client 1"]
+
+    last = ctrl.list_page(order_by="-full_name", limit=2, after=second["next_cursor"])
+    assert [c["full_name"] for c in last["items"]] == ["Client 0"]
+    assert last["has_more"] is False
+    assert last["next_cursor"] is None
+
+
+def test_list_rows_match_serializer(client_ctrl, sample_client, db_session):
+    ctrl, _ = client_ctrl
+    db_session.add(
+        Client(
+            full_name="Sans Commercial",
+            email="orphelin@example.com",
+            phone="0102030405",
+            company_name="Seul SA",
+        )
+    )
+    db_session.commit()
+    db_session.expire_all()
+
+    expected = ctrl.serializer.serialize_list(ctrl.clients.get_all())
+    rows = ctrl.list_all()
+
+    assert rows == expected
+    assert [list(row) for row in rows] == [list(item) for item in expected]
+    assert rows[1]["sales_contact_name"] == "Aucun contact"
+    # Filtre sur le champ joint : même jointure que le chemin ORM
+    filtered = ctrl.list_all(filters={"sales_contact_name": "sales"})
+    assert [row["id"] for row in filtered] == [sample_client.id]
+
+
+def test_list_my_clients_constant_queries(client_ctrl, db_session, engine):
+    ctrl, admin = client_ctrl
+    db_session.add_all(
+        Client(
+            full_name=f"Mien {i}",
+            email=f"mien{i}@example.com",
+            phone="0102030405",
+            company_name=f"Corp {i}",
+            sales_contact_id=admin.id,
+        )
+        for i in range(3)
+    )
+    db_session.commit()
+    admin.roles
+    db_session.expunge_all()
+    statements = []
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        result = ctrl.list_my_clients()
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+    assert [c["sales_contact_name"] for c in result] == ["admin"] * 3
+    # Clients et commercial joint : une seule requête pour toute la liste
+    assert len(statements) == 1
+
+
+def test_list_page_order_by_not_whitelisted(client_ctrl):
+    ctrl, admin = client_ctrl
+    with pytest.raises(ValueError):
+        ctrl.list_page(order_by="phone")
+
+
+# --- ECRITURES GROUPEES ---
+def _client_payload(i, **extra):
+    return {
+        "full_name": f"Batch {i}",
+        "email": f"batch{i}@example.com",
+        "phone": "0102030405",
+        "company_name": f"Batch Corp {i}",
+        **extra,
+    }
+
+
+def test_create_many_reports_row_failures(db_session, sales_user):
+    from crm.crud.client_crud import ClientCRUD
+
+    crud = ClientCRUD(db_session)
+    payloads = [
+        _client_payload(0, sales_contact_id=sales_user.id),
+        _client_payload(1, email="pas-un-email"),  # rejet par le validateur
+        _client_payload(2),
+        _client_payload(3, email="batch0@example.com"),  # doublon (contrainte unique)
+        {"email": "incomplet@example.com"},  # champs requis manquants
+    ]
+
+    result = crud.create_many(payloads)
+
+    assert set(result.ids) == {0, 2}
+    assert set(result.errors) == {1, 3, 4}
+    created = db_session.get(Client, result.ids[0])
+    assert created.full_name == "Batch 0"
+    assert created.sales_contact_id == sales_user.id
+    assert db_session.query(Client).count() == 2
+
+
+def test_update_many_reports_row_failures(db_session, sample_client):
+    from crm.crud.client_crud import ClientCRUD
+
+    crud = ClientCRUD(db_session)
+    result = crud.update_many(
+        [
+            {"id": sample_client.id, "company_name": "Nouvelle SA"},
+            {"id": 9999, "company_name": "Fantôme"},
+            {"id": sample_client.id, "phone": "abc"},
+        ]
+    )
+
+    assert set(result.ids) == {0}
+    assert set(result.errors) == {1, 2}
+    db_session.refresh(sample_client)
+    assert sample_client.company_name == "Nouvelle SA"
+    assert sample_client.phone == "0102030405"
+
+
+def test_update_many_stale_version_is_rejected(db_session, sample_client):
+    from crm.crud.client_crud import ClientCRUD
+
+    crud = ClientCRUD(db_session)
+    version = sample_client.version_id
+    crud.update_many([{"id": sample_client.id, "company_name": "V2"}])
+
+    result = crud.update_many(
+        [{"id": sample_client.id, "company_name": "V3", "version_id": version}]
+    )
+
+    assert result.ids == {}
+    assert "modifié" in result.errors[0]
+    db_session.refresh(sample_client)
+    assert sample_client.company_name == "V2"
+    assert sample_client.version_id == version + 1
@@ -1,6 +1,11 @@
 import pytest
+from crm.errors.exceptions import ConcurrentUpdateError
 from decimal import Decimal
+from sqlalchemy import event, select
 from crm.controllers.contract_controller import ContractController
+from crm.controllers.filter_controller import FilterController
+from crm.crud.client_crud import ClientCRUD
+from crm.crud.contract_crud import ContractCRUD
 from crm.models.user import User
 from crm.models.role import Role
 from crm.models.client import Client
@@ -102,6 +107,249 @@ def test_list_all_contracts(contract_ctrl, sample_contract):
     assert any(c["id"] == sample_contract.id for c in results)
 
 
+def _capture_sql(engine):
+    statements = []
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _before)
+
+
+def test_list_all_projection_skips_relations(
+    contract_ctrl, sample_contract, db_session, engine
+):
+    ctrl, admin = contract_ctrl
+    db_session.expunge_all()
+
+    statements, stop = _capture_sql(engine)
+    try:
+        result = ctrl.list_all(fields=["id", "amount_total"])
+    finally:
+        stop()
+
+    assert result == [{"id": sample_contract.id, "amount_total": Decimal("1000.00")}]
+    assert len(statements) == 1
+    assert "clients" not in statements[0]
+    assert "amount_due" not in statements[0]
+
+
+def test_list_all_projection_loads_needed_relations(
+    contract_ctrl, sample_contract, db_session, engine
+):
+    ctrl, admin = contract_ctrl
+    db_session.expunge_all()
+
+    statements, stop = _capture_sql(engine)
+    try:
+        result = ctrl.list_all(fields=["id", "client_name", "sales_contact_name"])
+    finally:
+        stop()
+
+    assert result[0]["client_name"] == "Client Test"
+    assert result[0]["sales_contact_name"] == "sales"
+    # Lecture directe : contrats joints aux clients et commerciaux, une requête
+    assert len(statements) == 1
+
+
+def test_list_rows_match_serializer(contract_ctrl, sample_contract, db_session):
+    ctrl, _ = contract_ctrl
+    orphan = Client(
+        full_name="Sans Commercial",
+        email="orphelin@example.com",
+        phone="0102030405",
+        company_name="Seul SA",
+    )
+    db_session.add(orphan)
+    db_session.commit()
+    db_session.add(
+        Contract(
+            client_id=orphan.id,
+            amount_total=Decimal("10.00"),
+            amount_due=Decimal("0.00"),
+            is_signed=True,
+        )
+    )
+    db_session.commit()
+    db_session.expire_all()
+
+    expected = ctrl.serializer.serialize_list(ctrl.contracts.get_all())
+    rows = ctrl.list_all()
+
+    assert rows == expected
+    assert [list(row) for row in rows] == [list(item) for item in expected]
+    assert rows[1]["sales_contact_name"] == "Aucun contact"
+
+    first = ctrl.list_page(order_by="-amount_total", limit=1)
+    assert first["items"] == [expected[0]]
+    second = ctrl.list_page(
+        order_by="-amount_total", limit=1, after=first["next_cursor"]
+    )
+    assert second["items"] == [expected[1]]
+    assert second["has_more"] is False
+
+
+# --- Dénormalisation de sales_contact_id ---
+@pytest.fixture
+def other_sales(db_session):
+    user = User(
+        employee_number=12,
+        username="sales2",
+        email="sales2@test.com",
+        password_hash="hash",
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_new_contract_copies_client_sales_contact(sample_contract, sales_user):
+    assert sample_contract.sales_contact_id == sales_user.id
+    assert sample_contract.sales_contact_name == "sales"
+
+
+def test_assign_sales_contact_propagates_to_contracts(
+    db_session, sample_client, sample_contract, other_sales
+):
+    ClientCRUD(db_session).assign_sales_contact(sample_client.id, other_sales.id)
+
+    # Objet déjà chargé à jour, et valeur en base
+    assert sample_contract.sales_contact_id == other_sales.id
+    stored = db_session.scalar(
+        select(Contract.sales_contact_id).where(Contract.id == sample_contract.id)
+    )
+    assert stored == other_sales.id
+    assert ContractCRUD(db_session).get_by_sales_contact(other_sales.id) == [
+        sample_contract
+    ]
+
+
+def test_reassignment_bumps_contract_version(
+    db_session, sample_client, sample_contract, other_sales
+):
+    version = sample_contract.version_id
+    stamp = sample_contract.updated_at
+
+    ClientCRUD(db_session).assign_sales_contact(sample_client.id, other_sales.id)
+
+    # Contrat chargé expiré : relu avec la nouvelle version
+    assert sample_contract.version_id == version + 1
+    assert sample_contract.updated_at != stamp
+    # Une édition basée sur la version lue avant la réaffectation est refusée
+    with pytest.raises(ConcurrentUpdateError):
+        ContractCRUD(db_session).update(
+            sample_contract.id, {"amount_due": 0, "version_id": version}
+        )
+
+
+def test_update_many_clients_propagates_to_contracts(
+    db_session, sample_client, sample_contract, other_sales
+):
+    result = ClientCRUD(db_session).update_many(
+        [{"id": sample_client.id, "sales_contact_id": other_sales.id}]
+    )
+
+    assert result.ok == 1
+    stored = db_session.scalar(
+        select(Contract.sales_contact_id).where(Contract.id == sample_contract.id)
+    )
+    assert stored == other_sales.id
+
+
+def test_contract_moved_to_other_client(
+    contract_ctrl, db_session, sample_contract, other_sales
+):
+    ctrl, _ = contract_ctrl
+    other_client = Client(
+        full_name="Autre",
+        email="autre@example.com",
+        phone="0102030405",
+        company_name="Other",
+        sales_contact_id=other_sales.id,
+    )
+    db_session.add(other_client)
+    db_session.commit()
+
+    ctrl.update_contract(sample_contract.id, {"client_id": other_client.id})
+
+    assert sample_contract.sales_contact_id == other_sales.id
+
+
+def test_create_many_contracts_fills_sales_contact(
+    db_session, sample_client, sales_user
+):
+    result = ContractCRUD(db_session).create_many(
+        [
+            {
+                "client_id": sample_client.id,
+                "amount_total": Decimal("10.00"),
+                "amount_due": Decimal("0.00"),
+                "sales_contact_id": 999,  # ignoré : dérivé du client
+            }
+        ]
+    )
+
+    assert result.ok == 1
+    stored = db_session.scalar(
+        select(Contract.sales_contact_id).where(Contract.id == result.ids[0])
+    )
+    assert stored == sales_user.id
+
+
+def test_filter_on_sales_contact_uses_plain_column(contract_ctrl, sample_contract):
+    ctrl, _ = contract_ctrl
+    statement = str(
+        select(Contract.id).where(Contract.sales_contact_name == "sales")
+    ).lower()
+    assert "clients" not in statement
+    assert ctrl.list_all(filters={"sales_contact_id": sample_contract.sales_contact_id})
+
+
+# --- Filtres ---
+def test_filtered_listing_uses_joins(
+    contract_ctrl, db_session, engine, sample_contract
+):
+    ctrl, admin = contract_ctrl
+    filter_ctrl = FilterController(session=db_session)
+    filter_ctrl.controllers["contracts"] = ctrl
+
+    statements, stop = _capture_sql(engine)
+    try:
+        result = filter_ctrl.list_filtered(
+            "contracts",
+            {
+                "client_name": {"prefix": "Client"},
+                "is_payed": False,
+                "amount_total": {"gte": Decimal("500"), "lte": Decimal("1000")},
+            },
+        )
+    finally:
+        stop()
+
+    assert [c["id"] for c in result] == [sample_contract.id]
+    main = statements[0].lower()
+    assert "join clients" in main
+    assert "(select" not in main
+
+
+def test_filtered_listing_or_group(contract_ctrl, db_session, sample_contract):
+    ctrl, _ = contract_ctrl
+    filter_ctrl = FilterController(session=db_session)
+    filter_ctrl.controllers["contracts"] = ctrl
+
+    none = filter_ctrl.list_filtered(
+        "contracts", {"$or": [{"is_signed": True}, {"client_name": "Autre"}]}
+    )
+    some = filter_ctrl.list_filtered(
+        "contracts",
+        {"$or": [{"is_signed": True}, {"sales_contact_name": {"prefix": "sal"}}]},
+    )
+
+    assert none == []
+    assert [c["id"] for c in some] == [sample_contract.id]
+
+
 # --- UPDATE ---
 def test_update_contract_success(contract_ctrl, sample_contract):
     ctrl, _ = contract_ctrl
@@ -116,6 +364,44 @@ def test_update_contract_not_found(contract_ctrl):
         ctrl.update_contract(9999, {"amount_due": Decimal("10.00")})
 
 
+def test_update_contract_two_statements(contract_ctrl, sample_contract, engine):
+    ctrl, admin = contract_ctrl
+    admin.roles  # rôles déjà chargés, comme pour un utilisateur courant résolu
+
+    statements, stop = _capture_sql(engine)
+    try:
+        result = ctrl.update_contract(
+            sample_contract.id, {"amount_due": Decimal("100.00")}
+        )
+    finally:
+        stop()
+
+    # SELECT (contrat + client + commercial) puis UPDATE, sans refresh
+    assert len(statements) == 2
+    assert statements[0].lstrip().upper().startswith("SELECT")
+    assert "clients" in statements[0] and "users" in statements[0]
+    assert statements[1].lstrip().upper().startswith("UPDATE")
+    assert result["amount_due"] == Decimal("100.00")
+    assert result["client_name"] == "Client Test"
+    assert result["sales_contact_name"] == "sales"
+
+
+def test_update_contract_unchanged_skips_update(
+    contract_ctrl, sample_contract, engine
+):
+    ctrl, admin = contract_ctrl
+    admin.roles
+
+    statements, stop = _capture_sql(engine)
+    try:
+        ctrl.update_contract(sample_contract.id, {"amount_due": Decimal("500.00")})
+    finally:
+        stop()
+
+    assert len(statements) == 1
+    assert not any(s.lstrip().upper().startswith("UPDATE") for s in statements)
+
+
 # --- DELETE ---
 def test_delete_contract_success(contract_ctrl, sample_contract):
     ctrl, _ = contract_ctrl
@@ -0,0 +1,150 @@
+import pytest
+from sqlalchemy import event
+
+from crm.auth.permission import Permission
+from crm.auth.permission_config import Crud
+from crm.crud.entity_cache import ENTITY_CACHE_STORE
+from crm.crud.role_crud import RoleCRUD
+from crm.crud.user_crud import UserCRUD
+from crm.models.role import Role
+from crm.models.user import User
+
+
+@pytest.fixture
+def sales(db_session):
+    user = User(
+        employee_number=21,
+        username="sales",
+        email="sales@test.com",
+        password_hash="hash",
+    )
+    role = Role(name="commercial")
+    db_session.add_all([user, role])
+    db_session.commit()
+    user.add_role(role, db_session)
+    db_session.commit()
+    db_session.expunge_all()
+    return user.id, role.id
+
+
+def _count_sql(engine):
+    statements = []
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _before)
+
+
+def test_second_read_served_from_cache(db_session, engine, sales):
+    user_id, _ = sales
+    UserCRUD(db_session).get_by_id(user_id)
+    db_session.expunge_all()  # nouvelle unité de travail
+
+    statements, stop = _count_sql(engine)
+    try:
+        user = UserCRUD(db_session).get_by_id(user_id)
+        role_names = [role.name for role in user.roles]
+    finally:
+        stop()
+
+    assert statements == []
+    assert role_names == ["commercial"]
+    assert user in db_session
+    assert ENTITY_CACHE_STORE.stats()["hits"] == 1
+
+
+def test_password_hash_not_cached_and_loaded_on_demand(db_session, engine, sales):
+    user_id, _ = sales
+    UserCRUD(db_session).get_by_id(user_id)
+    db_session.expunge_all()
+
+    snapshot = ENTITY_CACHE_STORE.get(("user", user_id))
+    assert "password_hash" not in dict(snapshot[0])
+
+    statements, stop = _count_sql(engine)
+    try:
+        user = UserCRUD(db_session).get_by_id(user_id)
+        assert statements == []
+        password_hash = user.password_hash
+    finally:
+        stop()
+
+    assert password_hash == "hash"
+    assert len(statements) == 1 and "password_hash" in statements[0]
+
+
+def test_cached_user_can_be_updated(db_session, sales):
+    user_id, _ = sales
+    UserCRUD(db_session).get_by_id(user_id)
+    db_session.expunge_all()
+
+    updated = UserCRUD(db_session).update_user(user_id, {"email": "new@test.com"})
+    db_session.expunge_all()
+
+    assert updated.email == "new@test.com"
+    assert UserCRUD(db_session).get_by_id(user_id).email == "new@test.com"
+
+
+def test_role_change_invalidates_user(db_session, sales):
+    user_id, role_id = sales
+    UserCRUD(db_session).get_by_id(user_id)
+    db_session.expunge_all()
+
+    UserCRUD(db_session).remove_role_from_user(user_id, role_id)
+    db_session.expunge_all()
+
+    assert UserCRUD(db_session).get_by_id(user_id).roles == []
+
+
+def test_role_rename_clears_cache(db_session, sales):
+    user_id, role_id = sales
+    UserCRUD(db_session).get_by_id(user_id)
+    RoleCRUD(db_session).get_by_id(role_id)
+    db_session.expunge_all()
+
+    RoleCRUD(db_session).update_role(role_id, {"name": "sales"})
+    db_session.expunge_all()
+
+    assert ENTITY_CACHE_STORE.stats()["size"] == 0
+    assert [r.name for r in UserCRUD(db_session).get_by_id(user_id).roles] == ["sales"]
+
+
+def test_role_rename_refreshes_loaded_user_capabilities(db_session, sales):
+    user_id, role_id = sales
+    user = UserCRUD(db_session).get_by_id(user_id)
+    assert Permission.role_allows(user, "client", Crud.CREATE)
+
+    RoleCRUD(db_session).update_role(role_id, {"name": "support"})
+
+    assert not Permission.role_allows(user, "client", Crud.CREATE)
+
+
+def test_bulk_update_invalidates(db_session, sales):
+    user_id, _ = sales
+    UserCRUD(db_session).get_by_id(user_id)
+    db_session.expunge_all()
+
+    result = UserCRUD(db_session).update_many(
+        [{"id": user_id, "username": "renamed"}]
+    )
+    db_session.expunge_all()
+
+    assert result.ok == 1
+    assert UserCRUD(db_session).get_by_id(user_id).username == "renamed"
+
+
+def test_bulk_update_keeps_cache_of_rejected_rows(db_session, sales):
+    user_id, _ = sales
+    UserCRUD(db_session).get_by_id(user_id)
+    db_session.expunge_all()
+    size = ENTITY_CACHE_STORE.stats()["size"]
+
+    # Sans id, ou rejetée par la validation : aucune ligne écrite
+    result = UserCRUD(db_session).update_many(
+        [{"username": "orphan"}, {"id": user_id, "username": None}]
+    )
+
+    assert result.ok == 0
+    assert ENTITY_CACHE_STORE.stats()["size"] == size
@@ -2,6 +2,8 @@ import pytest
 import datetime
 from decimal import Decimal
 
+from sqlalchemy import event
+from crm.auth.permission_config import Crud
 from crm.controllers.event_controller import EventController
 from crm.models.user import User, Role
 from crm.models.client import Client
@@ -150,6 +152,120 @@ def test_list_all_events(event_ctrl, sample_event):
     assert any(e["id"] == sample_event.id for e in results)
 
 
+def test_list_all_update_scope_for_support(
+    event_ctrl, sample_event, signed_contract, db_session, monkeypatch
+):
+    ctrl, _ = event_ctrl
+    support = User(
+        employee_number=22,
+        username="support",
+        email="support@test.com",
+        password_hash="hash",
+    )
+    role_support = Role(name="support")
+    db_session.add_all([support, role_support])
+    db_session.commit()
+    support.add_role(role_support, db_session)
+    mine = Event(
+        contract_id=signed_contract.id,
+        support_contact_id=support.id,
+        date_start=datetime.datetime.now() + datetime.timedelta(days=3),
+        date_end=datetime.datetime.now() + datetime.timedelta(days=4),
+        location="Lille",
+        attendees=5,
+    )
+    db_session.add(mine)
+    db_session.commit()
+    monkeypatch.setattr(ctrl, "_get_current_user", lambda: support)
+
+    # Lecture : tout ; modification : seulement ses événements (filtre SQL)
+    assert {e["id"] for e in ctrl.list_all()} == {sample_event.id, mine.id}
+    assert [e["id"] for e in ctrl.list_all(op=Crud.UPDATE)] == [mine.id]
+    assert [e["id"] for e in ctrl.list_page(op=Crud.UPDATE)["items"]] == [mine.id]
+    with pytest.raises(PermissionError):
+        ctrl.list_all(op=Crud.DELETE)
+
+
+def test_list_rows_match_serializer(event_ctrl, sample_event, db_session):
+    ctrl, _ = event_ctrl
+    support = User(
+        employee_number=23,
+        username="support",
+        email="support@test.com",
+        password_hash="hash",
+    )
+    db_session.add(support)
+    db_session.commit()
+    assigned = Event(
+        contract_id=sample_event.contract_id,
+        support_contact_id=support.id,
+        date_start=datetime.datetime(2030, 1, 1, 9),
+        date_end=datetime.datetime(2030, 1, 1, 18),
+        location="Lyon",
+        attendees=12,
+    )
+    db_session.add(assigned)
+    db_session.commit()
+    db_session.add_all(
+        [
+            EventNote(event_id=assigned.id, note="Première"),
+            EventNote(event_id=assigned.id, note="Seconde"),
+        ]
+    )
+    db_session.commit()
+    db_session.expire_all()
+
+    expected = ctrl.serializer.serialize_list(ctrl.events.get_all())
+    rows = ctrl.list_all()
+
+    assert rows == expected
+    assert [list(row) for row in rows] == [list(item) for item in expected]
+    assert rows[0]["support_contact_name"] == "Aucun"
+    assert rows[0]["notes"] == []
+    assert rows[1]["notes"] == ["Première", "Seconde"]
+    assert rows[1]["client_contact"] == ["client.event@example.com", "0600000000"]
+
+    subset = ctrl.list_all(fields=["id", "notes"])
+    assert subset == [{"id": e["id"], "notes": e["notes"]} for e in expected]
+
+
+def test_list_my_events_constant_queries(
+    event_ctrl, signed_contract, db_session, engine
+):
+    ctrl, admin = event_ctrl
+    for day in range(1, 4):
+        ev = Event(
+            contract_id=signed_contract.id,
+            support_contact_id=admin.id,
+            date_start=datetime.datetime(2030, 2, day, 9),
+            date_end=datetime.datetime(2030, 2, day, 18),
+            location=f"Salle {day}",
+            attendees=day,
+        )
+        db_session.add(ev)
+        db_session.flush()
+        db_session.add(EventNote(event_id=ev.id, note=f"Note {day}"))
+    db_session.commit()
+    admin.roles
+    db_session.expunge_all()
+    statements = []
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        result = ctrl.list_my_events()
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+    assert [e["notes"] for e in result] == [["Note 1"], ["Note 2"], ["Note 3"]]
+    assert {e["client_name"] for e in result} == {"Client Event"}
+    assert {e["support_contact_name"] for e in result} == {"admin"}
+    # Evénements + contrat/client/support joints, puis les notes : 2 requêtes
+    assert len(statements) == 2
+
+
 # --- NOTES ---
 def test_add_and_list_notes(event_ctrl, sample_event):
     ctrl, _ = event_ctrl
@@ -183,6 +299,32 @@ def test_update_event_success(event_ctrl, sample_event):
     assert result["location"] == "Bordeaux"
 
 
+def test_update_event_two_statements(event_ctrl, sample_event, engine):
+    ctrl, admin = event_ctrl
+    admin.roles
+    statements = []
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        result = ctrl.update_event(sample_event.id, {"location": "Nantes"})
+        ctrl.update_event(sample_event.id, {"location": "Nantes"})
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+    # 1er appel : SELECT verrouillé + UPDATE ; 2e appel (rien ne change) : SELECT
+    assert len(statements) == 3
+    assert [s.lstrip().split()[0].upper() for s in statements] == [
+        "SELECT",
+        "UPDATE",
+        "SELECT",
+    ]
+    assert result["location"] == "Nantes"
+    assert result["client_name"] == "Client Event"
+
+
 def test_update_event_not_found(event_ctrl):
     ctrl, _ = event_ctrl
     with pytest.raises(ValueError):
@@ -0,0 +1,188 @@
+import csv
+import gzip
+import json
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from crm.models.user import User
+from crm.models.client import Client
+from crm.models.contract import Contract
+from crm.models.event import Event
+from crm.utils import bulk_export
+from crm.utils.bulk_export import run_export
+
+
+# --- Fixtures ---
+@pytest.fixture
+def dataset(db_session):
+    sales = User(
+        employee_number=11, username="sales", email="sales@test.com", password_hash="h"
+    )
+    support = User(
+        employee_number=12,
+        username="support",
+        email="support@test.com",
+        password_hash="h",
+    )
+    db_session.add_all([sales, support])
+    db_session.commit()
+
+    clients = [
+        Client(
+            full_name=f"Client {i}",
+            email=f"client{i}@example.com",
+            phone="0102030405",
+            company_name="Corp",
+            sales_contact_id=sales.id,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(clients)
+    db_session.commit()
+
+    contract = Contract(
+        client_id=clients[0].id,
+        amount_total=Decimal("1000.00"),
+        amount_due=Decimal("250.00"),
+        is_signed=True,
+    )
+    db_session.add(contract)
+    db_session.commit()
+
+    start = datetime(2030, 1, 1, 10, 0)
+    event = Event(
+        contract_id=contract.id,
+        support_contact_id=support.id,
+        date_start=start,
+        date_end=start + timedelta(hours=4),
+        location="Paris",
+        attendees=50,
+    )
+    db_session.add(event)
+    db_session.commit()
+    db_session.expunge_all()
+    return clients
+
+
+# --- CSV / JSONL ---
+def test_export_clients_csv_in_batches(db_session, dataset, tmp_path):
+    path = tmp_path / "clients.csv"
+    report = run_export(
+        db_session,
+        "clients",
+        path=path,
+        fields=["email", "id", "sales_contact_name"],
+        batch_size=2,
+    )
+
+    assert report.rows == 5
+    with open(path, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert set(rows[0]) == {"id", "email", "sales_contact_name"}
+    assert [r["email"] for r in rows] == [f"client{i}@example.com" for i in range(5)]
+    assert {r["sales_contact_name"] for r in rows} == {"sales"}
+    # Les lots sont détachés au fil de l'eau
+    assert len(db_session.identity_map) == 0
+
+
+def test_export_keeps_objects_loaded_before(db_session, dataset, tmp_path):
+    # Ex. l'utilisateur courant chargé par _get_current_user
+    me = db_session.query(User).filter_by(username="sales").one()
+
+    run_export(
+        db_session,
+        "clients",
+        path=tmp_path / "clients.csv",
+        fields=["id", "sales_contact_name"],
+        batch_size=2,
+    )
+
+    assert me in db_session
+    assert len(db_session.identity_map) == 1
+
+
+def test_export_scoped_to_owner(db_session, dataset, tmp_path):
+    other = User(
+        employee_number=13, username="other", email="other@test.com", password_hash="h"
+    )
+    db_session.add(other)
+    db_session.commit()
+    db_session.add(
+        Client(
+            full_name="Autre",
+            email="autre@example.com",
+            phone="0102030405",
+            company_name="Corp",
+            sales_contact_id=other.id,
+        )
+    )
+    db_session.commit()
+
+    for fields in (["id", "email"], ["id", "email", "sales_contact_name"]):
+        path = tmp_path / "mine.jsonl"
+        report = run_export(
+            db_session,
+            "clients",
+            fmt="jsonl",
+            path=path,
+            fields=fields,
+            owner_id=other.id,
+        )
+
+        assert report.rows == 1
+        assert json.loads(path.read_text(encoding="utf-8"))["email"] == (
+            "autre@example.com"
+        )
+
+
+def test_export_plain_columns_skip_orm(db_session, dataset, tmp_path):
+    path = tmp_path / "contracts.jsonl"
+    report = run_export(
+        db_session,
+        "contracts",
+        fmt="jsonl",
+        path=path,
+        fields=["id", "amount_due", "is_signed"],
+    )
+
+    assert report.rows == 1
+    row = json.loads(path.read_text(encoding="utf-8"))
+    assert row == {"id": row["id"], "amount_due": "250.00", "is_signed": True}
+    assert len(db_session.identity_map) == 0
+
+
+def test_export_events_jsonl_gzip(db_session, dataset, tmp_path):
+    path = tmp_path / "events.jsonl.gz"
+    report = run_export(
+        db_session, "events", fmt="jsonl", path=path, compress="gzip"
+    )
+
+    assert report.rows == 1
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        event = json.loads(f.readline())
+    assert event["client_name"] == "Client 0"
+    assert event["support_contact_name"] == "support"
+    assert event["date_start"] == "2030-01-01T10:00:00"
+    assert event["notes"] == []
+
+
+def test_export_rejects_unknown_field(db_session, dataset, tmp_path):
+    with pytest.raises(ValueError):
+        run_export(db_session, "clients", path=tmp_path / "x.csv", fields=["password"])
+
+
+def test_export_parquet_requires_pyarrow(db_session, monkeypatch, tmp_path):
+    monkeypatch.setattr(bulk_export, "pa", None)
+    with pytest.raises(ValueError):
+        run_export(db_session, "clients", fmt="parquet", path=tmp_path / "c.parquet")
+
+
+def test_export_parquet(db_session, dataset, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "contracts.parquet"
+    report = run_export(db_session, "contracts", fmt="parquet", path=path)
+
+    assert report.rows == 1
+    table = pq.read_table(path)
+    assert table.column("amount_total").to_pylist() == [Decimal("1000.00")]
+    assert table.column("client_name").to_pylist() == ["Client 0"]
@@ -0,0 +1,152 @@
+import json
+import pytest
+from decimal import Decimal
+from crm.models.user import User
+from crm.models.client import Client
+from crm.models.contract import Contract
+from datetime import datetime, timezone
+from crm.utils.bulk_import import _copy_payload, run_import
+
+
+# --- Fixtures ---
+@pytest.fixture
+def sales_user(db_session):
+    user = User(
+        employee_number=11,
+        username="sales",
+        email="sales@test.com",
+        password_hash="hash",
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _read_errors(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+# --- CSV ---
+def test_import_clients_csv(db_session, sales_user, tmp_path):
+    source = tmp_path / "clients.csv"
+    source.write_text(
+        "full_name,email,phone,company_name,sales_contact\n"
+        "Alice Martin,alice@example.com,0102030405,Acme,sales\n"
+        "Bob Durand,pas-un-email,0102030406,Acme,sales\n"
+        "Carla Petit,carla@example.com,0102030407,Acme,inconnu\n"
+        "Denis Roux,denis@example.com,0102030408,,\n",
+        encoding="utf-8",
+    )
+
+    report = run_import(db_session, "clients", source, chunk_size=2, workers=1)
+
+    assert report.total == 4
+    assert report.imported == 2
+    assert report.rejected == 2
+
+    alice = db_session.query(Client).filter_by(email="alice@example.com").one()
+    assert alice.sales_contact_id == sales_user.id
+    denis = db_session.query(Client).filter_by(email="denis@example.com").one()
+    assert denis.sales_contact_id is None
+
+    errors = _read_errors(report.errors_path)
+    assert [e["record"] for e in errors] == [2, 3]
+    assert errors[0]["reason"] == "Email invalide."
+    assert "inconnu" in errors[1]["reason"]
+    assert errors[1]["row"]["full_name"] == "Carla Petit"
+
+
+def test_import_without_rejects_removes_error_file(db_session, sales_user, tmp_path):
+    source = tmp_path / "clients.csv"
+    source.write_text(
+        "full_name,email,phone,company_name,sales_contact\n"
+        "Alice Martin,alice@example.com,0102030405,Acme,sales\n",
+        encoding="utf-8",
+    )
+
+    report = run_import(db_session, "clients", source, workers=1)
+
+    assert report.imported == 1
+    assert report.errors_path is None
+    assert not (tmp_path / "clients.csv.errors.jsonl").exists()
+
+
+# --- JSONL + pool de processus ---
+def test_import_contracts_jsonl_with_workers(db_session, sales_user, tmp_path):
+    client = Client(
+        full_name="Client Test",
+        email="client@example.com",
+        phone="0102030405",
+        company_name="TestCorp",
+        sales_contact_id=sales_user.id,
+    )
+    db_session.add(client)
+    db_session.commit()
+
+    source = tmp_path / "contracts.jsonl"
+    lines = [
+        {"client_email": "client@example.com", "amount_total": "1000.00",
+         "amount_due": "250.00", "is_signed": "oui"},
+        {"client_email": "client@example.com", "amount_total": "100",
+         "amount_due": "500"},
+        {"client_email": "absent@example.com", "amount_total": "10",
+         "amount_due": "0"},
+    ]
+    source.write_text(
+        "\n".join(json.dumps(line) for line in lines) + "\n{oops\n",
+        encoding="utf-8",
+    )
+    errors_path = tmp_path / "rejets.jsonl"
+
+    report = run_import(
+        db_session,
+        "contracts",
+        source,
+        chunk_size=1,
+        workers=2,
+        errors_path=errors_path,
+    )
+
+    assert report.total == 4
+    assert report.imported == 1
+    contract = db_session.query(Contract).one()
+    assert contract.client_id == client.id
+    assert contract.amount_due == Decimal("250.00")
+    assert contract.is_signed is True
+
+    errors = _read_errors(errors_path)
+    assert [e["record"] for e in errors] == [2, 3, 4]
+    assert "JSON invalide" in errors[2]["reason"]
+
+
+# --- COPY (PostgreSQL) ---
+def test_copy_payload_writes_null_foreign_key_as_null_marker():
+    now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    rows = [
+        {"full_name": "Denis Roux", "company_name": "", "sales_contact_id": None},
+        {"full_name": 'Eve "E"', "company_name": "\\N", "sales_contact_id": 7},
+    ]
+
+    columns, payload = _copy_payload(rows, now)
+
+    assert columns == [
+        "full_name",
+        "company_name",
+        "sales_contact_id",
+        "created_at",
+        "updated_at",
+    ]
+    stamp = f'"{now}"'
+    # NULL non quoté ; chaîne vide et "\N" littéral restent quotés
+    assert payload.splitlines() == [
+        f'"Denis Roux","",\\N,{stamp},{stamp}',
+        f'"Eve ""E""","\\N","7",{stamp},{stamp}',
+    ]
+
+
+def test_import_unknown_entity(db_session, tmp_path):
+    source = tmp_path / "x.csv"
+    source.write_text("a\n1\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        run_import(db_session, "users", source)
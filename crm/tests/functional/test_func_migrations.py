@@ -0,0 +1,142 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from crm.models.base import AbstractBase
+from crm.migrations import (
+    current_version,
+    load_migrations,
+    migrate,
+    pending_migrations,
+    stamp,
+)
+from crm.migrations.v0001_index_pack import INDEXES
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'crm.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _index_names(engine, table):
+    return {ix["name"] for ix in inspect(engine).get_indexes(table)}
+
+
+def test_migrations_are_ordered():
+    versions = [m.version for m in load_migrations()]
+    assert versions == sorted(versions)
+    assert versions[0] == 1
+
+
+def test_migrate_adds_indexes_to_existing_database(file_engine):
+    AbstractBase.metadata.create_all(file_engine)
+    # Simule une base créée avant l'index pack
+    with file_engine.begin() as conn:
+        for name, *_ in INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    assert current_version(file_engine) == 0
+
+    applied = migrate(file_engine)
+
+    assert [m.version for m in applied] == [m.version for m in load_migrations()]
+    assert current_version(file_engine) == applied[-1].version
+    assert {"ix_contracts_unsigned", "ix_contracts_unpaid"} <= _index_names(
+        file_engine, "contracts"
+    )
+    assert "ix_user_roles_role_id" in _index_names(file_engine, "user_roles")
+
+    # Rejouer ne fait rien
+    assert migrate(file_engine) == []
+
+
+def test_indexes_serve_hot_lookups(file_engine):
+    AbstractBase.metadata.create_all(file_engine)
+    with file_engine.connect() as conn:
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM clients "
+                    "WHERE sales_contact_id = 1"
+                )
+            )
+        )
+        unsigned = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM contracts "
+                    "WHERE client_id = 1 AND is_signed = false"
+                )
+            )
+        )
+    assert "ix_clients_sales_contact_id" in plan
+    assert "INDEX" in unsigned
+
+
+def test_stamp_marks_fresh_schema_up_to_date(file_engine):
+    AbstractBase.metadata.create_all(file_engine)
+    # Les modèles déclarent les mêmes index que la migration
+    for name, table, *_ in INDEXES:
+        assert name in _index_names(file_engine, table)
+
+    stamp(file_engine)
+    assert pending_migrations(file_engine) == []
+    assert current_version(file_engine) == max(m.version for m in load_migrations())
+
+
+def test_migrate_backfills_contract_sales_contact(file_engine):
+    AbstractBase.metadata.create_all(file_engine)
+    with file_engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO users (id, employee_number, username, email, "
+                "password_hash, created_at, updated_at) "
+                "VALUES (7, 7, 'sales', 's@test.com', 'h', '2025-01-01', '2025-01-01')"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO clients (id, full_name, email, phone, company_name, "
+                "sales_contact_id, created_at, updated_at) "
+                "VALUES (1, 'C', 'c@test.com', '0102030405', 'X', 7, "
+                "'2025-01-01', '2025-01-01')"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO contracts (id, client_id, amount_total, amount_due, "
+                "is_signed, sales_contact_id, created_at, updated_at) "
+                "VALUES (1, 1, 100, 50, 0, NULL, '2025-01-01', '2025-01-01')"
+            )
+        )
+
+    migrate(file_engine)
+
+    with file_engine.connect() as conn:
+        owner = conn.execute(
+            text("SELECT sales_contact_id FROM contracts WHERE id = 1")
+        ).scalar()
+    assert owner == 7
+
+
+def test_migrate_adds_version_columns(file_engine):
+    AbstractBase.metadata.create_all(file_engine)
+    with file_engine.begin() as conn:
+        # Simule une base créée avant le verrouillage optimiste
+        conn.execute(text("ALTER TABLE clients DROP COLUMN version_id"))
+        conn.execute(
+            text(
+                "INSERT INTO clients (id, full_name, email, phone, company_name, "
+                "created_at, updated_at) "
+                "VALUES (1, 'C', 'c@test.com', '0102030405', 'X', "
+                "'2025-01-01', '2025-01-01')"
+            )
+        )
+
+    migrate(file_engine)
+
+    columns = {c["name"] for c in inspect(file_engine).get_columns("clients")}
+    assert "version_id" in columns
+    with file_engine.connect() as conn:
+        assert conn.execute(text("SELECT version_id FROM clients")).scalar() == 1
@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy import create_engine, select, update
+from crm.crud.client_crud import ClientCRUD
+from crm.database import RoutingSession
+from crm.models.base import AbstractBase
+from crm.models.client import Client
+
+
+def _client(email):
+    return Client(
+        full_name="Client Réplica",
+        email=email,
+        phone="0102030405",
+        company_name="ReplicaCorp",
+    )
+
+
+@pytest.fixture
+def engines(tmp_path):
+    # Deux fichiers SQLite : primaire et réplica (sans réplication réelle)
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for eng in (primary, replica):
+        AbstractBase.metadata.create_all(eng)
+    with RoutingSession(bind=replica) as session:
+        session.add(_client("replica@example.com"))
+        session.commit()
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def _session(engines, sticky_seconds=0.0):
+    primary, replica = engines
+    return RoutingSession(
+        bind=primary,
+        replicas=[replica],
+        sticky_seconds=sticky_seconds,
+        expire_on_commit=False,
+    )
+
+
+def _emails(session):
+    return set(session.scalars(select(Client.email)))
+
+
+def test_reads_go_to_replica(engines):
+    with _session(engines) as session:
+        assert _emails(session) == {"replica@example.com"}
+        assert [c.email for c in ClientCRUD(session).get_all()] == [
+            "replica@example.com"
+        ]
+
+
+def test_writes_go_to_primary_and_pin_reads(engines):
+    primary, _ = engines
+    with _session(engines) as session:
+        ClientCRUD(session).create_client(
+            {
+                "full_name": "Nouveau",
+                "email": "primary@example.com",
+                "phone": "0102030405",
+                "company_name": "PrimaryCorp",
+            }
+        )
+        # Lecture après écriture : même session => primaire
+        assert _emails(session) == {"primary@example.com"}
+
+    with RoutingSession(bind=primary) as check:
+        assert _emails(check) == {"primary@example.com"}
+
+
+def test_session_returns_to_replica_after_close(engines):
+    session = _session(engines)
+    session.execute(update(Client).values(company_name="X"))
+    session.commit()
+    assert _emails(session) == set()  # primaire (vide)
+
+    session.close()
+    assert _emails(session) == {"replica@example.com"}
+
+
+def test_sticky_window_keeps_primary_after_close(engines):
+    session = _session(engines, sticky_seconds=60)
+    session.add(_client("primary@example.com"))
+    session.commit()
+    session.close()
+
+    assert _emails(session) == {"primary@example.com"}
+
+
+def test_use_primary(engines):
+    with _session(engines) as session:
+        with session.use_primary():
+            assert _emails(session) == set()
+        assert _emails(session) == {"replica@example.com"}
+
+
+def test_locked_read_goes_to_primary_and_pins(engines):
+    with _session(engines) as session:
+        # Ligne présente sur le réplica seulement
+        assert session.get(Client, 1, with_for_update=True) is None
+        assert _emails(session) == set()
+
+
+def test_without_replicas_everything_uses_primary(engines):
+    primary, _ = engines
+    with RoutingSession(bind=primary) as session:
+        assert _emails(session) == set()
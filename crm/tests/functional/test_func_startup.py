@@ -0,0 +1,123 @@
+import inspect
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import main
+
+ROOT = Path(main.__file__).resolve().parent
+
+# Jamais chargés par une commande sans base (--help, logout, calibrate)
+HEAVY_MODULES = (
+    "pytest",
+    "crm.tests",
+    "crm.database",
+    "crm.models",
+    "crm.controllers",
+    "crm.views",
+    "sqlalchemy",
+    "rich",
+    "sentry_sdk",
+)
+
+# Cible de démarrage à froid (imports, hors initialisation de l'interpréteur)
+COLD_START_BUDGET_MS = 150
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _import_times(*args):
+    """Modules importés et durée cumulée (ms) des imports de premier niveau."""
+    stderr = _run("-X", "importtime", *args).stderr
+    modules, total_us = set(), 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        # Premier niveau : un seul espace avant le nom ; `site` = interpréteur
+        if not name.startswith("  ") and name.strip() != "site":
+            total_us += int(cumulative)
+    return modules, total_us / 1000
+
+
+def _heavy(modules):
+    return sorted(
+        m
+        for m in modules
+        if any(m == h or m.startswith(h + ".") for h in HEAVY_MODULES)
+    )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [("--help",), ("logout", "--help"), ("calibrate", "--help")],
+    ids=["help", "logout", "calibrate"],
+)
+def test_cli_cold_start_without_database(args):
+    runs = [_import_times("main.py", *args) for _ in range(3)]
+    modules = runs[0][0]
+
+    assert _heavy(modules) == []
+    assert min(ms for _, ms in runs) < COLD_START_BUDGET_MS
+
+
+def test_help_lists_lazy_commands():
+    output = _run("main.py", "--help").stdout
+
+    for name in main.LAZY_COMMANDS:
+        assert name in output
+    assert "Initialise la base de données." in output
+
+
+def test_lazy_summaries_match_commands():
+    """Les résumés déclarés dans main.py suivent les docstrings des commandes."""
+    for name, (module, attr, summary) in main.LAZY_COMMANDS.items():
+        command = main.cli.get_command(None, name)
+        assert command is getattr(__import__(module, fromlist=[attr]), attr)
+        # Première phrase de l'aide, jamais vide (sinon --help affiche un blanc)
+        first_paragraph = inspect.cleandoc(command.help or "").split("\n\n")[0]
+        assert summary, name
+        assert " ".join(first_paragraph.split()).startswith(summary), name
+        assert command.get_short_help_str(limit=500) == summary, name
+
+
+def test_models_do_not_import_tests():
+    modules, _ = _import_times(
+        "-c", "import crm.models.client, crm.models.contract, crm.models.event"
+    )
+
+    assert not any(m == "pytest" or m.startswith("crm.tests") for m in modules)
+
+
+def test_engine_created_on_first_use():
+    output = _run(
+        "-c",
+        "import crm.database as db;"
+        "print(db.get_engine.cache_info().currsize);"
+        "print(db.engine is db.get_engine());"
+        "print(db.get_engine.cache_info().currsize)",
+    ).stdout.split()
+
+    assert output == ["0", "True", "1"]
+
+
+def test_jti_store_opened_on_first_use():
+    output = _run(
+        "-c",
+        "import crm.auth.auth, crm.auth.principal_cache;"
+        "import crm.auth.jti_manager as jti;"
+        "print(jti._store is None)",
+    ).stdout.split()
+
+    assert output == ["True"]
@@ -114,6 +114,8 @@ def test_support_cannot_access_other_event(controllers, users_with_roles, monkey
     monkeypatch.setattr(event_ctrl, "_get_current_user", lambda: support)
     with pytest.raises(PermissionError):
         event_ctrl.update_event(event["id"], {"location": "Nice"})
+    with pytest.raises(PermissionError):
+        event_ctrl.create_note(event["id"], "Note hors périmètre")
 
 
 @pytest.mark.as_role("admin")
@@ -0,0 +1,86 @@
+import threading
+import time
+
+from argon2 import PasswordHasher
+
+from crm.auth import hasher
+from crm.auth.hasher import PasswordHasherService
+
+# Paramètres minimaux : les tests restent rapides
+FAST = {"time_cost": 1, "memory_cost": 8, "parallelism": 1}
+
+
+def test_hash_and_verify():
+    service = PasswordHasherService(**FAST)
+    digest = service.hash("Password123!")
+
+    assert service.verify(digest, "Password123!")
+    assert not service.verify(digest, "mauvais")
+    assert not service.verify("pas-un-hachage", "Password123!")
+    assert not service.verify(None, "Password123!")
+
+
+def test_needs_rehash_when_parameters_change():
+    old = PasswordHasher(time_cost=2, memory_cost=8, parallelism=1).hash("pw")
+    service = PasswordHasherService(**FAST)
+
+    assert service.needs_rehash(old)
+    assert not service.needs_rehash(service.hash("pw"))
+    assert service.needs_rehash("pas-un-hachage")
+    # L'ancien hachage reste vérifiable
+    assert service.verify(old, "pw")
+
+
+def test_concurrency_is_bounded():
+    service = PasswordHasherService(**FAST, max_concurrency=2)
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    class TrackingHasher:
+        def hash(self, password):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.01)
+            with lock:
+                active["now"] -= 1
+            return "digest"
+
+    service._hasher = TrackingHasher()
+    threads = [threading.Thread(target=service.hash, args=("pw",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert active["max"] == 2
+
+
+def _simulated_cost(monkeypatch):
+    # 10 ms par itération et par MiB
+    monkeypatch.setattr(
+        hasher, "measure", lambda t, m, p, rounds=3: 10.0 * t * m / 1024
+    )
+
+
+def test_calibrate_raises_iterations_up_to_target(monkeypatch):
+    _simulated_cost(monkeypatch)
+
+    result = hasher.calibrate(2000, memory_cost=65536, parallelism=1)
+
+    assert result == {
+        "time_cost": 3,
+        "memory_cost": 65536,
+        "parallelism": 1,
+        "elapsed_ms": 1920.0,
+    }
+
+
+def test_calibrate_lowers_memory_down_to_floor(monkeypatch):
+    _simulated_cost(monkeypatch)
+
+    result = hasher.calibrate(100, memory_cost=65536, parallelism=1)
+
+    # 16 MiB passerait sous la cible mais sous le plancher de 19 MiB
+    assert result["memory_cost"] == 32768
+    assert result["time_cost"] == 1
@@ -0,0 +1,101 @@
+import pytest
+
+from crm.auth.jti_manager import SQLiteJTIStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    store = SQLiteJTIStore(tmp_path / "jtis.db", clock=clock)
+    yield store
+    store.close()
+
+
+def test_add_then_revoke(store):
+    store.add("a", user_id=1, expires_at=2000)
+    assert store.is_valid("a")
+    assert not store.is_valid("inconnu")
+
+    store.revoke("a")
+    assert not store.is_valid("a")
+
+
+def test_expired_jti_is_invalid_and_pruned(store, clock):
+    store.add("a", user_id=1, expires_at=1500)
+    store.add("b", user_id=1)
+    clock.now = 1500
+
+    assert not store.is_valid("a")
+    assert store.is_valid("b")  # sans exp : jusqu'à révocation
+    assert store.prune() == 1
+
+
+def test_add_prunes_expired(store, clock):
+    store.add("a", user_id=1, expires_at=1500)
+    clock.now = 1600
+    store.add("b", user_id=1, expires_at=3000)
+
+    assert store.prune() == 0
+
+
+def test_revoke_user_closes_all_sessions(store):
+    store.add("a1", user_id=1, expires_at=2000)
+    store.add("a2", user_id=1, expires_at=2000)
+    store.add("b1", user_id=2, expires_at=2000)
+
+    assert store.revoke_user(1) == 2
+    assert not store.is_valid("a1")
+    assert not store.is_valid("a2")
+    assert store.is_valid("b1")
+
+
+def test_add_payload(store):
+    store.add_payload({"jti": "p", "sub": "3", "exp": 2000})
+    store.add_payload({"sub": "3"})  # pas de jti : ignoré
+
+    assert store.is_valid("p")
+    assert store.revoke_user(3) == 1
+
+
+def test_generation_changes_on_revocation(store, tmp_path, clock):
+    store.add("a", user_id=1, expires_at=2000)
+    before = store.generation()
+    store.revoke("a")
+    assert store.generation() != before
+
+    # Révocation par un autre processus (autre connexion sur le même fichier)
+    store.add("b", user_id=1, expires_at=2000)
+    before = store.generation()
+    other = SQLiteJTIStore(tmp_path / "jtis.db", clock=clock)
+    other.revoke("b")
+    other.close()
+    assert store.generation() != before
+    assert not store.is_valid("b")
+
+
+def test_default_path_in_app_data_dir(tmp_path):
+    from crm.auth.config import APP_DATA_DIR, data_path
+
+    assert data_path("valid_jtis.db") == APP_DATA_DIR / "valid_jtis.db"
+    assert data_path(str(tmp_path / "x.db")) == tmp_path / "x.db"
+
+
+def test_store_creates_parent_directory(tmp_path, clock):
+    store = SQLiteJTIStore(tmp_path / "data" / "jtis.db", clock=clock)
+    try:
+        store.add("a")
+        assert (tmp_path / "data" / "jtis.db").exists()
+    finally:
+        store.close()
@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from crm.auth.capabilities import (
+    CAPABILITIES,
+    CapabilityRegistry,
+    bump_role_generation,
+)
+from crm.auth.permission import Permission
+from crm.auth.permission_config import Crud
+from crm.models.role import Role
+from crm.models.user import User
+from crm.models.user_role import UserRole
+
+
+def _user(*role_names):
+    user = User(id=1, username="u", email="u@test.com", employee_number=1)
+    for index, name in enumerate(role_names, start=1):
+        user.user_roles.append(UserRole(role=Role(id=index, name=name)))
+    return user
+
+
+# ---------- Registre ----------
+def test_role_masks_follow_rules():
+    registry = CapabilityRegistry(
+        {"lecteur": {"client": {Crud.READ}}, "chef": {"*": {Crud.DELETE}}}
+    )
+    reader = registry.role_mask("lecteur")
+    chief = registry.role_mask("Chef")
+
+    assert reader & registry.query_mask("client", Crud.READ)
+    assert not reader & registry.query_mask("client", Crud.UPDATE)
+    assert not reader & registry.query_mask("event", Crud.READ)
+    # "*" couvre toutes les ressources, même absentes des règles
+    assert chief & registry.query_mask("contract", Crud.DELETE)
+    assert chief & registry.query_mask("inconnue", Crud.DELETE)
+
+
+def test_registry_is_read_only():
+    with pytest.raises(TypeError):
+        CAPABILITIES._role_masks["pirate"] = -1
+    with pytest.raises(AttributeError):
+        CAPABILITIES.extra = 1
+
+
+def test_unknown_role_has_no_capability():
+    assert CAPABILITIES.mask_for_roles(["inconnu"]) == 0
+
+
+# ---------- Permission ----------
+@pytest.mark.parametrize(
+    "roles, resource, op, expected",
+    [
+        (("admin",), "event", Crud.DELETE, True),
+        (("gestion",), "contract", Crud.CREATE, True),
+        (("gestion",), "client", Crud.UPDATE, False),
+        (("commercial",), "client", Crud.CREATE, True),
+        (("support",), "event", Crud.UPDATE_OWN, True),
+        (("support", "commercial"), "event", Crud.CREATE, True),
+        ((), "client", Crud.READ, False),
+    ],
+)
+def test_role_allows(roles, resource, op, expected):
+    assert Permission.role_allows(_user(*roles), resource, op) is expected
+
+
+def test_capabilities_memoized_per_user():
+    user = _user("support")
+    first = Permission.user_capabilities(user)
+    user.user_roles[0].role.name = "admin"  # ignoré : masque déjà calculé
+
+    assert Permission.user_capabilities(user) == first
+
+
+def test_capabilities_recomputed_after_role_write():
+    user = _user("support")
+    Permission.user_capabilities(user)
+    user.user_roles[0].role.name = "admin"
+
+    bump_role_generation()  # flush d'un Role / UserRole
+
+    assert Permission.role_allows(user, "client", Crud.DELETE)
+
+
+def test_capabilities_recomputed_when_roles_change():
+    user = _user("support")
+    assert not Permission.role_allows(user, "client", Crud.CREATE)
+
+    user.user_roles.append(UserRole(role=Role(id=9, name="commercial")))
+
+    assert Permission.role_allows(user, "client", Crud.CREATE)
+
+
+def test_plain_objects_not_memoized():
+    user = MagicMock()
+    user.roles = [MagicMock(name="role")]
+    user.roles[0].name = "admin"
+    assert Permission.role_allows(user, "client", Crud.READ)
+
+    user.roles[0].name = "support"
+    assert not Permission.role_allows(user, "client", Crud.UPDATE)
+
+
+# ---------- Périmètre des listes ----------
+@pytest.mark.parametrize(
+    "roles, resource, op, expected",
+    [
+        (("admin",), "event", Crud.UPDATE, None),
+        (("gestion",), "event", Crud.UPDATE, None),
+        (("support",), "event", Crud.UPDATE, 1),
+        (("commercial",), "client", Crud.UPDATE, 1),
+        (("support",), "event", Crud.READ, None),
+    ],
+)
+def test_owner_scope(roles, resource, op, expected):
+    assert Permission.owner_scope(_user(*roles), resource, op) == expected
+
+
+def test_owner_scope_without_any_right():
+    with pytest.raises(PermissionError):
+        Permission.owner_scope(_user("support"), "client", Crud.UPDATE)
@@ -0,0 +1,117 @@
+import pytest
+
+from crm.auth.principal_cache import PrincipalCache
+from crm.models.user import User
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def token_file(tmp_path):
+    path = tmp_path / "token"
+    path.write_text("jeton-a", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def generation():
+    return {"value": 0}
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(token_file, generation, clock):
+    return PrincipalCache(token_file, lambda: generation["value"], clock=clock)
+
+
+def _remember(cache, user_id=7, exp=2000):
+    stamp = cache.stamp()
+    cache.remember(stamp, {"sub": str(user_id), "exp": exp})
+
+
+def test_hit_after_remember(cache):
+    _remember(cache)
+
+    assert cache.lookup(cache.stamp()) == 7
+    assert cache.lookup(cache.stamp()) == 7
+    assert cache.stats() == {"hits": 2, "misses": 0}
+
+
+def test_no_file_means_no_principal(cache, token_file):
+    _remember(cache)
+    token_file.unlink()
+
+    assert cache.stamp() is None
+    assert cache.lookup(cache.stamp()) is None
+
+
+def test_expired_token_is_not_served(cache, clock):
+    _remember(cache, exp=1500)
+    clock.now = 1500
+
+    assert cache.lookup(cache.stamp()) is None
+
+
+def test_token_without_exp_is_not_cached(cache):
+    cache.remember(cache.stamp(), {"sub": "7"})
+
+    assert cache.lookup(cache.stamp()) is None
+
+
+def test_rewritten_file_with_same_content_still_hits(cache, token_file):
+    _remember(cache)
+    token_file.write_text("jeton-a", encoding="utf-8")
+    stamp = cache.stamp()
+
+    assert cache.lookup(stamp) == 7
+
+
+def test_new_token_misses(cache, token_file):
+    _remember(cache)
+    token_file.write_text("jeton-b", encoding="utf-8")
+
+    assert cache.lookup(cache.stamp()) is None
+
+
+def test_revocation_misses(cache, generation):
+    _remember(cache)
+    generation["value"] += 1
+
+    assert cache.lookup(cache.stamp()) is None
+
+
+def test_file_changed_before_remember_is_ignored(cache, token_file):
+    stamp = cache.stamp()
+    token_file.write_text("jeton-b", encoding="utf-8")
+    cache.remember(stamp, {"sub": "7", "exp": 2000})
+
+    assert cache.lookup(cache.stamp()) is None
+
+
+def test_invalidate_only_matching_user(cache):
+    _remember(cache)
+    cache.invalidate(user_id=8)
+    assert cache.lookup(cache.stamp()) == 7
+
+    cache.invalidate(user_id=7)
+    assert cache.lookup(cache.stamp()) is None
+
+
+def test_password_change_forgets_principal(monkeypatch, cache):
+    monkeypatch.setattr("crm.auth.principal_cache.PRINCIPAL", cache)
+    _remember(cache)
+
+    user = User(id=7, username="u", email="u@test.com", employee_number=1)
+    user.set_password("Password123!")
+
+    assert cache.lookup(cache.stamp()) is None
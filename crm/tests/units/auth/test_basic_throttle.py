@@ -0,0 +1,102 @@
+import pytest
+
+from crm.auth.throttle import LoginThrottle
+from crm.errors.exceptions import LoginThrottledError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def throttle(tmp_path, clock):
+    throttle = LoginThrottle(
+        tmp_path / "attempts.db",
+        window_seconds=600,
+        max_per_user=3,
+        max_per_source=5,
+        base_delay=2,
+        max_delay=30,
+        clock=clock,
+    )
+    yield throttle
+    throttle.close()
+
+
+def _fail(throttle, times, username="alice", source="poste-1"):
+    for _ in range(times):
+        throttle.record_failure(username, source)
+
+
+def test_allowed_under_limit(throttle):
+    _fail(throttle, 2)
+
+    assert throttle.retry_after("alice", "poste-1") == 0
+    throttle.check("alice", "poste-1")
+
+
+def test_backoff_doubles_after_limit(throttle, clock):
+    _fail(throttle, 3)
+    assert throttle.retry_after("alice", "poste-1") == 2
+
+    clock.now += 2
+    throttle.check("alice", "poste-1")
+    _fail(throttle, 1)
+    assert throttle.retry_after("alice", "poste-1") == 4
+
+    clock.now += 4
+    _fail(throttle, 1)
+    assert throttle.retry_after("alice", "poste-1") == 8
+
+
+def test_backoff_is_capped(throttle):
+    _fail(throttle, 20)
+
+    assert throttle.retry_after("alice", "poste-1") == 30
+
+
+def test_check_raises_with_retry_after(throttle):
+    _fail(throttle, 3)
+
+    with pytest.raises(LoginThrottledError) as exc:
+        throttle.check("Alice ", "poste-2")
+    assert exc.value.retry_after == 2
+
+
+def test_source_limit_covers_many_usernames(throttle):
+    for index in range(5):
+        throttle.record_failure(f"user{index}", "poste-1")
+
+    assert throttle.retry_after("nouveau", "poste-1") == 2
+    assert throttle.retry_after("nouveau", "poste-2") == 0
+
+
+def test_window_slides(throttle, clock):
+    _fail(throttle, 3)
+    clock.now += 601
+
+    assert throttle.retry_after("alice", "poste-1") == 0
+
+
+def test_success_forgets_user_failures(throttle):
+    _fail(throttle, 3)
+    throttle.record_success("alice", "poste-1")
+
+    assert throttle.retry_after("alice", "poste-2") == 0
+
+
+def test_shared_throttle_is_test_local(tmp_path):
+    from crm.auth.throttle import get_login_throttle
+
+    # Fixture autouse du conftest : jamais le fichier réel des échecs
+    get_login_throttle().record_failure("alice", "poste-1")
+    assert (tmp_path / "login_attempts.db").exists()
@@ -37,8 +37,8 @@ def test_login_success(controller):
 
     assert result["message"] == "Authentification réussie."
     assert "access_token" in result
-    controller.jti_store.add.assert_any_call("jti1")
-    controller.jti_store.add.assert_any_call("jti2")
+    controller.jti_store.add_payload.assert_any_call(fake_payload_access)
+    controller.jti_store.add_payload.assert_any_call(fake_payload_refresh)
 
 
 def test_login_user_not_found(controller):
@@ -1,5 +1,8 @@
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
+from crm.auth.principal_cache import PrincipalCache
 from crm.controllers.base import AbstractController
 
 
@@ -49,6 +52,29 @@ def test_get_current_user_success(controller):
     assert me == fake_user
 
 
+@pytest.mark.no_bypass_auth
+def test_get_current_user_memoized(controller, tmp_path, monkeypatch):
+    token_file = tmp_path / "token"
+    token_file.write_text("tok", encoding="utf-8")
+    cache = PrincipalCache(token_file, lambda: 0)
+    monkeypatch.setattr("crm.controllers.base.PRINCIPAL", cache)
+    fake_user = MagicMock(id=1)
+    with patch(
+        "crm.controllers.base.Authentication.load_token", return_value="tok"
+    ) as load, patch(
+        "crm.controllers.base.Authentication.verify_token",
+        return_value={"sub": "1", "exp": time.time() + 60},
+    ) as verify, patch.object(
+        controller.user_crud, "get_by_id", return_value=fake_user
+    ):
+        controller._get_current_user()
+        me = controller._get_current_user()
+
+    assert me == fake_user
+    load.assert_called_once()
+    verify.assert_called_once()
+
+
 # ---------- _ensure_admin ----------
 @pytest.mark.no_bypass_auth
 def test_ensure_admin_success(controller):
@@ -86,3 +112,64 @@ def test_ensure_owner_or_admin_forbidden(controller):
     with patch("crm.controllers.base.Permission.is_admin", return_value=False):
         with pytest.raises(PermissionError):
             controller._ensure_owner_or_admin(fake_user, owner_id=1)
+
+
+# ---------- Session partagée ----------
+def test_controllers_share_thread_session():
+    from crm.database import close_session, get_session
+
+    try:
+        first, second = DummyController(), DummyController()
+        assert first.session is second.session is get_session()
+        assert first.user_crud.session is first.session
+    finally:
+        close_session()
+
+
+def test_unit_of_work_closes_shared_session():
+    from crm.database import close_session, get_session, unit_of_work
+
+    try:
+        ctrl = DummyController()
+        with patch.object(ctrl.session, "close") as close:
+            with unit_of_work() as session:
+                assert session is ctrl.session
+            close.assert_called_once()
+    finally:
+        close_session()
+
+
+def test_release_for_input_ends_read_transaction():
+    from crm.database import close_session, get_session, release_for_input
+
+    try:
+        session = get_session()
+        with patch.object(session, "in_transaction", return_value=True), patch.object(
+            session, "commit"
+        ) as commit:
+            release_for_input()
+            commit.assert_called_once()
+    finally:
+        close_session()
+
+
+def test_release_for_input_keeps_pending_writes():
+    from crm.database import close_session, get_session, release_for_input
+    from crm.models.user import User
+
+    try:
+        session = get_session()
+        session.add(User(username="pending", email="p@test.com", employee_number=9))
+        with patch.object(session, "in_transaction", return_value=True), patch.object(
+            session, "commit"
+        ) as commit:
+            release_for_input()
+            commit.assert_not_called()
+    finally:
+        close_session()
+
+
+def test_injected_session_is_kept(controller):
+    from crm.database import get_session
+
+    assert controller.session is not get_session()
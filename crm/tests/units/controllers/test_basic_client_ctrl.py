@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import MagicMock, patch
+from crm.auth.permission_config import Crud
 from crm.controllers.client_controller import ClientController
+from crm.crud.base_crud import Page
 
 
 @pytest.fixture
@@ -16,24 +18,41 @@ def controller():
 
 # ---------- list_all ----------
 def test_list_all_success(controller):
-    fake_client = MagicMock(id=1)
-    controller.clients.get_all.return_value = [fake_client]
-    controller.serializer.serialize_list.return_value = [{"id": 1}]
+    controller.clients.paginate_rows.return_value = Page(items=[{"id": 1}])
 
     with patch(
-        "crm.controllers.client_controller.Permission.read_permission",
-        return_value=True,
+        "crm.controllers.client_controller.Permission.owner_scope",
+        return_value=None,
     ):
         result = controller.list_all()
 
     assert result == [{"id": 1}]
-    controller.clients.get_all.assert_called_once()
+    controller.clients.paginate_rows.assert_called_once()
+    controller.serializer.serialize_list.assert_not_called()
+
+
+def test_list_all_truncated_sets_notice(controller):
+    from crm.utils.app_state import AppState
+
+    controller.clients.paginate_rows.return_value = Page(
+        items=[{"id": 1}], has_more=True, next_cursor="c"
+    )
+    AppState.clear_all_messages()
+
+    with patch(
+        "crm.controllers.client_controller.Permission.owner_scope",
+        return_value=None,
+    ):
+        result = controller.list_all()
+
+    assert result == [{"id": 1}]
+    assert "affinez avec un filtre" in AppState.neutral_message()
 
 
 def test_list_all_no_permission(controller):
     with patch(
-        "crm.controllers.client_controller.Permission.read_permission",
-        return_value=False,
+        "crm.controllers.client_controller.Permission.owner_scope",
+        side_effect=PermissionError("Accès refusé."),
     ):
         with pytest.raises(PermissionError):
             controller.list_all()
@@ -41,24 +60,37 @@ def test_list_all_no_permission(controller):
 
 # ---------- get_client ----------
 def test_get_client_success(controller):
-    fake_client = MagicMock(id=2, sales_contact_id=1)
-    controller.clients.get_by_id.return_value = fake_client
+    controller.clients.get_by_id.return_value = MagicMock(id=2)
     controller.serializer.serialize.return_value = {"id": 2}
 
     with patch(
-        "crm.controllers.client_controller.Permission.read_permission",
-        return_value=True,
-    ), patch.object(controller, "_ensure_owner_or_admin", return_value=True):
+        "crm.controllers.client_controller.Permission.owner_scope",
+        return_value=None,
+    ):
         result = controller.get_client(2)
 
     assert result == {"id": 2}
 
 
+def test_get_client_scoped_to_owner(controller):
+    controller.clients.get_by_id.return_value = None
+
+    with patch(
+        "crm.controllers.client_controller.Permission.owner_scope",
+        return_value=1,
+    ) as scope:
+        with pytest.raises(PermissionError):
+            controller.get_client(2)
+
+    scope.assert_called_once_with(controller._get_current_user(), "client", Crud.READ)
+    assert controller.clients.get_by_id.call_args.kwargs["owner_id"] == 1
+
+
 def test_get_client_not_found(controller):
     controller.clients.get_by_id.return_value = None
     with patch(
-        "crm.controllers.client_controller.Permission.read_permission",
-        return_value=True,
+        "crm.controllers.client_controller.Permission.owner_scope",
+        return_value=None,
     ):
         with pytest.raises(ValueError):
             controller.get_client(999)
@@ -66,8 +98,8 @@ def test_get_client_not_found(controller):
 
 def test_get_client_no_permission(controller):
     with patch(
-        "crm.controllers.client_controller.Permission.read_permission",
-        return_value=False,
+        "crm.controllers.client_controller.Permission.owner_scope",
+        side_effect=PermissionError("Accès refusé."),
     ):
         with pytest.raises(PermissionError):
             controller.get_client(1)
@@ -142,33 +174,64 @@ def test_create_client_no_permission(controller):
 # ---------- update_client ----------
 def test_update_client_success(controller):
     fake_client = MagicMock(id=2, sales_contact_id=1)
-    controller.clients.get_by_id.return_value = fake_client
-    controller.clients.update_client.return_value = fake_client
+    controller.clients.get_for_update.return_value = fake_client
+    controller.clients.save.return_value = fake_client
     controller.serializer.serialize.return_value = {"id": 2}
 
-    with patch.object(controller, "_ensure_owner_or_admin", return_value=True), patch(
+    with patch(
+        "crm.controllers.client_controller.Permission.owner_scope", return_value=None
+    ), patch(
         "crm.controllers.client_controller.Permission.is_admin", return_value=True
     ):
         result = controller.update_client(2, {"name": "New Name"})
 
     assert result == {"id": 2}
+    controller.clients.get_for_update.assert_called_once_with(2, owner_id=None)
 
 
 def test_update_client_not_found(controller):
-    controller.clients.get_by_id.return_value = None
-    with pytest.raises(ValueError):
-        controller.update_client(2, {"name": "New"})
+    controller.clients.get_for_update.return_value = None
+    with patch(
+        "crm.controllers.client_controller.Permission.owner_scope", return_value=None
+    ):
+        with pytest.raises(ValueError):
+            controller.update_client(2, {"name": "New"})
+
+
+def test_update_client_denied_before_lock(controller):
+    with patch(
+        "crm.controllers.client_controller.Permission.owner_scope",
+        side_effect=PermissionError("Accès refusé."),
+    ):
+        with pytest.raises(PermissionError):
+            controller.update_client(2, {"name": "New"})
+    controller.clients.get_for_update.assert_not_called()
+
+
+def test_update_client_other_owner_denied(controller):
+    # Ligne hors périmètre : même refus qu'une ligne absente
+    controller.clients.get_for_update.return_value = None
+    with patch(
+        "crm.controllers.client_controller.Permission.owner_scope", return_value=1
+    ):
+        with pytest.raises(PermissionError):
+            controller.update_client(2, {"name": "New"})
+    controller.clients.get_for_update.assert_called_once_with(2, owner_id=1)
 
 
 def test_update_client_reassign_non_admin(controller):
     fake_client = MagicMock(id=2, sales_contact_id=1)
-    controller.clients.get_by_id.return_value = fake_client
+    controller.clients.get_for_update.return_value = fake_client
 
-    with patch.object(controller, "_ensure_owner_or_admin", return_value=True), patch(
+    with patch(
+        "crm.controllers.client_controller.Permission.owner_scope", return_value=1
+    ), patch(
         "crm.controllers.client_controller.Permission.is_admin", return_value=False
     ):
         with pytest.raises(PermissionError):
             controller.update_client(2, {"sales_contact_id": 99})
+    controller.session.rollback.assert_called_once()
+    controller.clients.save.assert_not_called()
 
 
 # ---------- delete_client ----------
@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import MagicMock, patch
+from crm.auth.permission_config import Crud
 from crm.controllers.contract_controller import ContractController
+from crm.crud.base_crud import Page
 
 
 @pytest.fixture
@@ -23,24 +25,23 @@ def fake_selectinload(*args, **kwargs):
 
 # ---------- list_all ----------
 def test_list_all_success(controller):
-    fake_contract = MagicMock(id=1)
-    controller.contracts.get_all.return_value = [fake_contract]
-    controller.serializer.serialize_list.return_value = [{"id": 1}]
+    controller.contracts.paginate_rows.return_value = Page(items=[{"id": 1}])
 
     with patch(
-        "crm.controllers.contract_controller.Permission.read_permission",
-        return_value=True,
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        return_value=None,
     ):
         result = controller.list_all()
 
     assert result == [{"id": 1}]
-    controller.contracts.get_all.assert_called_once()
+    controller.contracts.paginate_rows.assert_called_once()
+    controller.serializer.serialize_list.assert_not_called()
 
 
 def test_list_all_no_permission(controller):
     with patch(
-        "crm.controllers.contract_controller.Permission.read_permission",
-        return_value=False,
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        side_effect=PermissionError("Accès refusé."),
     ):
         with pytest.raises(PermissionError):
             controller.list_all()
@@ -48,24 +49,37 @@ def test_list_all_no_permission(controller):
 
 # ---------- get_contract ----------
 def test_get_contract_success(controller):
-    fake_contract = MagicMock(id=2, client=MagicMock(sales_contact_id=1))
-    controller.contracts.get_by_id.return_value = fake_contract
+    controller.contracts.get_by_id.return_value = MagicMock(id=2)
     controller.serializer.serialize.return_value = {"id": 2}
 
     with patch(
-        "crm.controllers.contract_controller.Permission.read_permission",
-        return_value=True,
-    ), patch.object(controller, "_ensure_owner_or_admin", return_value=True):
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        return_value=None,
+    ):
         result = controller.get_contract(2)
 
     assert result == {"id": 2}
 
 
+def test_get_contract_scoped_to_owner(controller):
+    controller.contracts.get_by_id.return_value = None
+
+    with patch(
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        return_value=1,
+    ) as scope:
+        with pytest.raises(PermissionError):
+            controller.get_contract(2)
+
+    scope.assert_called_once_with(controller._get_current_user(), "contract", Crud.READ)
+    assert controller.contracts.get_by_id.call_args.kwargs["owner_id"] == 1
+
+
 def test_get_contract_not_found(controller):
     controller.contracts.get_by_id.return_value = None
     with patch(
-        "crm.controllers.contract_controller.Permission.read_permission",
-        return_value=True,
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        return_value=None,
     ):
         with pytest.raises(ValueError):
             controller.get_contract(999)
@@ -73,8 +87,8 @@ def test_get_contract_not_found(controller):
 
 def test_get_contract_no_permission(controller):
     with patch(
-        "crm.controllers.contract_controller.Permission.read_permission",
-        return_value=False,
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        side_effect=PermissionError("Accès refusé."),
     ):
         with pytest.raises(PermissionError):
             controller.get_contract(1)
@@ -104,7 +118,7 @@ def test_is_contract_signed_not_found(controller):
 # ---------- list_unsigned_contracts / signed ----------
 def test_list_unsigned_contracts_success(controller):
     fake_contract = MagicMock(id=1)
-    controller.contracts.get_all.return_value = [fake_contract]
+    controller.contracts.get_unsigned_contracts.return_value = [fake_contract]
     controller.serializer.serialize_list.return_value = [{"id": 1}]
 
     with patch(
@@ -114,11 +128,13 @@ def test_list_unsigned_contracts_success(controller):
         result = controller.list_unsigned_contracts(signed=False)
 
     assert result == [{"id": 1}]
+    kwargs = controller.contracts.get_unsigned_contracts.call_args.kwargs
+    assert kwargs["signed"] is False
 
 
 def test_list_signed_contracts_success(controller):
     fake_contract = MagicMock(id=2)
-    controller.contracts.get_all.return_value = [fake_contract]
+    controller.contracts.get_unsigned_contracts.return_value = [fake_contract]
     controller.serializer.serialize_list.return_value = [{"id": 2}]
 
     with patch(
@@ -175,16 +191,17 @@ def test_get_contract_owner_no_permission(controller):
 
 # ---------- get_contract_amounts ----------
 def test_get_contract_amounts_success(controller):
-    fake_contract = MagicMock(amount_total="100", amount_due="50")
+    fake_contract = MagicMock(amount_total="100", amount_due="50", version_id=3)
     controller.contracts.get_by_id.return_value = fake_contract
     with patch(
         "crm.controllers.contract_controller.Permission.read_permission",
         return_value=True,
     ):
-        total, due = controller.get_contract_amounts(1)
+        total, due, version_id = controller.get_contract_amounts(1)
 
     assert total == 100
     assert due == 50
+    assert version_id == 3
 
 
 def test_get_contract_amounts_not_found(controller):
@@ -223,56 +240,78 @@ def test_create_contract_no_permission(controller):
 
 # ---------- update_contract ----------
 def test_update_contract_success_admin(controller):
-    fake_owner = MagicMock(id=1)
-    fake_contract = MagicMock(id=2)
-    controller.get_contract_owner = MagicMock(return_value=fake_owner)
-    controller.contracts.get_by_id.return_value = fake_contract
-    controller.contracts.update.return_value = fake_contract
+    fake_contract = MagicMock(id=2, sales_contact_id=1)
+    controller.contracts.get_for_update.return_value = fake_contract
+    controller.contracts.save.return_value = fake_contract
     controller.serializer.serialize.return_value = {"id": 2}
 
     with patch(
-        "crm.controllers.contract_controller.Permission.update_permission",
-        return_value=True,
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        return_value=None,
     ), patch(
         "crm.controllers.contract_controller.Permission.is_admin", return_value=True
     ):
         result = controller.update_contract(2, {"client_id": 5})
 
     assert result == {"id": 2}
+    controller._get_current_user.assert_called_once()
+    controller.contracts.get_for_update.assert_called_once_with(2, owner_id=None)
+    controller.contracts.save.assert_called_once_with(fake_contract, {"client_id": 5})
+    controller.contracts.get_by_id.assert_not_called()
 
 
 def test_update_contract_non_admin_filters_fields(controller):
-    fake_owner = MagicMock(id=1)
-    fake_contract = MagicMock(id=2)
-    controller.get_contract_owner = MagicMock(return_value=fake_owner)
-    controller.contracts.get_by_id.return_value = fake_contract
-    controller.contracts.update.return_value = fake_contract
+    fake_contract = MagicMock(id=2, sales_contact_id=1)
+    controller.contracts.get_for_update.return_value = fake_contract
+    controller.contracts.save.return_value = fake_contract
     controller.serializer.serialize.return_value = {"id": 2}
 
     with patch(
-        "crm.controllers.contract_controller.Permission.update_permission",
-        return_value=True,
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        return_value=None,
     ), patch(
         "crm.controllers.contract_controller.Permission.is_admin", return_value=False
     ):
         result = controller.update_contract(2, {"client_id": 123, "foo": "bar"})
 
-    assert "client_id" not in controller.contracts.update.call_args[0][1]
+    assert "client_id" not in controller.contracts.save.call_args[0][1]
 
 
 def test_update_contract_not_found(controller):
-    fake_owner = MagicMock(id=1)
-    controller.get_contract_owner = MagicMock(return_value=fake_owner)
-    controller.contracts.get_by_id.return_value = None
+    controller.contracts.get_for_update.return_value = None
 
     with patch(
-        "crm.controllers.contract_controller.Permission.update_permission",
-        return_value=True,
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        return_value=None,
     ):
         with pytest.raises(ValueError):
             controller.update_contract(2, {"foo": "bar"})
 
 
+def test_update_contract_no_permission(controller):
+    with patch(
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        side_effect=PermissionError("Accès refusé."),
+    ):
+        with pytest.raises(PermissionError):
+            controller.update_contract(2, {"foo": "bar"})
+    # refus avant toute lecture verrouillée
+    controller.contracts.get_for_update.assert_not_called()
+    controller.contracts.save.assert_not_called()
+
+
+def test_update_contract_other_owner_denied(controller):
+    controller.contracts.get_for_update.return_value = None
+
+    with patch(
+        "crm.controllers.contract_controller.Permission.owner_scope",
+        return_value=1,
+    ):
+        with pytest.raises(PermissionError):
+            controller.update_contract(2, {"foo": "bar"})
+    controller.contracts.get_for_update.assert_called_once_with(2, owner_id=1)
+
+
 # ---------- delete_contract ----------
 def test_delete_contract_success(controller):
     fake_contract = MagicMock(is_signed=False)
@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
+from crm.auth.permission_config import Crud
 from crm.controllers.event_controller import EventController
+from crm.crud.base_crud import Page
 
 
 @pytest.fixture
@@ -20,19 +22,30 @@ def controller():
 
 # ---------- list_all ----------
 def test_list_all_success(controller):
-    controller.events.get_all.return_value = [MagicMock()]
-    controller.serializer.serialize_list.return_value = [{"id": 1}]
+    controller.events.paginate_rows.return_value = Page(items=[{"id": 1}])
     with patch(
-        "crm.controllers.event_controller.Permission.read_permission", return_value=True
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
     ):
         result = controller.list_all()
     assert result == [{"id": 1}]
 
 
+def test_list_all_scoped_to_owner(controller):
+    controller.events.paginate_rows.return_value = Page()
+    with patch(
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=7,
+    ) as scope:
+        controller.list_all(op=Crud.UPDATE)
+    scope.assert_called_once_with(controller._get_current_user(), "event", Crud.UPDATE)
+    assert controller.events.paginate_rows.call_args.kwargs["owner_id"] == 7
+
+
 def test_list_all_no_permission(controller):
     with patch(
-        "crm.controllers.event_controller.Permission.read_permission",
-        return_value=False,
+        "crm.controllers.event_controller.Permission.owner_scope",
+        side_effect=PermissionError("Accès refusé."),
     ):
         with pytest.raises(PermissionError):
             controller.list_all()
@@ -148,19 +161,32 @@ def test_create_note_success(controller):
     controller.events.get_by_id.return_value = MagicMock()
     controller.events.create_note.return_value = MagicMock()
     with patch(
-        "crm.controllers.event_controller.Permission.update_permission",
-        return_value=True,
-    ), patch.object(controller, "get_support_contact_id", return_value=1):
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
+    ):
         controller.create_note(1, "note")
         controller.events.create_note.assert_called_once()
 
 
+def test_create_note_scoped_to_support(controller):
+    controller.events.get_by_id.return_value = None
+    with patch(
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=7,
+    ) as scope:
+        with pytest.raises(PermissionError):
+            controller.create_note(1, "note")
+    scope.assert_called_once_with(controller._get_current_user(), "event", Crud.UPDATE)
+    controller.events.get_by_id.assert_called_once_with(1, owner_id=7)
+    controller.events.create_note.assert_not_called()
+
+
 def test_create_note_event_not_found(controller):
     controller.events.get_by_id.return_value = None
     with patch(
-        "crm.controllers.event_controller.Permission.update_permission",
-        return_value=True,
-    ), patch.object(controller, "get_support_contact_id", return_value=1):
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
+    ):
         with pytest.raises(ValueError):
             controller.create_note(1, "note")
 
@@ -169,9 +195,9 @@ def test_create_note_creation_failed(controller):
     controller.events.get_by_id.return_value = MagicMock()
     controller.events.create_note.return_value = None
     with patch(
-        "crm.controllers.event_controller.Permission.update_permission",
-        return_value=True,
-    ), patch.object(controller, "get_support_contact_id", return_value=1):
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
+    ):
         with pytest.raises(ValueError):
             controller.create_note(1, "note")
 
@@ -181,13 +207,13 @@ def test_update_event_success_admin(controller):
     fake_event = MagicMock(
         id=2, support_contact_id=1, date_start=datetime.now(), date_end=datetime.now()
     )
-    controller.events.get_by_id.return_value = fake_event
-    controller.events.update.return_value = fake_event
+    controller.events.get_for_update.return_value = fake_event
+    controller.events.save.return_value = fake_event
     controller.serializer.serialize.return_value = {"id": 2}
     controller.contracts.get_by_id.return_value = MagicMock()
     with patch(
-        "crm.controllers.event_controller.Permission.update_permission",
-        return_value=True,
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
     ), patch(
         "crm.controllers.event_controller.Permission.is_admin", return_value=True
     ), patch(
@@ -201,26 +227,40 @@ def test_update_event_non_admin_filters_fields(controller):
     fake_event = MagicMock(
         id=2, support_contact_id=1, date_start=datetime.now(), date_end=datetime.now()
     )
-    controller.events.get_by_id.return_value = fake_event
-    controller.events.update.return_value = fake_event
+    controller.events.get_for_update.return_value = fake_event
+    controller.events.save.return_value = fake_event
     controller.serializer.serialize.return_value = {"id": 2}
     with patch(
-        "crm.controllers.event_controller.Permission.update_permission",
-        return_value=True,
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
     ), patch(
         "crm.controllers.event_controller.Permission.is_admin", return_value=False
     ), patch(
         "crm.controllers.event_controller.Validations.validate_date_order"
     ):
         controller.update_event(2, {"contract_id": 5, "foo": "bar"})
-        args, kwargs = controller.events.update.call_args
+        args, kwargs = controller.events.save.call_args
         assert "contract_id" not in kwargs["data"] if "data" in kwargs else args[1]
 
 
 def test_update_event_not_found(controller):
-    controller.events.get_by_id.return_value = None
-    with pytest.raises(ValueError):
-        controller.update_event(2, {})
+    controller.events.get_for_update.return_value = None
+    with patch(
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
+    ):
+        with pytest.raises(ValueError):
+            controller.update_event(2, {})
+
+
+def test_update_event_denied_before_lock(controller):
+    with patch(
+        "crm.controllers.event_controller.Permission.owner_scope",
+        side_effect=PermissionError("Accès refusé."),
+    ):
+        with pytest.raises(PermissionError):
+            controller.update_event(2, {})
+    controller.events.get_for_update.assert_not_called()
 
 
 # ---------- delete_event ----------
@@ -260,18 +300,29 @@ def test_delete_event_failed(controller):
 def test_delete_note_success(controller):
     controller.events.delete_note.return_value = True
     with patch(
-        "crm.controllers.event_controller.Permission.update_permission",
-        return_value=True,
-    ), patch.object(controller, "get_support_contact_id", return_value=1):
-        controller.delete_note(1, 1)
-        controller.events.delete_note.assert_called_once_with(1)
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
+    ):
+        controller.delete_note(1, 2)
+    controller.events.delete_note.assert_called_once_with(2, event_id=1, owner_id=None)
 
 
 def test_delete_note_not_found(controller):
-    controller.events.delete_note.side_effect = ValueError
+    controller.events.delete_note.return_value = False
     with patch(
-        "crm.controllers.event_controller.Permission.update_permission",
-        return_value=True,
-    ), patch.object(controller, "get_support_contact_id", return_value=1):
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=None,
+    ):
         with pytest.raises(ValueError):
-            controller.delete_note(1, 1)
+            controller.delete_note(1, 2)
+
+
+def test_delete_note_outside_scope_is_denied(controller):
+    controller.events.delete_note.return_value = False
+    with patch(
+        "crm.controllers.event_controller.Permission.owner_scope",
+        return_value=7,
+    ):
+        with pytest.raises(PermissionError):
+            controller.delete_note(1, 2)
+    controller.events.delete_note.assert_called_once_with(2, event_id=1, owner_id=7)
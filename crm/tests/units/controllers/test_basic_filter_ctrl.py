@@ -83,3 +83,26 @@ def test_show_filter_menu_success(controller):
     controller.show_filter_menu("clients")
 
     controller.view.list_filtered.assert_called_once_with("clients", fake_result)
+
+
+def test_list_filtered_operator_not_allowed_for_type(controller):
+    with pytest.raises(ValueError):
+        controller.list_filtered("contracts", {"is_signed": {"gt": True}})
+
+
+def test_list_filtered_group_field_not_allowed(controller):
+    with pytest.raises(ValueError):
+        controller.list_filtered(
+            "clients", {"$or": [{"company_name": "X"}, {"password_hash": "x"}]}
+        )
+
+
+def test_list_filtered_rich_filters_forwarded(controller):
+    filters = {
+        "amount_due": {"gt": 0},
+        "$or": [{"client_name": {"prefix": "Du"}}, {"is_signed": True}],
+    }
+    controller.list_filtered("contracts", filters)
+    controller.controllers["contracts"].list_all.assert_called_once_with(
+        filters=filters
+    )
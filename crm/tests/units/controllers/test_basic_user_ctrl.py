@@ -144,3 +144,35 @@ def test_update_user_no_permission(controller):
     ):
         with pytest.raises(PermissionError):
             controller.update_user(2, {"username": "newname"})
+
+
+def test_update_user_password_revokes_sessions(controller):
+    fake_user = MagicMock(id=2)
+    controller.users.get_by_id.return_value = fake_user
+    controller.users.update_user.return_value = fake_user
+    store = MagicMock()
+
+    with patch(
+        "crm.controllers.user_controller.Permission.update_permission",
+        return_value=True,
+    ), patch(
+        "crm.controllers.user_controller.Permission.is_admin", return_value=False
+    ), patch(
+        "crm.controllers.user_controller.get_jti_store", return_value=store
+    ):
+        controller.update_user(2, {"password": "Password123!"})
+        controller.update_user(2, {"username": "newname"})
+
+    store.revoke_user.assert_called_once_with(2)
+
+
+def test_change_password_revokes_sessions(controller):
+    controller.users.update_password.return_value = True
+    store = MagicMock()
+
+    with patch(
+        "crm.controllers.user_controller.Permission.is_admin", return_value=True
+    ), patch("crm.controllers.user_controller.get_jti_store", return_value=store):
+        controller.change_password(2, "Password123!")
+
+    store.revoke_user.assert_called_once_with(2)
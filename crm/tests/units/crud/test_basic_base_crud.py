@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
-from crm.crud.base_crud import AbstractBaseCRUD
+from crm.crud import base_crud
+from crm.crud.base_crud import AbstractBaseCRUD, Page, RowField, loader_options
 
 
 class FakeColumn:
@@ -22,8 +23,17 @@ def crud():
     return AbstractBaseCRUD(session=MagicMock())
 
 
+def _chain(fake_query):
+    """Rend la requête mockée chaînable (filter/order_by/limit)."""
+    fake_query.filter.return_value = fake_query
+    fake_query.options.return_value = fake_query
+    fake_query.order_by.return_value = fake_query
+    fake_query.limit.return_value = fake_query
+    return fake_query
+
+
 def test_get_entities_no_filters(crud):
-    fake_query = MagicMock()
+    fake_query = _chain(MagicMock())
     fake_query.all.return_value = ["entity1", "entity2"]
     crud.session.query.return_value = fake_query
 
@@ -35,8 +45,7 @@ def test_get_entities_no_filters(crud):
 
 
 def test_get_entities_with_eager_options(crud):
-    fake_query = MagicMock()
-    fake_query.options.return_value = fake_query
+    fake_query = _chain(MagicMock())
     fake_query.all.return_value = ["entity"]
     crud.session.query.return_value = fake_query
 
@@ -47,8 +56,7 @@ def test_get_entities_with_eager_options(crud):
 
 
 def test_get_entities_with_owner_filter(crud):
-    fake_query = MagicMock()
-    fake_query.filter.return_value = fake_query
+    fake_query = _chain(MagicMock())
     fake_query.all.return_value = ["entity"]
     crud.session.query.return_value = fake_query
 
@@ -58,9 +66,15 @@ def test_get_entities_with_owner_filter(crud):
     fake_query.filter.assert_called_once()
 
 
+def test_get_entities_owner_scope_without_owner_field_raises(crud):
+    crud.session.query.return_value = _chain(MagicMock())
+
+    with pytest.raises(ValueError):
+        crud.get_entities(FakeModel, owner_id=42)
+
+
 def test_get_entities_with_filters(crud):
-    fake_query = MagicMock()
-    fake_query.filter.return_value = fake_query
+    fake_query = _chain(MagicMock())
     fake_query.all.return_value = ["entity"]
     crud.session.query.return_value = fake_query
 
@@ -71,8 +85,7 @@ def test_get_entities_with_filters(crud):
 
 
 def test_get_entities_ignore_invalid_filter(crud):
-    fake_query = MagicMock()
-    fake_query.filter.return_value = fake_query
+    fake_query = _chain(MagicMock())
     fake_query.all.return_value = ["entity"]
     crud.session.query.return_value = fake_query
 
@@ -83,6 +96,122 @@ def test_get_entities_ignore_invalid_filter(crud):
     fake_query.filter.assert_not_called()  # rien filtré car champ inexistant
 
 
-def test_get_entities_with_order_by_raises(crud):
+def test_get_entities_with_order_by_not_whitelisted_raises(crud):
     with pytest.raises(ValueError):
         crud.get_entities(FakeModel, order_by="name")
+
+
+def test_get_entities_applies_row_ceiling(crud, monkeypatch, caplog):
+    monkeypatch.setitem(base_crud.QUERY_LIMITS, "max_rows", 2)
+    fake_query = _chain(MagicMock())
+    rows = [MagicMock(id=1), MagicMock(id=2), MagicMock(id=3)]
+    fake_query.all.return_value = rows
+    crud.session.query.return_value = fake_query
+
+    with caplog.at_level("WARNING", logger=base_crud.__name__):
+        result = crud.get_entities(FakeModel)
+
+    assert result == rows[:2]
+    fake_query.limit.assert_called_once_with(3)
+    assert "tronqué à 2 lignes" in caplog.text
+
+
+def test_iter_entities_pages_past_the_ceiling(crud, monkeypatch):
+    monkeypatch.setitem(base_crud.QUERY_LIMITS, "max_rows", 2)
+    pages = [
+        Page(items=["a", "b"], has_more=True, next_cursor="c1"),
+        Page(items=["c"], has_more=False),
+    ]
+    get_page = MagicMock(side_effect=pages)
+    monkeypatch.setattr(crud, "get_page", get_page)
+
+    assert list(crud.iter_entities(FakeModel)) == ["a", "b", "c"]
+    assert [c.kwargs["after"] for c in get_page.call_args_list] == [None, "c1"]
+    assert {c.kwargs["limit"] for c in get_page.call_args_list} == {2}
+
+
+def test_list_wrappers_read_model_with_its_eager_options(monkeypatch):
+    class FakeCRUD(AbstractBaseCRUD):
+        MODEL = FakeModel
+
+        def _list_eager_options(self):
+            return ("opt",)
+
+    crud = FakeCRUD(session=MagicMock())
+    get_page = MagicMock(return_value=Page(items=[]))
+    select_rows_page = MagicMock(return_value=Page(items=[]))
+    monkeypatch.setattr(crud, "get_page", get_page)
+    monkeypatch.setattr(crud, "select_rows_page", select_rows_page)
+
+    crud.paginate(owner_id=3, limit=10)
+    crud.paginate_rows(fields=["id"], owner_id=3)
+
+    args, kwargs = get_page.call_args
+    assert args == (FakeModel,)
+    assert kwargs["eager_options"] == ("opt",) and kwargs["owner_id"] == 3
+    assert select_rows_page.call_args[0] == (FakeModel, ["id"])
+
+
+def test_get_page_has_more_and_cursor(crud):
+    rows = [MagicMock(id=1), MagicMock(id=2), MagicMock(id=3)]
+    fake_query = _chain(MagicMock())
+    fake_query.all.return_value = rows
+    crud.session.query.return_value = fake_query
+
+    page = crud.get_page(FakeModel, limit=2)
+
+    assert isinstance(page, Page)
+    assert page.items == rows[:2]
+    assert page.has_more is True
+    assert crud._decode_cursor(page.next_cursor) == [2, 2]
+
+
+def test_get_page_last_page_has_no_cursor(crud):
+    fake_query = _chain(MagicMock())
+    fake_query.all.return_value = [MagicMock(id=1)]
+    crud.session.query.return_value = fake_query
+
+    page = crud.get_page(FakeModel, limit=2)
+
+    assert page.has_more is False
+    assert page.next_cursor is None
+
+
+def test_get_page_invalid_limit_raises(crud):
+    crud.session.query.return_value = _chain(MagicMock())
+    with pytest.raises(ValueError):
+        crud.get_page(FakeModel, limit=0)
+
+
+def test_decode_cursor_invalid_raises(crud):
+    with pytest.raises(ValueError):
+        crud._decode_cursor("pas-un-curseur")
+
+
+# ---------- Lecture directe ----------
+def test_row_field_reads_its_column_with_default():
+    read = RowField(columns=("username",), default="Aucun contact").getter(1)
+
+    assert read((7, "alice")) == "alice"
+    assert read((7, None)) == "Aucun contact"
+
+
+def test_row_field_builds_from_several_columns():
+    read = RowField(
+        columns=("email", "phone"), build=lambda email, phone: [email, phone]
+    ).getter(1)
+
+    assert read((7, "a@b.fr", "0102030405", 99)) == ["a@b.fr", "0102030405"]
+
+
+# ---------- Chargement des relations ----------
+def test_loader_options_follow_relationship_direction():
+    from crm.models.event import Event
+
+    options = loader_options(Event, ["notes", "contract.client"])
+
+    # Chemins triés : contract.client (many-to-one, JOIN), notes (collection)
+    strategies = [[dict(e.strategy)["lazy"] for e in opt.context] for opt in options]
+    assert strategies == [["joined", "joined"], ["selectin"]]
+    # Options construites une fois par (modèle, chemins)
+    assert loader_options(Event, ("contract.client", "notes")) is options
@@ -53,10 +53,10 @@ def test_get_by_id(crud):
 
 
 def test_get_clients_by_sales_contact(crud):
-    crud.session.query.return_value.filter_by.return_value.all.return_value = ["c1"]
+    crud.session.scalars.return_value = iter(["c1"])
     result = crud.get_clients_by_sales_contact(42)
     assert result == ["c1"]
-    crud.session.query.assert_called_once()
+    assert crud.session.scalars.call_args.args[1] == {"sales_contact_id": 42}
 
 
 # ---------- UPDATE ----------
@@ -65,7 +65,8 @@ def test_update_client_success(crud):
     crud.session.get.return_value = fake_client
     result = crud.update_client(1, {"company_name": "NewCorp"})
     crud.session.commit.assert_called_once()
-    crud.session.refresh.assert_called_once_with(fake_client)
+    # Pas de refresh : l'objet n'est pas expiré par le commit
+    crud.session.refresh.assert_not_called()
     assert result == fake_client
     assert fake_client.company_name == "NewCorp"
 
@@ -159,3 +160,9 @@ def test_client_has_contracts_false(crud):
 def test_client_has_contracts_not_found(crud):
     crud.session.get.return_value = None
     assert crud.client_has_contracts(1) is False
+
+
+# ---------- PROJECTION ----------
+def test_relationship_options_only_when_needed(crud):
+    assert crud._relationship_options({"id", "full_name"}) == ()
+    assert len(crud._relationship_options({"sales_contact_name"})) == 1
@@ -79,19 +79,19 @@ def test_get_by_sales_contact(crud):
 
 
 def test_get_unsigned_contracts(crud):
-    with patch.object(crud, "get_all", return_value=["c3"]) as mock_get:
+    with patch.object(crud, "iter_entities", return_value=iter(["c3"])) as mock_iter:
         result = crud.get_unsigned_contracts()
     assert result == ["c3"]
-    mock_get.assert_called_once()
-    args, kwargs = mock_get.call_args
+    mock_iter.assert_called_once()
+    args, kwargs = mock_iter.call_args
     assert kwargs["filters"]["is_signed"] is False
 
 
 def test_get_unsigned_contracts_with_sales_contact(crud):
-    with patch.object(crud, "get_all", return_value=["c3"]) as mock_get:
+    with patch.object(crud, "iter_entities", return_value=iter(["c3"])) as mock_iter:
         result = crud.get_unsigned_contracts(sales_contact_id=99)
     assert result == ["c3"]
-    args, kwargs = mock_get.call_args
+    args, kwargs = mock_iter.call_args
     assert kwargs["filters"]["sales_contact_id"] == 99
 
 
@@ -101,7 +101,8 @@ def test_update_contract_success(crud):
     crud.session.get.return_value = fake_contract
     result = crud.update(1, {"amount_total": 2000})
     crud.session.commit.assert_called_once()
-    crud.session.refresh.assert_called_once_with(fake_contract)
+    # Pas de refresh : l'objet n'est pas expiré par le commit
+    crud.session.refresh.assert_not_called()
     assert result == fake_contract
     assert fake_contract.amount_total == 2000
 
@@ -0,0 +1,50 @@
+from crm.crud.entity_cache import ALL, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hit_then_expire():
+    clock = FakeClock()
+    cache = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.put("k", "v")
+
+    assert cache.get("k") == "v"
+    clock.now = 6
+    assert cache.get("k") != "v"
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 0}
+
+
+def test_lru_eviction():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" devient le moins récemment utilisé
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_invalidate_keys_and_all():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.invalidate(["a"])
+    assert cache.stats()["size"] == 1
+    cache.invalidate([ALL])
+    assert cache.stats()["size"] == 0
+
+
+def test_disabled_when_ttl_zero():
+    cache = TTLCache(max_entries=10, ttl_seconds=0)
+    cache.put("a", 1)
+    assert cache.stats()["size"] == 0
@@ -75,7 +75,7 @@ def test_get_by_support_contact(crud):
 
 
 def test_get_notes(crud):
-    crud.session.query.return_value.filter_by.return_value.all.return_value = ["n1"]
+    crud.session.scalars.return_value = iter(["n1"])
     result = crud.get_notes(5)
     assert result == ["n1"]
 
@@ -86,7 +86,8 @@ def test_update_event_success(crud):
     crud.session.get.return_value = fake_event
     result = crud.update(1, {"name": "Updated"})
     crud.session.commit.assert_called_once()
-    crud.session.refresh.assert_called_once_with(fake_event)
+    # Pas de refresh : l'objet n'est pas expiré par le commit
+    crud.session.refresh.assert_not_called()
     assert result == fake_event
     assert fake_event.name == "Updated"
 
@@ -0,0 +1,83 @@
+import pytest
+from decimal import Decimal
+from sqlalchemy import select
+from crm.crud.filters import FilterCompiler, filter_fields
+from crm.crud.client_crud import ClientCRUD
+from crm.crud.contract_crud import ContractCRUD
+from crm.crud.event_crud import EventCRUD
+from crm.models.client import Client
+from crm.models.contract import Contract
+from crm.models.event import Event
+
+
+def _sql(model, targets, filters):
+    joins, clause = FilterCompiler(model, targets).compile(filters)
+    stmt = select(model.id)
+    for relationship in joins:
+        stmt = stmt.outerjoin(relationship)
+    if clause is not None:
+        stmt = stmt.where(clause)
+    return str(stmt.compile(compile_kwargs={"literal_binds": True}))
+
+
+def test_plain_equality_and_in():
+    sql = _sql(Client, {}, {"company_name": "Acme", "id": [1, 2]})
+    assert "clients.company_name = 'Acme'" in sql
+    assert "clients.id IN (1, 2)" in sql
+
+
+def test_hybrid_name_becomes_join_not_subquery():
+    sql = _sql(Contract, ContractCRUD.FILTER_TARGETS, {"client_name": "Dupont"})
+    assert "LEFT OUTER JOIN clients" in sql
+    assert "clients.full_name = 'Dupont'" in sql
+    assert "(SELECT" not in sql
+
+
+def test_event_client_name_joins_through_contract():
+    sql = _sql(Event, EventCRUD.FILTER_TARGETS, {"client_name": {"prefix": "Du"}})
+    assert sql.index("JOIN contracts") < sql.index("JOIN clients")
+    assert "clients.full_name LIKE 'Du%'" in sql
+
+
+def test_prefix_escapes_wildcards():
+    sql = _sql(Client, {}, {"company_name": {"prefix": "50%_"}})
+    assert "LIKE '50\\%\\_%'" in sql
+
+
+def test_ranges_and_or_groups():
+    filters = {
+        "amount_due": {"gt": Decimal("0"), "lte": Decimal("500")},
+        "$or": [{"is_signed": True}, {"client_name": {"contains": "corp"}}],
+    }
+    sql = _sql(Contract, ContractCRUD.FILTER_TARGETS, filters)
+    assert "contracts.amount_due > 0" in sql
+    assert "contracts.amount_due <= 500" in sql
+    assert " OR " in sql
+    assert "lower(clients.full_name) LIKE lower('%corp%')" in sql
+
+
+def test_derived_booleans():
+    unpaid = _sql(Contract, ContractCRUD.FILTER_TARGETS, {"is_payed": False})
+    assert "contracts.amount_due > 0" in unpaid
+    unassigned = _sql(Client, ClientCRUD.FILTER_TARGETS, {"is_assigned": False})
+    assert "clients.sales_contact_id IS NULL" in unassigned
+
+
+def test_unknown_operator_rejected():
+    with pytest.raises(ValueError):
+        FilterCompiler(Client).compile({"company_name": {"regex": ".*"}})
+
+
+def test_invalid_group_rejected():
+    with pytest.raises(ValueError):
+        FilterCompiler(Client).compile({"$or": {"company_name": "x"}})
+
+
+def test_unknown_field_ignored():
+    joins, clause = FilterCompiler(Client).compile({"nope": 1})
+    assert joins == [] and clause is None
+
+
+def test_filter_fields_flattens_groups():
+    fields = filter_fields({"a": 1, "$or": [{"b": 2}, {"$and": [{"c": 3}]}]})
+    assert fields == [("a", 1), ("b", 2), ("c", 3)]
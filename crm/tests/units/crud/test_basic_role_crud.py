@@ -4,6 +4,14 @@ from sqlalchemy.exc import IntegrityError
 from crm.crud.role_crud import RoleCRUD
 
 
+@pytest.fixture(autouse=True)
+def no_entity_cache(monkeypatch):
+    """Session mockée : lecture directe, sans passer par le cache processus."""
+    from crm.crud import entity_cache
+
+    monkeypatch.setattr(entity_cache, "get_role", lambda s, i, load: load())
+
+
 @pytest.fixture
 def crud():
     return RoleCRUD(session=MagicMock())
@@ -53,10 +61,18 @@ def test_get_by_id(crud):
 
 
 def test_find_by_name(crud):
-    crud.session.query.return_value.filter_by.return_value.first.return_value = "role"
+    crud.session.execute.return_value.all.return_value = [("admin", 1)]
+    crud.session.get.return_value = "role"
     result = crud.find_by_name("admin")
     assert result == "role"
-    crud.session.query.assert_called_once()
+    crud.session.get.assert_called_once()
+
+
+def test_find_by_name_registry_loaded_once(crud):
+    crud.session.execute.return_value.all.return_value = [("admin", 1)]
+    crud.find_by_name("admin")
+    assert crud.find_by_name("inconnu") is None
+    crud.session.execute.assert_called_once()
 
 
 # ---------- UPDATE ----------
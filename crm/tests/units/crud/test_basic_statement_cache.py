@@ -0,0 +1,45 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from crm.crud.statement_cache import StatementCache
+
+
+def test_build_once_then_hit():
+    cache = StatementCache()
+    build = MagicMock(return_value="stmt")
+
+    assert cache.get("k", build) == "stmt"
+    assert cache.get("k", build) == "stmt"
+
+    build.assert_called_once()
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_keys_are_independent():
+    cache = StatementCache()
+    cache.get("a", lambda: "a")
+    cache.get("b", lambda: "b")
+    assert cache.stats()["misses"] == 2
+
+
+def test_clear_resets_counters():
+    cache = StatementCache()
+    cache.get("k", lambda: "stmt")
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_counters_exact_under_concurrency():
+    # Bascule de thread très fréquente : un incrément hors verrou se perdrait
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        cache = StatementCache()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in pool.map(lambda _: cache.get("k", lambda: "stmt"), range(4000)):
+                pass
+    finally:
+        sys.setswitchinterval(previous)
+
+    assert cache.stats() == {"hits": 3999, "misses": 1, "size": 1}
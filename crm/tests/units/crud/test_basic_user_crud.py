@@ -4,6 +4,15 @@ from sqlalchemy.exc import IntegrityError
 from crm.crud.user_crud import UserCRUD
 
 
+@pytest.fixture(autouse=True)
+def no_entity_cache(monkeypatch):
+    """Session mockée : lecture directe, sans passer par le cache processus."""
+    from crm.crud import entity_cache
+
+    monkeypatch.setattr(entity_cache, "get_user", lambda s, i, load: load())
+    monkeypatch.setattr(entity_cache, "get_user_roles", lambda s, i, load: load())
+
+
 @pytest.fixture
 def crud():
     return UserCRUD(session=MagicMock())
@@ -54,11 +63,18 @@ def test_get_all_calls_get_entities(crud):
 
 
 def test_get_by_id(crud):
-    with patch("crm.crud.user_crud.User", autospec=True) as FakeUser:
-        crud.session.get.return_value = "user"
-        result = crud.get_by_id(1)
-        crud.session.get.assert_called_once_with(FakeUser, 1)
-        assert result == "user"
+    crud.session.execute.return_value.scalar_one_or_none.return_value = "user"
+    result = crud.get_by_id(1)
+    statement, params = crud.session.execute.call_args.args
+    assert params == {"user_id": 1}
+    assert result == "user"
+
+
+def test_get_by_id_reuses_statement(crud):
+    crud.get_by_id(1)
+    crud.get_by_id(2)
+    first, second = (c.args[0] for c in crud.session.execute.call_args_list)
+    assert first is second
 
 
 # ---------- UPDATE ----------
@@ -218,15 +234,13 @@ def test_get_user_roles(crud):
 
 
 def test_user_has_role_by_id_true(crud):
-    crud.session.query.return_value.filter_by.return_value.first.return_value = (
-        "user_role"
-    )
+    crud.session.execute.return_value.first.return_value = (1,)
     result = crud.user_has_role_by_id(1, 2)
     assert result is True
 
 
 def test_user_has_role_by_id_false(crud):
-    crud.session.query.return_value.filter_by.return_value.first.return_value = None
+    crud.session.execute.return_value.first.return_value = None
     result = crud.user_has_role_by_id(1, 2)
     assert result is False
 
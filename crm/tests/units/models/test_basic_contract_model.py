@@ -50,10 +50,10 @@ def test_sales_contact_name_no_user():
     assert contract.sales_contact_name == "Aucun contact"
 
 
-def test_sales_contact_id(fake_client):
-    contract = Contract()
-    contract.client = fake_client
-    assert contract.sales_contact_id == 1
+def test_sales_contact_id_is_indexed_column():
+    column = Contract.__table__.c.sales_contact_id
+    assert column.index is True
+    assert column.nullable is True
 
 
 def test_is_payed_true():
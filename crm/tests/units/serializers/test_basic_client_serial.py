@@ -35,6 +35,7 @@ class FakeClient:
                 FakeColumn("sales_contact_id"),
                 FakeColumn("created_at"),
                 FakeColumn("updated_at"),
+                FakeColumn("version_id"),
             ],
         )
         self.id = 1
@@ -45,6 +46,7 @@ class FakeClient:
         self.sales_contact_id = 42
         self.created_at = FakeDateTime("2023-01-01T00:00:00")
         self.updated_at = FakeDateTime("2023-01-02T00:00:00")
+        self.version_id = 1
 
         if with_contact:
             self.sales_contact = FakeSalesContact()
@@ -60,7 +62,7 @@ def fake_client():
 
 
 def test_serialize_basic(fake_client):
-    serializer = ClientSerializer()
+    serializer = ClientSerializer(strict=True)
     with patch.object(serializer.valid, "validate_email") as mock_email, patch.object(
         serializer.valid, "validate_phone"
     ) as mock_phone, patch.object(
@@ -109,3 +111,47 @@ def test_serialize_list(fake_client):
     assert isinstance(result, list)
     assert len(result) == 2  # None est sérialisé en {}
     assert result[0]["id"] == 1
+
+
+def test_serialize_skips_validation_by_default(fake_client):
+    serializer = ClientSerializer(strict=False)
+    fake_client.email = "pas-un-email"
+    with patch.object(serializer.valid, "validate_email") as mock_email:
+        result = serializer.serialize(fake_client)
+
+    assert result["email"] == "pas-un-email"
+    mock_email.assert_not_called()
+
+
+def test_strict_mode_rejects_invalid_data(fake_client):
+    fake_client.email = "pas-un-email"
+    with pytest.raises(ValueError):
+        ClientSerializer(strict=True).serialize(fake_client)
+
+
+def test_plan_compiled_once_per_model(fake_client):
+    serializer = ClientSerializer(fields=["id", "email", "sales_contact_name"])
+    result = serializer.serialize_list([fake_client, FakeClient(with_contact=False)])
+
+    assert list(serializer._plans) == [FakeClient]
+    assert [list(r) for r in result] == [["id", "email", "sales_contact_name"]] * 2
+    assert result[1]["sales_contact_name"] == "Aucun contact"
+    # Même modèle, mêmes champs : plan partagé entre instances
+    other = ClientSerializer(fields=["sales_contact_name", "email", "id"])
+    other.serialize(fake_client)
+    assert other._plans[FakeClient] is serializer._plans[FakeClient]
+
+
+def test_serialize_model_converts_only_dates():
+    from datetime import datetime
+    from crm.models.client import Client
+
+    created = datetime(2024, 5, 1, 12, 30)
+    client = Client(
+        id=7, full_name="Réel", email="reel@example.com", created_at=created
+    )
+    result = ClientSerializer(fields=["id", "full_name", "created_at"]).serialize(
+        client
+    )
+
+    assert result == {"id": 7, "full_name": "Réel", "created_at": created.isoformat()}
@@ -30,6 +30,7 @@ class FakeContract:
                 FakeColumn("is_signed"),
                 FakeColumn("created_at"),
                 FakeColumn("updated_at"),
+                FakeColumn("version_id"),
             ],
         )
         self.id = 1
@@ -39,6 +40,7 @@ class FakeContract:
         self.is_signed = True
         self.created_at = FakeDateTime("2023-01-01T00:00:00")
         self.updated_at = FakeDateTime("2023-01-02T00:00:00")
+        self.version_id = 1
         self.client_name = "Agence Est"
         self.sales_contact_name = "Alice" if with_contact else ""
 
@@ -49,7 +51,7 @@ def fake_contract():
 
 
 def test_serialize_basic(fake_contract):
-    serializer = ContractSerializer()
+    serializer = ContractSerializer(strict=True)
     with patch.object(serializer.valid, "validate_currency") as mock_curr:
         result = serializer.serialize(fake_contract)
 
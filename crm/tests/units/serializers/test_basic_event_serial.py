@@ -67,6 +67,7 @@ class FakeEvent:
                 FakeColumn("attendees"),
                 FakeColumn("created_at"),
                 FakeColumn("updated_at"),
+                FakeColumn("version_id"),
             ],
         )
         self.id = 1
@@ -78,6 +79,7 @@ class FakeEvent:
         self.attendees = "10"
         self.created_at = FakeDateTime("2023-01-01T00:00:00")
         self.updated_at = FakeDateTime("2023-01-02T00:00:00")
+        self.version_id = 1
 
         if with_relations:
             self.contract = FakeClient()
@@ -163,3 +165,15 @@ def test_event_note_serialize_list(fake_note):
     result = serializer.serialize_list([fake_note, None])  # type: ignore
     assert isinstance(result, list)
     assert result[0]["note"] == "Hello Note"
+
+
+def test_event_relationships_follow_fields():
+    assert EventSerializer().relationships == {
+        "contract.client",
+        "support_contact",
+        "notes",
+    }
+    assert EventSerializer(fields=["id", "client_contact"]).relationships == {
+        "contract.client"
+    }
+    assert EventSerializer(fields=["id", "location"]).relationships == set()
@@ -54,7 +54,7 @@ def fake_user():
 
 # -------- Tests serialize --------
 def test_serialize_basic(fake_user):
-    serializer = UserSerializer()
+    serializer = UserSerializer(strict=True)
     with patch.object(serializer.valid, "validate_email") as mock_email, patch.object(
         serializer.valid, "validate_int_max_length"
     ) as mock_int, patch.object(
@@ -0,0 +1,259 @@
+"""Export en flux (CSV / JSONL / Parquet) des clients, contrats et événements."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import Boolean, Integer, Numeric, select
+from sqlalchemy.orm import Session
+
+from ..crud.client_crud import ClientCRUD
+from ..crud.contract_crud import ContractCRUD
+from ..crud.event_crud import EventCRUD
+from ..models.client import Client
+from ..models.contract import Contract
+from ..models.event import Event
+from ..serializers.client_serializer import ClientSerializer
+from ..serializers.contract_serializer import ContractSerializer
+from ..serializers.event_serializer import EventSerializer
+
+# Dépendances facultatives
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    pa = pq = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    zstandard = None
+
+
+EXPORTABLE_ENTITIES = {
+    "clients": (Client, ClientCRUD, ClientSerializer),
+    "contracts": (Contract, ContractCRUD, ContractSerializer),
+    "events": (Event, EventCRUD, EventSerializer),
+}
+
+FORMATS = ("csv", "jsonl", "parquet")
+COMPRESSIONS = ("gzip", "zstd")
+_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+@dataclass
+class ExportReport:
+    rows: int = 0
+    path: Optional[Path] = None
+
+
+# ---------- Lecture en flux ----------
+def _ordered_fields(
+    model, serializer_cls, fields: Optional[Iterable[str]]
+) -> List[str]:
+    """Champs exportés, dans l'ordre des colonnes puis des champs calculés."""
+    allowed = [
+        c.name
+        for c in model.__table__.columns
+        if c.name in serializer_cls.PUBLIC_FIELDS
+    ]
+    allowed += list(serializer_cls.COMPUTED_FIELDS)
+    if fields is None:
+        return allowed
+
+    fields = set(fields)
+    unknown = fields - set(allowed)
+    if unknown:
+        raise ValueError(f"Champ(s) non exportable(s) : {', '.join(sorted(unknown))}")
+    return [f for f in allowed if f in fields]
+
+
+def _to_iso(value: Any) -> Any:
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def iter_batches(
+    session: Session,
+    entity: str,
+    fields: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    owner_id: Optional[int] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Produit les lignes sérialisées par lots, via un curseur serveur (yield_per).
+    `owner_id` restreint aux lignes de cet utilisateur (même filtre que les
+    listes, cf. Permission.owner_scope). Les objets chargés par chaque lot sont
+    détachés après lui : la mémoire reste constante, et les objets déjà
+    présents dans la session partagée (utilisateur courant...) sont conservés.
+    """
+    model, crud_cls, serializer_cls = EXPORTABLE_ENTITIES[entity]
+    crud = crud_cls(session)
+    columns = {c.name for c in model.__table__.columns}
+
+    # Chemin rapide : colonnes simples uniquement, pas d'objets ORM
+    if set(fields) <= columns:
+        stmt = select(*(getattr(model, f) for f in fields))
+        stmt = crud._scope(stmt, model, None, owner_id, None)
+        stmt = stmt.order_by(model.id).execution_options(yield_per=batch_size)
+        for partition in session.execute(stmt).partitions():
+            yield [
+                {f: _to_iso(v) for f, v in zip(fields, row)} for row in partition
+            ]
+        return
+
+    serializer = serializer_cls(fields=fields)
+    stmt = select(model).options(*crud._projection_options(model, fields))
+    stmt = crud._scope(stmt, model, None, owner_id, None)
+    stmt = stmt.order_by(model.id).execution_options(yield_per=batch_size)
+    kept = set(session.identity_map.keys())
+    for partition in session.scalars(stmt).partitions():
+        rows = [serializer.serialize(obj) for obj in partition]
+        # serialize() parcourt toutes les colonnes : on garde l'ordre demandé
+        yield [{f: row.get(f) for f in fields} for row in rows]
+        # Détache le lot et les relations qu'il a chargées (expunge_all
+        # invaliderait le curseur et détacherait les objets de l'appelant)
+        for key, obj in list(session.identity_map.items()):
+            if key not in kept:
+                session.expunge(obj)
+
+
+# ---------- Écriture ----------
+def _open_text(path: Path, compress: Optional[str]):
+    if compress == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    if compress == "zstd":
+        if zstandard is None:
+            raise ValueError("Compression zstd indisponible : installez 'zstandard'.")
+        raw = zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _csv_value(value: Any) -> Any:
+    return json.dumps(value, ensure_ascii=False) if isinstance(value, list) else value
+
+
+def _write_csv(batches, fields, path, compress) -> int:
+    count = 0
+    with _open_text(path, compress) as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for rows in batches:
+            writer.writerows({k: _csv_value(v) for k, v in row.items()} for row in rows)
+            count += len(rows)
+    return count
+
+
+def _write_jsonl(batches, fields, path, compress) -> int:
+    count = 0
+    with _open_text(path, compress) as f:
+        for rows in batches:
+            f.writelines(
+                json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows
+            )
+            count += len(rows)
+    return count
+
+
+def _arrow_schema(model, fields: List[str], first_rows: List[Dict[str, Any]]):
+    """Types Arrow : dérivés des colonnes SQL, inférés pour les champs calculés."""
+    inferred = pa.Table.from_pylist(first_rows).schema if first_rows else None
+    columns = model.__table__.columns
+    schema = []
+    for name in fields:
+        col = columns.get(name)
+        if col is not None and isinstance(col.type, Boolean):
+            arrow_type = pa.bool_()
+        elif col is not None and isinstance(col.type, Integer):
+            arrow_type = pa.int64()
+        elif col is not None and isinstance(col.type, Numeric):
+            arrow_type = pa.decimal128(col.type.precision or 12, col.type.scale or 2)
+        elif col is None and inferred is not None and name in inferred.names:
+            arrow_type = inferred.field(name).type
+            if pa.types.is_null(arrow_type):
+                arrow_type = pa.string()
+        else:
+            arrow_type = pa.string()
+        schema.append(pa.field(name, arrow_type))
+    return pa.schema(schema)
+
+
+def _write_parquet(batches, fields, path, compress, model) -> int:
+    if pa is None:
+        raise ValueError("Export Parquet indisponible : installez 'pyarrow'.")
+
+    count = 0
+    writer = None
+    try:
+        for rows in batches:
+            if writer is None:
+                schema = _arrow_schema(model, fields, rows)
+                writer = pq.ParquetWriter(
+                    str(path), schema, compression=compress or "snappy"
+                )
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            count += len(rows)
+        if writer is None:
+            # Table vide : on écrit quand même un fichier avec le schéma
+            pq.write_table(_arrow_schema(model, fields, []).empty_table(), str(path))
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+# ---------- Orchestration ----------
+def default_export_path(entity: str, fmt: str, compress: Optional[str]) -> Path:
+    suffix = f".{fmt}"
+    if compress and fmt != "parquet":
+        suffix += _SUFFIXES[compress]
+    return Path(f"{entity}{suffix}")
+
+
+def run_export(
+    session: Session,
+    entity: str,
+    *,
+    fmt: str = "csv",
+    path: Optional[Path] = None,
+    fields: Optional[Iterable[str]] = None,
+    compress: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    owner_id: Optional[int] = None,
+) -> ExportReport:
+    """
+    Exporte une entité en flux vers un fichier (CSV / JSONL / Parquet),
+    avec compression gzip ou zstd facultative.
+    Les champs disponibles sont ceux du sérialiseur de l'entité ; `owner_id`
+    limite l'export aux lignes de cet utilisateur.
+    """
+    if entity not in EXPORTABLE_ENTITIES:
+        raise ValueError(f"Entité non exportable : {entity}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Format non supporté : {fmt}")
+    if compress is not None and compress not in COMPRESSIONS:
+        raise ValueError(f"Compression non supportée : {compress}")
+    if fmt == "parquet" and pa is None:
+        raise ValueError("Export Parquet indisponible : installez 'pyarrow'.")
+
+    model, _, serializer_cls = EXPORTABLE_ENTITIES[entity]
+    fields = _ordered_fields(model, serializer_cls, fields)
+    path = path or default_export_path(entity, fmt, compress)
+    batches = iter_batches(session, entity, fields, batch_size, owner_id)
+
+    if fmt == "csv":
+        count = _write_csv(batches, fields, path, compress)
+    elif fmt == "jsonl":
+        count = _write_jsonl(batches, fields, path, compress)
+    else:
+        count = _write_parquet(batches, fields, path, compress, model)
+
+    return ExportReport(rows=count, path=path)
@@ -0,0 +1,420 @@
+"""Import en masse (CSV / JSONL) des clients, contrats et événements."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from ..crud.base_crud import BatchResult
+from ..crud.client_crud import ClientCRUD
+from ..crud.contract_crud import ContractCRUD
+from ..crud.event_crud import EventCRUD
+from ..models.client import Client
+from ..models.contract import Contract
+from ..models.event import Event
+from ..models.user import User
+from .validations import Validations
+
+IMPORTABLE_ENTITIES = ("clients", "contracts", "events")
+
+# (numéro d'enregistrement, ligne brute)
+Record = Tuple[int, Dict[str, Any]]
+
+
+@dataclass
+class ImportReport:
+    total: int = 0
+    imported: int = 0
+    rejected: int = 0
+    errors_path: Optional[Path] = None
+
+
+# ---------- Lecture en flux ----------
+def read_records(path: Path, fmt: Optional[str] = None) -> Iterator[Record]:
+    """Lit le fichier ligne à ligne (jamais chargé entièrement en mémoire)."""
+    fmt = fmt or ("jsonl" if path.suffix.lower() in {".jsonl", ".ndjson"} else "csv")
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            for number, raw in enumerate(csv.DictReader(f), start=1):
+                yield number, raw
+        elif fmt == "jsonl":
+            number = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                number += 1
+                try:
+                    yield number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield number, {"__invalid__": f"JSON invalide : {e}"}
+        else:
+            raise ValueError(f"Format non supporté : {fmt}")
+
+
+def chunked(records: Iterator[Record], size: int) -> Iterator[List[Record]]:
+    chunk: List[Record] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ---------- Validation (exécutée dans les workers) ----------
+def _required(raw: Dict[str, Any], key: str) -> str:
+    value = raw.get(key)
+    if value is None or str(value).strip() == "":
+        raise ValueError(f"Champ requis manquant : {key}")
+    return str(value).strip()
+
+
+def _optional(raw: Dict[str, Any], key: str) -> Optional[str]:
+    value = raw.get(key)
+    if value is None or str(value).strip() == "":
+        return None
+    return str(value).strip()
+
+
+def _to_int(value: str, key: str) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} doit être un entier.")
+
+
+def _to_amount(value: str, key: str) -> Decimal:
+    Validations.validate_currency(value)
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"{key} invalide : {value}")
+    if amount < 0:
+        raise ValueError(f"{key} ne peut pas être négatif.")
+    return amount
+
+
+def _to_bool(value: Optional[str]) -> bool:
+    if value is None:
+        return False
+    return str(value).strip().lower() in {"1", "true", "vrai", "oui", "o", "yes", "y"}
+
+
+def _to_datetime(value: str, key: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{key} doit être une date ISO 8601.")
+
+
+def _clean_client(raw: Dict[str, Any]) -> Dict[str, Any]:
+    full_name = _required(raw, "full_name")
+    Validations.validate_str_max_length(full_name)
+    email = _required(raw, "email")
+    Validations.validate_email(email)
+    phone = _required(raw, "phone")
+    Validations.validate_phone(phone)
+    company_name = _optional(raw, "company_name") or ""
+    Validations.validate_str_max_length(company_name, max_length=200)
+
+    row = {
+        "full_name": full_name,
+        "email": email,
+        "phone": phone,
+        "company_name": company_name,
+        "sales_contact_id": None,
+        "sales_contact": _optional(raw, "sales_contact"),
+    }
+    if (sales_id := _optional(raw, "sales_contact_id")) is not None:
+        row["sales_contact_id"] = _to_int(sales_id, "sales_contact_id")
+    return row
+
+
+def _clean_contract(raw: Dict[str, Any]) -> Dict[str, Any]:
+    amount_total = _to_amount(_required(raw, "amount_total"), "amount_total")
+    amount_due = _to_amount(_required(raw, "amount_due"), "amount_due")
+    if amount_total <= 0:
+        raise ValueError("amount_total doit être supérieur à zéro.")
+    if amount_due > amount_total:
+        raise ValueError("amount_due ne peut pas dépasser amount_total.")
+
+    row = {
+        "client_id": None,
+        "client_email": _optional(raw, "client_email"),
+        "amount_total": amount_total,
+        "amount_due": amount_due,
+        "is_signed": _to_bool(_optional(raw, "is_signed")),
+    }
+    if (client_id := _optional(raw, "client_id")) is not None:
+        row["client_id"] = _to_int(client_id, "client_id")
+    elif row["client_email"] is None:
+        raise ValueError("client_id ou client_email requis.")
+    return row
+
+
+def _clean_event(raw: Dict[str, Any]) -> Dict[str, Any]:
+    contract_id = _to_int(_required(raw, "contract_id"), "contract_id")
+    date_start = _to_datetime(_required(raw, "date_start"), "date_start")
+    date_end = _to_datetime(_required(raw, "date_end"), "date_end")
+    Validations.validate_date_order(date_start, date_end)
+    attendees = _to_int(_required(raw, "attendees"), "attendees")
+    Validations.validate_positive_integer(attendees)
+    location = _optional(raw, "location") or ""
+    Validations.validate_str_max_length(location, max_length=300)
+
+    row = {
+        "contract_id": contract_id,
+        "support_contact_id": None,
+        "support_contact": _optional(raw, "support_contact"),
+        "date_start": date_start,
+        "date_end": date_end,
+        "location": location,
+        "attendees": attendees,
+    }
+    if (support_id := _optional(raw, "support_contact_id")) is not None:
+        row["support_contact_id"] = _to_int(support_id, "support_contact_id")
+    return row
+
+
+CLEANERS = {
+    "clients": _clean_client,
+    "contracts": _clean_contract,
+    "events": _clean_event,
+}
+
+
+def validate_chunk(
+    entity: str, records: List[Record]
+) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Tuple[int, Dict[str, Any], str]]]:
+    """Valide un lot (fonction top-level : exécutable dans un process worker)."""
+    cleaner = CLEANERS[entity]
+    valid, rejected = [], []
+    for number, raw in records:
+        try:
+            if "__invalid__" in raw:
+                raise ValueError(raw["__invalid__"])
+            valid.append((number, cleaner(raw)))
+        except Exception as e:
+            rejected.append((number, raw, str(e)))
+    return valid, rejected
+
+
+# ---------- Résolution des clés étrangères ----------
+class ForeignKeyResolver:
+    """Tables de correspondance construites une seule fois par import."""
+
+    def __init__(self, session: Session, entity: str):
+        self.entity = entity
+        self.users: Dict[str, int] = {}
+        self.user_ids: set = set()
+        self.clients: Dict[str, int] = {}
+        self.client_owners: Dict[int, Optional[int]] = {}
+        self.contract_ids: set = set()
+
+        if entity in ("clients", "events"):
+            for username, user_id in session.execute(select(User.username, User.id)):
+                self.users[username] = user_id
+                self.user_ids.add(user_id)
+        if entity == "contracts":
+            for email, client_id, owner_id in session.execute(
+                select(Client.email, Client.id, Client.sales_contact_id)
+            ):
+                self.clients[email] = client_id
+                self.client_owners[client_id] = owner_id
+        if entity == "events":
+            self.contract_ids = set(session.scalars(select(Contract.id)))
+
+    def _user(self, row: Dict[str, Any], name_key: str, id_key: str) -> None:
+        username = row.pop(name_key)
+        if row[id_key] is not None:
+            if row[id_key] not in self.user_ids:
+                raise ValueError(f"Utilisateur introuvable : id={row[id_key]}")
+        elif username is not None:
+            if username not in self.users:
+                raise ValueError(f"Utilisateur introuvable : {username}")
+            row[id_key] = self.users[username]
+
+    def resolve(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        if self.entity == "clients":
+            self._user(row, "sales_contact", "sales_contact_id")
+        elif self.entity == "contracts":
+            email = row.pop("client_email")
+            if row["client_id"] is not None:
+                if row["client_id"] not in self.client_owners:
+                    raise ValueError(f"Client introuvable : id={row['client_id']}")
+            else:
+                if email not in self.clients:
+                    raise ValueError(f"Client introuvable : {email}")
+                row["client_id"] = self.clients[email]
+            # Colonne dénormalisée : le COPY ne passe pas par les événements ORM
+            row["sales_contact_id"] = self.client_owners[row["client_id"]]
+        elif self.entity == "events":
+            if row["contract_id"] not in self.contract_ids:
+                raise ValueError(f"Contrat introuvable : id={row['contract_id']}")
+            self._user(row, "support_contact", "support_contact_id")
+        return row
+
+
+# ---------- Chargement ----------
+# Marqueur NULL du COPY (option NULL) : jamais quoté, contrairement aux valeurs
+COPY_NULL = "\\N"
+
+LOADERS = {
+    "clients": (Client, lambda s: ClientCRUD(s).create_many),
+    "contracts": (Contract, lambda s: ContractCRUD(s).create_many),
+    "events": (Event, lambda s: EventCRUD(s).create_many),
+}
+
+
+def _copy_field(value: Any) -> str:
+    """
+    Champ CSV pour COPY : None -> `\\N` non quoté (NULL), tout le reste est quoté.
+    Une valeur quotée n'est jamais lue comme NULL, même "" ou "\\N".
+    """
+    if value is None:
+        return COPY_NULL
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_payload(rows: List[Dict[str, Any]], now: datetime) -> Tuple[List[str], str]:
+    """Colonnes et contenu CSV du COPY, horodatages inclus."""
+    columns = list(rows[0].keys()) + ["created_at", "updated_at"]
+    lines = (
+        ",".join(_copy_field(value) for value in [*row.values(), now, now])
+        for row in rows
+    )
+    return columns, "".join(line + "\n" for line in lines)
+
+
+def _copy_rows(session: Session, model, rows: List[Dict[str, Any]]) -> None:
+    """COPY ... FROM STDIN (PostgreSQL) : le chemin le plus rapide pour un lot valide."""
+    columns, payload = _copy_payload(rows, datetime.now(timezone.utc))
+
+    dbapi_conn = session.connection().connection
+    with dbapi_conn.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({', '.join(columns)}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            io.StringIO(payload),
+        )
+    session.commit()
+
+
+def load_rows(session: Session, entity: str, rows: List[Dict[str, Any]]) -> BatchResult:
+    """
+    COPY sur PostgreSQL, INSERT multi-lignes ailleurs (ou si le COPY échoue).
+    Le COPY ne renvoie pas les ids : `ids` est alors vide et `written` porte le
+    nombre de lignes chargées.
+    """
+    model, loader = LOADERS[entity]
+    if session.get_bind().dialect.name == "postgresql":
+        try:
+            _copy_rows(session, model, rows)
+            return BatchResult(written=len(rows))
+        except DBAPIError:
+            # Une ligne viole une contrainte : repli ligne par ligne via create_many
+            session.rollback()
+    return loader(session)(rows)
+
+
+# ---------- Orchestration ----------
+def run_import(
+    session: Session,
+    entity: str,
+    path: Path,
+    *,
+    fmt: Optional[str] = None,
+    chunk_size: int = 5000,
+    workers: Optional[int] = None,
+    errors_path: Optional[Path] = None,
+) -> ImportReport:
+    """
+    Importe un fichier en flux : lecture par lots bornés, validation dans un pool
+    de processus, résolution des FK en mémoire, chargement groupé.
+    Les lignes rejetées sont écrites (avec la raison) dans `errors_path` (JSONL).
+    """
+    if entity not in IMPORTABLE_ENTITIES:
+        raise ValueError(f"Entité non importable : {entity}")
+
+    errors_path = errors_path or path.with_name(path.name + ".errors.jsonl")
+    report = ImportReport(errors_path=errors_path)
+    resolver = ForeignKeyResolver(session, entity)
+
+    executor: Optional[Executor] = (
+        ProcessPoolExecutor(max_workers=workers) if workers and workers > 1 else None
+    )
+    # Fenêtre bornée de lots en vol : la mémoire ne dépend pas de la taille du fichier
+    in_flight: deque = deque()
+    max_in_flight = (workers or 1) * 2
+
+    def submit(chunk: List[Record]) -> Any:
+        if executor is None:
+            return validate_chunk(entity, chunk)
+        return executor.submit(validate_chunk, entity, chunk)
+
+    def drain_one(errors_file) -> None:
+        pending = in_flight.popleft()
+        records_by_number, outcome = pending
+        valid, rejected = outcome.result() if isinstance(outcome, Future) else outcome
+        _process(valid, rejected, records_by_number, errors_file)
+
+    def _process(valid, rejected, records_by_number, errors_file) -> None:
+        for number, raw, reason in rejected:
+            _write_error(errors_file, number, raw, reason)
+
+        numbers, rows = [], []
+        for number, row in valid:
+            try:
+                rows.append(resolver.resolve(row))
+                numbers.append(number)
+            except ValueError as e:
+                _write_error(errors_file, number, records_by_number[number], str(e))
+
+        if rows:
+            result = load_rows(session, entity, rows)
+            report.imported += result.ok
+            for index, reason in sorted(result.errors.items()):
+                number = numbers[index]
+                _write_error(errors_file, number, records_by_number[number], reason)
+
+    def _write_error(errors_file, number, raw, reason) -> None:
+        report.rejected += 1
+        errors_file.write(
+            json.dumps(
+                {"record": number, "reason": reason, "row": raw},
+                ensure_ascii=False,
+                default=str,
+            )
+            + "\n"
+        )
+
+    try:
+        with open(errors_path, "w", encoding="utf-8") as errors_file:
+            for chunk in chunked(read_records(path, fmt), chunk_size):
+                report.total += len(chunk)
+                in_flight.append((dict(chunk), submit(chunk)))
+                if len(in_flight) >= max_in_flight:
+                    drain_one(errors_file)
+            while in_flight:
+                drain_one(errors_file)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if report.rejected == 0:
+        errors_path.unlink(missing_ok=True)
+        report.errors_path = None
+    return report
@@ -7,12 +7,12 @@ from datetime import datetime
 from typing import Any, Dict, Optional, Literal
 
 from dotenv import load_dotenv
-import sentry_sdk
-from sentry_sdk import add_breadcrumb, capture_exception, capture_message
-from sentry_sdk.integrations.logging import LoggingIntegration
 
 load_dotenv()
 
+# sentry_sdk n'est importé que par init_sentry (SENTRY_DSN présent) : sans
+# Sentry actif, le démarrage ne le charge pas et l'audit se limite au logger
+
 
 # Logger audit
 
@@ -61,6 +61,9 @@ def init_sentry():
         logger.warning("Sentry désactivé (SENTRY_DSN manquant).")
         return
 
+    import sentry_sdk
+    from sentry_sdk.integrations.logging import LoggingIntegration
+
     sentry_logging = LoggingIntegration(
         level=logging.INFO,  # tout >= INFO devient breadcrumb
         event_level=logging.ERROR,  # ERROR/CRITICAL => issue Sentry
@@ -95,10 +98,13 @@ def install_global_exception_hook():
 
     def _global_exception_hook(exc_type, exc, tb):
         # Sentry (si init) + log local
-        try:
-            capture_exception(exc)
-        except Exception:
-            pass
+        if _sentry_initialized:
+            try:
+                import sentry_sdk
+
+                sentry_sdk.capture_exception(exc)
+            except Exception:
+                pass
         logger.critical("Unhandled exception", exc_info=(exc_type, exc, tb))
 
     sys.excepthook = _global_exception_hook
@@ -114,7 +120,11 @@ def audit_breadcrumb(
     data: Optional[Dict[str, Any]] = None,
 ):
     """Ajoute un breadcrumb structuré visible dans Sentry (timeline)."""
-    add_breadcrumb(
+    if not _sentry_initialized:
+        return
+    import sentry_sdk
+
+    sentry_sdk.add_breadcrumb(
         category=category,
         message=message,
         level="info",
@@ -134,5 +144,9 @@ def audit_event(
     - level="info"/"warning" : événements visibles (pas forcément un issue)
     - level="error"/"critical"/"fatal" : crée un issue Sentry
     """
+    if not _sentry_initialized:
+        return
+    import sentry_sdk
+
     sentry_sdk.set_context("audit", data or {})
-    capture_message(message, level=level)
+    sentry_sdk.capture_message(message, level=level)
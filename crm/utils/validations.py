@@ -36,6 +36,10 @@ class Validations:
 
     @staticmethod
     def confirm_action(prompt: str) -> bool:
+        # Import local : Validations sert aussi hors de toute base (CLI, modèles)
+        from ..database import release_for_input
+
+        release_for_input()
         response = input(f"{prompt} (o/n) : ").strip().lower()
         if response == "o":
             return True
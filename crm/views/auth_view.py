@@ -2,7 +2,6 @@ import click
 from rich.console import Console
 
 from ..auth.auth import Authentication
-from ..database import SessionLocal
 from crm.auth.config import TOKEN_PATH
 
 
@@ -1,6 +1,5 @@
 from ..views.view import BaseView
 from ..utils.app_state import AppState
-from ..database import SessionLocal
 from ..errors.exceptions import UserCancelledInput
 from typing import Any, Dict, List, Optional
 from ..utils.validations import Validations
@@ -31,16 +30,15 @@ class ClientView(BaseView):
                 ),
             )
 
-            with SessionLocal() as session:
-                self.console.print("[dim]Création du client...[/dim]")
+            self.console.print("[dim]Création du client...[/dim]")
 
-                payload: dict = {
-                    "full_name": full_name,
-                    "email": email,
-                    "phone": phone,
-                    "company_name": company_name,
-                    "sales_contact_id": sales_contact_id,
-                }
+            payload: dict = {
+                "full_name": full_name,
+                "email": email,
+                "phone": phone,
+                "company_name": company_name,
+                "sales_contact_id": sales_contact_id,
+            }
 
             return payload
 
@@ -1,6 +1,5 @@
 from ..views.view import BaseView
 from ..utils.app_state import AppState
-from ..database import SessionLocal
 from ..errors.exceptions import UserCancelledInput
 from typing import Any, Dict, List, Optional
 from ..utils.validations import Validations
@@ -28,15 +27,14 @@ class ContractView(BaseView):
             )
             is_signed = Validations.confirm_action("Contrat signé ?")
 
-            with SessionLocal() as session:
-                self.console.print("[dim]Création du contrat...[/dim]")
+            self.console.print("[dim]Création du contrat...[/dim]")
 
-                payload: dict = {
-                    "client_id": client_id,
-                    "amount_total": Decimal(amount_total),
-                    "amount_due": Decimal(amount_due),
-                    "is_signed": is_signed,
-                }
+            payload: dict = {
+                "client_id": client_id,
+                "amount_total": Decimal(amount_total),
+                "amount_due": Decimal(amount_due),
+                "is_signed": is_signed,
+            }
 
             return payload
 
@@ -106,13 +104,12 @@ class ContractView(BaseView):
                 transform=Decimal,
             )
 
-            with SessionLocal() as session:
-                self.console.print("[dim]Mise à jour du contrat...[/dim]")
+            self.console.print("[dim]Mise à jour du contrat...[/dim]")
 
-                payload: dict = {
-                    "amount_total": Decimal(amount_total),
-                    "amount_due": Decimal(amount_due),
-                }
+            payload: dict = {
+                "amount_total": Decimal(amount_total),
+                "amount_due": Decimal(amount_due),
+            }
 
             return contract_id, payload
 
@@ -1,6 +1,5 @@
 from ..views.view import BaseView
 from ..utils.app_state import AppState
-from ..database import SessionLocal
 from ..errors.exceptions import UserCancelledInput
 from typing import Any, Dict
 from ..utils.validations import Validations
@@ -35,16 +34,15 @@ class EventView(BaseView):
             Validations.validate_future_datetime(event_end_date)
             Validations.validate_date_order(event_start_date, event_end_date)
 
-            with SessionLocal() as session:
-                self.console.print("[dim]Création de l'événement...[/dim]")
+            self.console.print("[dim]Création de l'événement...[/dim]")
 
-                payload: dict = {
-                    "contract_id": contract_id,
-                    "date_start": event_start_date,
-                    "date_end": event_end_date,
-                    "location": event_location,
-                    "attendees": event_attendees,
-                }
+            payload: dict = {
+                "contract_id": contract_id,
+                "date_start": event_start_date,
+                "date_end": event_end_date,
+                "location": event_location,
+                "attendees": event_attendees,
+            }
 
             return payload
 
@@ -1,6 +1,8 @@
 import click
+from ..database import release_for_input
 from ..views.view import BaseView
 from ..utils.app_state import AppState
+from decimal import Decimal
 from typing import Any, Dict, List, Optional
 from ..views.client_view import ClientView
 from ..views.contract_view import ContractView
@@ -53,6 +55,7 @@ class FilterView(BaseView):
                 "[yellow]Aucun filtre disponible pour cette entité.[/yellow]"
             )
             self.console.print("\n[dim]Appuyez sur Entrée pour revenir...[/dim]")
+            release_for_input()
             self.console.input()
             return None
 
@@ -82,10 +85,32 @@ class FilterView(BaseView):
 
         if field_dict["type"] == "str":
             input = self.get_valid_input(
-                f"Entrez la valeur du filtre {field_dict['name']}"
+                f"Entrez le début de la valeur du filtre {field_dict['name']}"
             )
-            return {field_dict["field"]: input}
+            if input is None:
+                return None
+            return {field_dict["field"]: {"prefix": input}}
 
         if field_dict["type"] == "bool":
             input = self.true_or_false(f"{field_dict['name']} ?")
             return {field_dict["field"]: input}
+
+        if field_dict["type"] == "amount":
+            bounds = {}
+            for op, label in (("gte", "minimum"), ("lte", "maximum")):
+                value = self.get_valid_input(
+                    f"{field_dict['name']} {label} (vide = sans limite)",
+                    default="",
+                    show_default=False,
+                    transform=lambda s: Decimal(s) if s else None,
+                )
+                if value is not None:
+                    bounds[op] = value
+            if not bounds:
+                return None
+            return {field_dict["field"]: bounds}
+
+        if field_dict["type"] == "date":
+            start = self.get_date_input(f"{field_dict['name']} : à partir du")
+            end = self.get_date_input(f"{field_dict['name']} : jusqu'au")
+            return {field_dict["field"]: {"gte": start, "lte": end}}
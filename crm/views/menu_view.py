@@ -1,5 +1,6 @@
 import click
 from .view import BaseView
+from ..database import release_for_input
 from ..utils.app_state import AppState
 
 
@@ -31,6 +32,7 @@ class MenuView(BaseView):
 
             self.app_state.display_error_or_success_message()
 
+            release_for_input()
             raw = click.prompt("\nChoix", type=str).strip().upper()
 
             if raw in {"0", "R"} or raw.isdigit():
@@ -1,5 +1,5 @@
-from ..database import SessionLocal
 from ..controllers.role_controller import RoleController
+from ..database import release_for_input
 from ..views.view import BaseView
 from getpass import getpass
 from ..errors.exceptions import UserCancelledInput
@@ -96,6 +96,7 @@ class UserView(BaseView):
 
             try:
                 AppState.display_error_or_success_message()
+                release_for_input()
                 pwd = getpass(prompt).strip()
 
                 # Quit intention
@@ -159,21 +160,20 @@ class UserView(BaseView):
             )
             password = self.get_valid_password("Mot de passe : ")
 
-            with SessionLocal() as session:
-                roles = RoleController(session=session)
+            roles = RoleController(session=self.session)
 
-                chosen_role_id = self._choose_role(roles.list_roles())
+            chosen_role_id = self._choose_role(roles.list_roles())
 
-                self.console.print("[dim]Création de l'utilisateur...[/dim]")
+            self.console.print("[dim]Création de l'utilisateur...[/dim]")
 
-                payload: dict = {
-                    "username": username,
-                    "email": email,
-                    "employee_number": employee_number,
-                    "password": password,
-                }
+            payload: dict = {
+                "username": username,
+                "email": email,
+                "employee_number": employee_number,
+                "password": password,
+            }
 
-                return payload, chosen_role_id
+            return payload, chosen_role_id
 
         except Exception as e:
             if isinstance(e, UserCancelledInput):
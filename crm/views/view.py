@@ -16,7 +16,7 @@ from typing import (
     Tuple,
 )
 from sqlalchemy.orm import Session
-from ..database import SessionLocal
+from ..database import close_session, get_session, release_for_input
 from rich.table import Table
 from rich.console import Console
 from ..errors.exceptions import UserCancelledInput
@@ -37,7 +37,7 @@ class BaseView(ABC):
     def __init__(
         self, *, session: Optional[Session] = None, console: Optional[Console] = None
     ):
-        self.session = session or SessionLocal()
+        self.session = session or get_session()
         self._owns_session = session is None
         self._setup_services()
         self.console = console or Console()
@@ -90,6 +90,7 @@ class BaseView(ABC):
         self.console.print(table)
 
     def true_or_false(self, prompt: str) -> bool:
+        release_for_input()
         response = input(f"{prompt} (o/n) : ").strip().lower()
         if response == "o":
             return True
@@ -100,6 +101,14 @@ class BaseView(ABC):
         else:
             raise ValueError("Réponse invalide. Veuillez répondre par 'o' ou 'n'.")
 
+    def reload_and_retry(self, error: Exception) -> bool:
+        """Conflit de modification : propose de recharger l'enregistrement et de recommencer."""
+        self.console.print(f"[yellow]{error}[/yellow]")
+        try:
+            return Validations.confirm_action("Recharger les données et réessayer ?")
+        except ValueError:
+            return False
+
     # ---------- Input ----------
     # Cette grosse methode permet de recuperer une entree utilisateur valide
     # Pas mal de paramètre pour gérer les différentes situations
@@ -135,7 +144,8 @@ class BaseView(ABC):
                 raise ValueError("Essais max atteints, retour au menu.")
             AppState.display_error_or_success_message()
             try:
-
+                # Aucune transaction ouverte pendant la saisie
+                release_for_input()
                 raw = click.prompt(prompt, default=default, show_default=show_default)
                 raw_str = str(raw).strip()
 
@@ -201,6 +211,7 @@ class BaseView(ABC):
     def ask_choice(self, prompt: str = "\nChoix", *, allow_quit: bool = True) -> int:
         while True:
             try:
+                release_for_input()
                 value = click.prompt(prompt, type=int)
                 if not allow_quit and value == 0:
                     self.console.print("[red]0 est réservé à 'Quitter'.[/red]")
@@ -214,7 +225,7 @@ class BaseView(ABC):
 
     def handle_quit(self, *, farewell: str = "[bold cyan]\nA bientôt !\n[bold cyan]"):
         self.console.print(farewell)
-        self.session.close()
+        close_session()
         sys.exit(0)
 
     # ---------- Date Input --------
@@ -361,6 +372,7 @@ class BaseView(ABC):
 
         self.console.print("\n[dim]Appuyez sur Entrée pour revenir au menu...[/dim]")
         AppState.display_error_or_success_message()
+        release_for_input()
         self.console.input()
         return None
 
@@ -1,47 +1,148 @@
+"""
+Point d'entrée du CRM.
+
+Démarrage minimal : seul click est importé ici. Chaque sous-commande est
+chargée quand elle est invoquée (l'aide n'en lit que le résumé), Sentry est
+initialisé au lancement d'une commande, et le moteur de base de données au
+premier accès (crm.database.get_engine).
+"""
+
+import importlib
+import sys
+from typing import Dict, List, Optional, Tuple
+
 import click
-from rich.console import Console
-from crm.views.auth_view import AuthView
-from crm.utils.app_state import AppState
-from crm.cli.db_commands import init_db, reset_hard
-from crm.cli.auth_commands import login_cmd, logout_cmd
-from crm.controllers.main_controller import MainController
-from crm.utils.sentry_config import (
-    init_sentry,
-    install_global_exception_hook,
-)
+from click.utils import make_default_short_help
+
+# nom -> (module, attribut, résumé de la docstring affiché par --help)
+LAZY_COMMANDS: Dict[str, Tuple[str, str, str]] = {
+    # Commandes DB
+    "init": ("crm.cli.db_commands", "init_db", "Initialise la base de données."),
+    "reset-hard": (
+        "crm.cli.db_commands",
+        "reset_hard",
+        "Détruit puis recrée le schéma et les données initiales (admin uniquement).",
+    ),
+    "migrate": (
+        "crm.cli.db_commands",
+        "migrate_db",
+        "Applique les migrations de schéma en attente.",
+    ),
+    "import": (
+        "crm.cli.db_commands",
+        "import_data",
+        "Importe en masse des clients, contrats ou événements (CSV / JSONL).",
+    ),
+    "export": (
+        "crm.cli.db_commands",
+        "export_data",
+        "Exporte en flux des clients, contrats ou événements"
+        " (CSV / JSONL / Parquet).",
+    ),
+    # Commandes d'auth
+    "login": (
+        "crm.cli.auth_commands",
+        "login_cmd",
+        "Demande les identifiants, appelle Authentication.authenticate_user,"
+        " sauvegarde access+refresh en JSON.",
+    ),
+    "logout": (
+        "crm.cli.auth_commands",
+        "logout_cmd",
+        "Déconnexion locale : supprime le fichier de tokens.",
+    ),
+    "calibrate": (
+        "crm.cli.auth_commands",
+        "calibrate_cmd",
+        "Mesure argon2 sur cette machine et propose les paramètres ARGON2_*"
+        " dont le hachage tient dans la durée visée (à reporter dans le .env).",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """Groupe dont les sous-commandes sont importées à la première invocation."""
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, Tuple[str, str, str]] = dict(
+            lazy_commands or {}
+        )
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module, attr, _ = self.lazy_commands[cmd_name]
+            self.add_command(
+                getattr(importlib.import_module(module), attr), cmd_name
+            )
+        return super().get_command(ctx, cmd_name)
 
-init_sentry()
-install_global_exception_hook()
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # Comme click.Group.format_commands, sans importer les sous-commandes
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                if self.commands[name].hidden:
+                    continue
+                summary = self.commands[name].get_short_help_str(limit)
+            else:
+                summary = make_default_short_help(self.lazy_commands[name][2], limit)
+            rows.append((name, summary))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
 
 
-@click.group(invoke_without_command=True)
+def _close_session() -> None:
+    # Aucune session n'a pu être ouverte si crm.database n'a pas été chargé
+    database = sys.modules.get("crm.database")
+    if database is not None:
+        database.close_session()
+
+
+@click.group(
+    cls=LazyGroup, lazy_commands=LAZY_COMMANDS, invoke_without_command=True
+)
 @click.pass_context
 def cli(ctx: click.Context):
     """
     CRM CLI — point d'entrée.
-    - Commandes techniques : init, reset-hard, login, logout
+    - Commandes techniques : init, reset-hard, login, logout, calibrate
     - Sinon : lance l'application via MainController
     """
+    from crm.utils.sentry_config import init_sentry, install_global_exception_hook
+
+    init_sentry()
+    install_global_exception_hook()
+
     # Contexte partagé (console + état global)
     ctx.ensure_object(dict)
-    if "console" not in ctx.obj:
-        ctx.obj["console"] = Console()
-    if "app_state" not in ctx.obj:
-        ctx.obj["app_state"] = AppState
+    # Session partagée fermée à la sortie, y compris via sys.exit
+    ctx.call_on_close(_close_session)
 
     # Si aucune commande CLI -> on lance l'application
     if ctx.invoked_subcommand is None:
-        app = MainController()
-        app.run()
-
+        from rich.console import Console
 
-# Commandes DB
-cli.add_command(init_db)
-cli.add_command(reset_hard)
+        from crm.controllers.main_controller import MainController
+        from crm.utils.app_state import AppState
 
-# Commandes d'auth
-cli.add_command(login_cmd)
-cli.add_command(logout_cmd)
+        if "console" not in ctx.obj:
+            ctx.obj["console"] = Console()
+        if "app_state" not in ctx.obj:
+            ctx.obj["app_state"] = AppState
+        app = MainController()
+        app.run()
 
 
 if __name__ == "__main__":